@@ -0,0 +1,212 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+"""Microbenchmark of the query parser.
+
+Compares the tokenizing parser (`armet.query.parser`) against the
+character-by-character parser it replaced, bypassing the parse cache.
+
+    $ python benchmarks/query_parser.py
+"""
+from __future__ import absolute_import, unicode_literals, division
+from __future__ import print_function
+import timeit
+from six.moves import cStringIO as StringIO
+from itertools import chain
+from armet.query import constants
+from armet.query.parser import (
+    Query, QuerySegment, COMBINATORS, OPERATOR_SYMBOL_MAP, OPERATOR_KEYWORDS,
+    _parse as parse)
+
+
+#! Set of characters that begin an operator.
+OPERATOR_BEGIN_CHARS = set(x[0] for _, x in constants.OPERATORS if x)
+OPERATOR_BEGIN_CHARS.add(constants.NEGATION[1])
+
+#! Query strings to parse; from a single filter to a long filter string.
+QUERIES = (
+    'name=bob',
+    'user.name.iexact=bob&created.gte=2013-01-01;!status=draft,deleted',
+    '&'.join('field{0}.related.not=value{0},other{0}'.format(x)
+             for x in range(25)),
+)
+
+
+def legacy_parse(text):
+    """The character-by-character parser that preceded the tokenizer."""
+    # Initialize the query object.
+    query = Query()
+
+    # Iterate through the characters in the query string; one-by-one
+    # in order to perform one-pass parsing.
+    stream = StringIO()
+
+    for character in text:
+
+        # We want to stop reading the query and pass it off to someone
+        # when we reach a logical or grouping operator.
+        if character in (constants.LOGICAL_AND, constants.LOGICAL_OR):
+
+            if not stream.tell():
+                # There is no content in the stream; a logical operator
+                # was found out of place.
+                raise ValueError('Found `{}` out of place'.format(
+                    character))
+
+            # Parse the segment up till the combinator
+            segment = legacy_parse_segment(stream.getvalue(), character)
+            query.segments.append(segment)
+            stream.truncate(0)
+            stream.seek(0)
+
+        else:
+            # This isn't a special character, just roll with it.
+            stream.write(character)
+
+    # TODO: Throw some nonsense here if the query string ended with a
+    # & or ;, because that makes no sense.
+
+    if stream.tell():
+        # Append the remainder of the query string.
+        query.segments.append(legacy_parse_segment(stream.getvalue()))
+
+    # Return the constructed query object.
+    return query
+
+
+def _legacy_parse_operator(segment, iterator):
+    """Parses the operator (eg. '==' or '<')."""
+    stream = StringIO()
+    for character in iterator:
+        if character == constants.NEGATION[1]:
+            if stream.tell():
+                # Negation can only occur at the start of an operator.
+                raise ValueError('Unexpected negation.')
+
+            # We've been negated.
+            segment.negated = not segment.negated
+            continue
+
+        if (stream.getvalue() + character not in OPERATOR_SYMBOL_MAP and
+                stream.getvalue() + character not in OPERATOR_BEGIN_CHARS):
+            # We're no longer an operator.
+            break
+
+        # Expand the operator
+        stream.write(character)
+
+    # Check for existance.
+    text = stream.getvalue()
+    if text not in OPERATOR_SYMBOL_MAP:
+        # Doesn't exist because of a mis-placed negation in the middle
+        # of the path.
+        raise ValueError('Unexpected negation.')
+
+    # Set the found operator.
+    segment.operator = OPERATOR_SYMBOL_MAP[text]
+
+    # Return the remaining characters.
+    return chain(character, iterator)
+
+
+def legacy_parse_segment(text, combinator=constants.LOGICAL_AND):
+    # Initialize a query segment.
+    segment = QuerySegment()
+
+    # Construct an iterator over the segment text.
+    iterator = iter(text)
+    stream = StringIO()
+
+    # Iterate through the characters in the segment; one-by-one
+    # in order to perform one-pass parsing.
+    for character in iterator:
+
+        if (character == constants.NEGATION[1]
+                and not stream.tell() and not segment.path):
+            # We've been negated.
+            segment.negated = not segment.negated
+            continue
+
+        if character in OPERATOR_BEGIN_CHARS:
+            # Found an operator; pull out what we can.
+            iterator = _legacy_parse_operator(
+                segment, chain(character, iterator))
+
+            # We're done here; go to the value parser
+            break
+
+        if character == constants.SEP_PATH:
+            # A path separator, push the current stack into the path
+            segment.path.append(stream.getvalue())
+            stream.truncate(0)
+            stream.seek(0)
+
+            # Keep checking for more path segments.
+            continue
+
+        # Append the text to the stream
+        stream.write(character)
+
+    # Write any remaining information into the path.
+    segment.path.append(stream.getvalue())
+
+    # Attempt to normalize the path.
+    try:
+        # The keyword 'not' can be the last item which
+        # negates this query.
+        if segment.path[-1] == constants.NEGATION[0]:
+            segment.negated = not segment.negated
+            segment.path.pop(-1)
+
+        # The last keyword can explicitly state the operation; in which
+        # case the operator symbol **must** be `=`.
+        if segment.path[-1] in OPERATOR_KEYWORDS:
+            if segment.operator != constants.OPERATOR_IEQUAL[0]:
+                raise ValueError(
+                    'Explicit operations must use the `=` symbol.')
+
+            segment.operator = segment.path.pop(-1)
+
+        # Make sure we still have a path left.
+        if not segment.path:
+            raise IndexError()
+
+    except IndexError:
+        # Ran out of path items after removing operations and negation.
+        raise ValueError('No path specified in {}'.format(text))
+
+    # Values are not complicated (yet) so just slice and dice
+    # until we get a list of possible values.
+    segment.values = ''.join(iterator)
+    if segment.values:
+        segment.values = segment.values.split(constants.SEP_VALUE)
+
+    # Set the combinator.
+    segment.combinator = COMBINATORS[combinator]
+
+    # Return the constructed query segment.
+    return segment
+
+
+def main(number=2000):
+    for text in QUERIES:
+        # Sanity check that both parsers agree on the segments.
+        for new, old in zip(parse(text).segments,
+                            legacy_parse(text).segments):
+            assert (new.path, new.operator, new.negated, new.values) == (
+                old.path, old.operator, old.negated, old.values)
+
+        legacy = min(timeit.repeat(
+            lambda: legacy_parse(text), number=number, repeat=3))
+        current = min(timeit.repeat(
+            lambda: parse(text), number=number, repeat=3))
+
+        print('{:>6} chars: legacy {:8.2f}us  current {:8.2f}us  '
+              '({:.1f}x)'.format(
+                  len(text),
+                  legacy / number * 1e6,
+                  current / number * 1e6,
+                  legacy / current))
+
+
+if __name__ == '__main__':
+    main()
@@ -65,6 +65,58 @@ class Authorization(object):
         """Informs the client that it is not authrozied for the resource."""
         raise http.exceptions.Forbidden()
 
+    def scope(self, user, resource):
+        """
+        Identifies the users that are authorized alike; responses cached
+        for one user of a scope are served to the others.
+
+        @param[in] user
+            The user in question that is being checked.
+
+        @param[in] resource
+            The resource instance that is being authorized.
+
+        @returns
+            Returns a value (as text) that is equal for users of the same
+            scope. By default, each user is its own scope.
+        """
+        if user is None:
+            # Anonymous users share their scope.
+            return ''
+
+        return '{}:{}'.format(type(user).__name__,
+                              getattr(user, 'pk', getattr(user, 'id', user)))
+
+    def authorize_many(self, user, operation, resource, items):
+        """Determines authorization to each of a set of resource objects.
+
+        @param[in] user
+            The user in question that is being checked.
+
+        @param[in] operation
+            The operation in question that is being performed (eg. 'update').
+
+        @param[in] resource
+            The resource instance that is being authorized.
+
+        @param[in] items
+            The sequence of objects to be checked (eg. the targets of a
+            bulk update).
+
+        @returns
+            Returns a tuple of the list of objects the user is authorized
+            for and the list of those it is not; each in the order given.
+        """
+        allowed, denied = [], []
+        for item in items:
+            if self.is_authorized(user, operation, resource, item):
+                allowed.append(item)
+
+            else:
+                denied.append(item)
+
+        return allowed, denied
+
     def filter(self, user, operation, resource, iterable):
         """
         Filters an iterable to contain only the items for which the user
@@ -133,6 +185,28 @@ class ShieldAuthorization(ManagedAuthorization):
         return shield.has(
             *self.permissions[operation], bearer=user, target=item)
 
+    def authorize_many(self, user, operation, resource, items):
+        if operation == 'create' or not items:
+            # New objects are not yet stored to be queried for.
+            return super(ShieldAuthorization, self).authorize_many(
+                user, operation, resource, items)
+
+        # Select those of the objects that are permitted in one query
+        # rather than asking for each object in turn.
+        slug = resource.meta.slug
+        permitted = set(slug.get(x) for x in resource.select(
+            slugs=[slug.get(x) for x in items], operation=operation))
+
+        allowed, denied = [], []
+        for item in items:
+            if slug.get(item) in permitted:
+                allowed.append(item)
+
+            else:
+                denied.append(item)
+
+        return allowed, denied
+
     def filter(self, user, operation, resource, iterable):
         clause = shield.filter(
             *self.permissions[operation],
@@ -0,0 +1,13 @@
+# -*- coding: utf-8 -*-
+from .base import Cache
+from .memory import MemoryCache
+from .shared import SharedMemoryCache
+from .client import ClientCache, LocalClient
+
+__all__ = [
+    'Cache',
+    'MemoryCache',
+    'SharedMemoryCache',
+    'ClientCache',
+    'LocalClient'
+]
@@ -0,0 +1,48 @@
+# -*- coding: utf-8 -*-
+from __future__ import absolute_import, unicode_literals, division
+
+
+class Cache(object):
+    """Establishes the protocol of the backends that cache responses.
+
+    Keys are text; values are any picklable object. A backend may drop
+    any entry at any time (eg. to make room for another).
+    """
+
+    def __init__(self, timeout=None):
+        #! Default number of seconds to retain an entry for; None (or 0)
+        #! retains entries until they are evicted.
+        self.timeout = timeout
+
+    def expiry(self, timeout=None):
+        """Resolves the number of seconds to retain an entry for.
+
+        @param[in] timeout
+            The number of seconds requested; None for the default of the
+            backend and 0 to retain the entry until it is evicted.
+
+        @returns
+            The number of seconds; or None to retain the entry until it is
+            evicted.
+        """
+        if timeout is None:
+            timeout = self.timeout
+
+        return timeout or None
+
+    def get(self, key):
+        """Retrieves the entry for the key; or None if there is none."""
+        raise NotImplementedError()
+
+    def set(self, key, value, timeout=None):
+        """Stores the entry for the key.
+
+        @param[in] timeout
+            The number of seconds to retain the entry for; None for the
+            default of the backend and 0 to retain it until it is evicted.
+        """
+        raise NotImplementedError()
+
+    def delete(self, key):
+        """Removes the entry for the key, if any."""
+        raise NotImplementedError()
@@ -0,0 +1,79 @@
+# -*- coding: utf-8 -*-
+from __future__ import absolute_import, unicode_literals, division
+import time
+from six.moves import cPickle as pickle
+from .base import Cache
+
+
+class ClientCache(Cache):
+    """Caches entries in a cache server through its client.
+
+    The client is anything with the interface common to the memcached and
+    redis clients: `get(key)`, `set(key, value[, timeout])` and
+    `delete(key)`; values are stored pickled.
+
+    @code
+        import memcache
+        cache = ClientCache(memcache.Client(['127.0.0.1:11211']))
+    @endcode
+    """
+
+    def __init__(self, client, prefix='armet:', timeout=None):
+        super(ClientCache, self).__init__(timeout=timeout)
+
+        #! The client of the cache server.
+        self.client = client
+
+        #! Prefix of the keys stored in the server.
+        self.prefix = prefix
+
+    def get(self, key):
+        data = self.client.get(self.prefix + key)
+        if data is None:
+            return None
+
+        return pickle.loads(data)
+
+    def set(self, key, value, timeout=None):
+        data = pickle.dumps(value, pickle.HIGHEST_PROTOCOL)
+        timeout = self.expiry(timeout)
+        if timeout:
+            self.client.set(self.prefix + key, data, timeout)
+
+        else:
+            self.client.set(self.prefix + key, data)
+
+    def delete(self, key):
+        self.client.delete(self.prefix + key)
+
+
+class LocalClient(object):
+    """Implements the client interface used by `ClientCache` in the memory
+    of this process; stands in for a cache server (eg. in tests).
+    """
+
+    def __init__(self):
+        #! Entries as tuples of the time they expire at (or None) and
+        #! their value.
+        self._entries = {}
+
+    def get(self, key):
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+
+        expires, value = entry
+        if expires is not None and expires <= time.time():
+            # The entry has expired.
+            del self._entries[key]
+            return None
+
+        return value
+
+    def set(self, key, value, timeout=0):
+        expires = time.time() + timeout if timeout else None
+        self._entries[key] = (expires, value)
+        return True
+
+    def delete(self, key):
+        return self._entries.pop(key, None) is not None
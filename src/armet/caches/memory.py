@@ -0,0 +1,45 @@
+# -*- coding: utf-8 -*-
+from __future__ import absolute_import, unicode_literals, division
+import time
+from armet.utils import LRUCache
+from .base import Cache
+
+
+class MemoryCache(Cache):
+    """Caches entries in the memory of this process.
+
+    The least recently used entry is evicted once the cache is full;
+    entries are stored as they are (without being pickled).
+    """
+
+    def __init__(self, maxsize=1024, timeout=None):
+        super(MemoryCache, self).__init__(timeout=timeout)
+
+        #! Entries as tuples of the time they expire at (or None) and
+        #! their value.
+        self._entries = LRUCache(maxsize)
+
+    def get(self, key):
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+
+        expires, value = entry
+        if expires is not None and expires <= time.time():
+            # The entry has expired.
+            self._entries.delete(key)
+            return None
+
+        return value
+
+    def set(self, key, value, timeout=None):
+        timeout = self.expiry(timeout)
+        expires = time.time() + timeout if timeout else None
+        self._entries.set(key, (expires, value))
+
+    def delete(self, key):
+        self._entries.delete(key)
+
+    def clear(self):
+        """Removes every entry."""
+        self._entries.clear()
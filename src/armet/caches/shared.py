@@ -0,0 +1,97 @@
+# -*- coding: utf-8 -*-
+from __future__ import absolute_import, unicode_literals, division
+import mmap
+import struct
+import hashlib
+import time
+import multiprocessing
+from six.moves import cPickle as pickle
+from .base import Cache
+
+
+#! Layout of the header of each slot: the digest of the key, the time the
+#! entry expires at (0 for never) and the length of the pickled value.
+_HEADER = struct.Struct(str('!20sdI'))
+
+#! Digest marking an empty slot.
+_EMPTY = b'\0' * 20
+
+
+class SharedMemoryCache(Cache):
+    """Caches entries in a block of memory shared with child processes.
+
+    The block is mapped when the cache is constructed and is shared with
+    each process forked afterwards (eg. the workers of a pre-forking
+    server when constructed at import time). The block is divided into
+    fixed-size slots; each key maps to a single slot and an entry evicts
+    whichever entry held its slot. Entries that do not fit in a slot are
+    not cached.
+    """
+
+    def __init__(self, size=16 * 1024 * 1024, slot_size=16 * 1024,
+                 timeout=None):
+        super(SharedMemoryCache, self).__init__(timeout=timeout)
+
+        #! Size of each slot (including its header) in bytes.
+        self.slot_size = slot_size
+
+        #! Number of slots in the block.
+        self.slots = size // slot_size
+
+        #! The shared (anonymous) block of memory.
+        self._block = mmap.mmap(-1, self.slots * slot_size)
+
+        #! Guards the block across processes.
+        self._lock = multiprocessing.Lock()
+
+    def _locate(self, key):
+        # Find the slot of the key from its digest.
+        digest = hashlib.sha1(key.encode('utf8')).digest()
+        index = int(hashlib.sha1(digest).hexdigest()[:8], 16) % self.slots
+        return digest, index * self.slot_size
+
+    def get(self, key):
+        digest, offset = self._locate(key)
+        with self._lock:
+            stored, expires, length = _HEADER.unpack_from(
+                self._block, offset)
+
+            if stored != digest or (expires and expires <= time.time()):
+                # Another (or no) entry holds the slot or it has expired.
+                return None
+
+            start = offset + _HEADER.size
+            data = self._block[start:start + length]
+
+        return pickle.loads(data)
+
+    def set(self, key, value, timeout=None):
+        digest, offset = self._locate(key)
+        data = pickle.dumps(value, pickle.HIGHEST_PROTOCOL)
+        timeout = self.expiry(timeout)
+        expires = time.time() + timeout if timeout else 0
+        with self._lock:
+            if _HEADER.size + len(data) > self.slot_size:
+                # Too large to cache; drop the stale entry for the key.
+                if _HEADER.unpack_from(self._block, offset)[0] == digest:
+                    _HEADER.pack_into(self._block, offset, _EMPTY, 0, 0)
+
+                return
+
+            _HEADER.pack_into(
+                self._block, offset, digest, expires, len(data))
+
+            start = offset + _HEADER.size
+            self._block[start:start + len(data)] = data
+
+    def delete(self, key):
+        digest, offset = self._locate(key)
+        with self._lock:
+            if _HEADER.unpack_from(self._block, offset)[0] == digest:
+                _HEADER.pack_into(self._block, offset, _EMPTY, 0, 0)
+
+    def clear(self):
+        """Removes every entry."""
+        with self._lock:
+            for offset in range(0, len(self._block), self.slot_size):
+                _HEADER.pack_into(self._block, offset, _EMPTY, 0, 0)
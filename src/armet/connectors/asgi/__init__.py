@@ -0,0 +1,10 @@
+# -*- coding: utf-8 -*-
+"""Serves resources from an ASGI application; requires python 3.5+.
+"""
+from __future__ import absolute_import, unicode_literals, division
+from .resources import Application, application
+
+__all__ = [
+    'Application',
+    'application'
+]
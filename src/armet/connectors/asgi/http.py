@@ -0,0 +1,286 @@
+# -*- coding: utf-8 -*-
+from __future__ import absolute_import, unicode_literals, division
+import asyncio
+from six.moves.urllib.parse import quote
+from armet import http, exceptions
+from armet.connectors.wsgi.http import ResponseHeaders
+
+
+class RequestHeaders(http.request.Headers):
+
+    def __init__(self, scope):
+        #! Header values keyed by their lower-cased name.
+        self._store = store = {}
+
+        #! Header names in Http-Header-Case.
+        self._names = names = []
+
+        # Pull the headers out of the scope once; repeated headers
+        # are combined into a comma-separated list.
+        for key, value in scope['headers']:
+            key = key.decode('latin1').lower()
+            value = value.decode('latin1')
+            if key in store:
+                store[key] += ',' + value
+                continue
+
+            store[key] = value
+            names.append(self.normalize(key))
+
+        # Continue the initialization.
+        super(RequestHeaders, self).__init__()
+
+    def __getitem__(self, name):
+        return self._store[name.lower()]
+
+    def __iter__(self):
+        return iter(self._names)
+
+    def __len__(self):
+        return len(self._names)
+
+    def __contains__(self, name):
+        return name.lower() in self._store
+
+
+class RequestStream(object):
+    """Iterates asynchronously over the chunks of the body as they
+    are received.
+    """
+
+    def __init__(self, request):
+        #! The request that receives the chunks.
+        self._request = request
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        chunk = await self._request.receive()
+        if chunk is None:
+            raise StopAsyncIteration()
+
+        return chunk
+
+
+class Request(http.Request):
+
+    def __init__(self, scope, receive, *args, **kwargs):
+        #! The ASGI connection scope of the request.
+        self._scope = scope
+
+        #! The awaitable that receives the messages of the request.
+        self._receive = receive
+
+        #! True once the last chunk of the body has been received.
+        self.received = False
+
+        #! True if the body was received (see `load`) before being read.
+        self.loaded = False
+
+        # Initialize the request headers.
+        self.headers = RequestHeaders(scope)
+
+        # Set the method of the request; the body is set once
+        # it is received.
+        kwargs.update(body=b'')
+        kwargs.update(method=scope['method'])
+
+        # Continue the initialization.
+        super(Request, self).__init__(*args, **kwargs)
+
+    async def receive(self):
+        """Receives the next chunk of the body.
+
+        @returns
+            The chunk (as bytes); or None once the body has been received
+            (or the client has disconnected).
+        """
+        while not self.received:
+            message = await self._receive()
+            if message['type'] != 'http.request':
+                # The client disconnected.
+                self.received = True
+                break
+
+            self.received = not message.get('more_body', False)
+            chunk = message.get('body')
+            if chunk:
+                return chunk
+
+        return None
+
+    def stream(self):
+        """Returns an asynchronous iterator over the chunks of the body.
+
+        @code
+            async for chunk in request.stream():
+                ...
+        @endcode
+        """
+        return RequestStream(self)
+
+    async def load(self):
+        """Receives the entire body of the request so that it may be read
+        (or deserialized) synchronously.
+        """
+        if not self.loaded:
+            chunks = []
+            async for chunk in self.stream():
+                chunks.append(chunk)
+
+            self._body = b''.join(chunks)
+            self.loaded = True
+
+        return self._body
+
+    def require_loaded(self):
+        """Raises an exception if the body has not been received."""
+        if not self.loaded:
+            raise exceptions.InvalidOperation(
+                'Request body has not been received; await `load` first.')
+
+    @property
+    def _stream(self):
+        self.require_loaded()
+        return super(Request, self)._stream
+
+    @property
+    def body(self):
+        self.require_loaded()
+        return super(Request, self).body
+
+    @property
+    def protocol(self):
+        return self._scope.get('scheme', 'http').upper()
+
+    @property
+    def mount_point(self):
+        path = self._scope['path']
+        return path.rsplit(self.path)[0] if self.path else path
+
+    @property
+    def query(self):
+        return self._scope.get('query_string', b'').decode('utf8')
+
+    @property
+    def uri(self):
+        query = self.query
+        return '{}://{}{}{}'.format(
+            self.protocol.lower(),
+            self.host,
+            quote(self._scope['path']),
+            '?' + query if query else '')
+
+
+class Queue(http.queue.Queue):
+    """Queue that is put to without blocking (the event loop); a paused
+    producer awaits `drain` instead.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super(Queue, self).__init__(*args, **kwargs)
+
+        #! The underlying (unbounded) queue of the chunks.
+        self._queue = asyncio.Queue()
+
+        #! Set while the producer may continue.
+        self._resumed = asyncio.Event()
+        self._resumed.set()
+
+    def put(self, chunk):
+        """Puts the chunk on the queue."""
+        self._queue.put_nowait(chunk)
+        if self._enter(chunk):
+            self._resumed.clear()
+
+    async def get(self):
+        """Takes the next chunk off of the queue; waiting for one."""
+        chunk = await self._queue.get()
+        if self._leave(chunk):
+            self._resumed.set()
+
+        return chunk
+
+    async def drain(self):
+        """Waits for the client to catch up while paused."""
+        await self._resumed.wait()
+
+
+class Response(http.Response):
+
+    def __init__(self, *args, **kwargs):
+        #! The status code of the response.
+        self._status = http.client.OK
+
+        # Complete the initialization.
+        super(Response, self).__init__(*args, **kwargs)
+
+        # If we're dealing with an asynchronous response, we need
+        # to have an asynchronous queue of the chunks to send.
+        if self.asynchronous:
+            self.queue = Queue(self.high_watermark, self.low_watermark)
+
+        # Initialize the response headers.
+        self.headers = ResponseHeaders(self)
+
+    async def get(self):
+        """Waits for the next chunk written to an asynchronous response.
+
+        @returns
+            The chunk; or None once the response has been closed.
+        """
+        chunk = await self.queue.get()
+        return None if chunk is StopIteration else chunk
+
+    async def drain(self):
+        """Waits until the client has been sent enough of an asynchronous
+        response; `send` does not block on asyncio so a producer that may
+        outpace the client awaits this after sending.
+
+        @code
+            for row in rows:
+                response.send(row)
+                await response.drain()
+        @endcode
+        """
+        if self.asynchronous:
+            await self.queue.drain()
+
+    @property
+    def status(self):
+        return self._status
+
+    @status.setter
+    def status(self, value):
+        self.require_open()
+        self._status = value
+
+    @property
+    def header_list(self):
+        """The headers of the response as expected by ASGI."""
+        return [(name.encode('latin1'), str(value).encode('latin1'))
+                for name, value in self.headers._store.values()]
+
+    @http.Response.body.setter
+    def body(self, value):
+        if value:
+            if self.asynchronous:
+                # Unset the underlying store.
+                super(Response, Response).body.__set__(self, None)
+
+                # Write the chunk to the asynchronous queue.
+                self.queue.put(value)
+                return
+
+        # Set the underlying store.
+        super(Response, Response).body.__set__(self, value)
+
+    def close(self):
+        # Perform general clean-up and a final flush.
+        super(Response, self).close()
+
+        if self.asynchronous:
+            # Close the asynchronous queue and terminate the connection
+            # to the client.
+            self.queue.put(StopIteration)
@@ -0,0 +1,209 @@
+# -*- coding: utf-8 -*-
+from __future__ import absolute_import, unicode_literals, division
+import re
+import asyncio
+import collections
+from armet import utils
+from armet import http as base_http
+from armet.resources.utils import connector_super
+from . import http
+
+
+class Application(object):
+    """An ASGI application that routes requests to mounted resources.
+
+    @code
+        application = Application()
+        PollResource.mount('/api/', application)
+    @endcode
+    """
+
+    def __init__(self):
+        #! Mounted resources as tuples of the compiled pattern that
+        #! matches their requests and the resource.
+        self.routes = []
+
+    def mount(self, url, resource):
+        """Routes requests beneath `url` followed by the resource name
+        to the passed resource.
+        """
+        pattern = r'^{}{}($|[/:(.].*)'.format(
+            re.escape(url), re.escape(resource.meta.name))
+        self.routes.append((re.compile(pattern, re.DOTALL), resource))
+
+    async def __call__(self, scope, receive, send):
+        if scope['type'] == 'lifespan':
+            # Nothing to start up or shut down; acknowledge each event.
+            while True:
+                message = await receive()
+                if message['type'] == 'lifespan.startup':
+                    await send({'type': 'lifespan.startup.complete'})
+
+                elif message['type'] == 'lifespan.shutdown':
+                    await send({'type': 'lifespan.shutdown.complete'})
+                    return
+
+        path = scope['path'] or '/'
+        for pattern, resource in self.routes:
+            match = pattern.match(path)
+            if match is not None:
+                # Pass control off to the resource.
+                return await resource.view(
+                    scope, receive, send, match.group(1))
+
+        # Nothing is mounted here.
+        await send({'type': 'http.response.start',
+                    'status': int(base_http.client.NOT_FOUND),
+                    'headers': []})
+        await send({'type': 'http.response.body', 'body': b''})
+
+
+#! The default application that resources are mounted on.
+application = _default = Application()
+
+
+async def _start(send, response):
+    # Send the status and headers of the response.
+    await send({'type': 'http.response.start',
+                'status': int(response.status),
+                'headers': response.header_list})
+
+
+async def _send(send, chunk, more=True):
+    # Send a chunk of the body of the response.
+    await send({'type': 'http.response.body',
+                'body': chunk or b'',
+                'more_body': more})
+
+
+class Resource(object):
+
+    @classmethod
+    def is_asynchronous_handler(cls, request):
+        """
+        Tests if the request will be dispatched to an asynchronous
+        (`async def`) handler; those receive the body of the request as
+        they please (see `http.Request.stream`).
+        """
+        try:
+            resource = cls.resolve(request.path)[0]
+
+        except base_http.exceptions.BaseHTTPException:
+            # Traversal fails; nothing will handle the request.
+            return False
+
+        names = ('dispatch', 'route', request.method.lower())
+        return any(asyncio.iscoroutinefunction(getattr(resource, name, None))
+                   for name in names)
+
+    @classmethod
+    async def view(cls, scope, receive, send, path=''):
+        # Construct request and response wrappers.
+        asynchronous = cls.meta.asynchronous
+        request = http.Request(
+            scope, receive, path=path, asynchronous=asynchronous)
+        response = http.Response(
+            asynchronous=asynchronous,
+            high_watermark=cls.meta.high_watermark,
+            low_watermark=cls.meta.low_watermark)
+
+        # The resource handler the connector was installed over.
+        view = connector_super(cls, Resource, 'view').view
+
+        if not cls.is_asynchronous_handler(request):
+            # Synchronous handlers read the body as they please; it must
+            # be received beforehand.
+            await request.load()
+
+        # Pass control off to the resource handler.
+        result = view(request, response)
+
+        if utils.isawaitable(result):
+            try:
+                # Await the asynchronous handler.
+                result = await result
+                if not hasattr(result, '__aiter__'):
+                    # Handle the result as would be done synchronously.
+                    result = cls.complete(request, response, result)
+
+            except (base_http.exceptions.BaseHTTPException, Exception) as ex:
+                # Handle the error as would be done synchronously.
+                result = cls.fail(request, response, ex)
+
+        if hasattr(result, '__aiter__'):
+            # Stream the chunks as they are produced.
+            return await cls.stream_asynchronously(response, result, send)
+
+        if asynchronous:
+            # Wait for the first chunk; the status and headers are set
+            # by the time it is written.
+            chunk = await response.get()
+            await _start(send, response)
+
+            # Send each chunk as it is written until the response
+            # is closed.
+            while chunk is not None:
+                await _send(send, chunk)
+                chunk = await response.get()
+
+            return await _send(send, None, more=False)
+
+        # Start the response.
+        await _start(send, response)
+
+        if isinstance(result, collections.Iterator):
+            # Send the streamed response.
+            for chunk in result:
+                await _send(send, chunk)
+
+            return await _send(send, None, more=False)
+
+        # Send the body of the response, if any.
+        await _send(send, result, more=False)
+
+    @classmethod
+    async def stream_asynchronously(cls, response, sequence, send):
+        """
+        Streams the chunks of an asynchronous iterator (as returned by
+        an `async def` handler) to the client; as `stream` does for an
+        iterator.
+        """
+        # Run the sequence once in order to capture any headers and
+        # status codes set.
+        iterator = sequence.__aiter__()
+        try:
+            chunk = await iterator.__anext__()
+
+        except StopAsyncIteration:
+            chunk = None
+
+        response.streaming = True
+        await _start(send, response)
+
+        while chunk is not None:
+            # Write the chunk to the response and send its body.
+            response.send(chunk)
+            await _send(send, response.body)
+            response.body = None
+
+            try:
+                # Get the next chunk.
+                chunk = await iterator.__anext__()
+
+            except StopAsyncIteration:
+                # Get out of the loop.
+                break
+
+        # Close the response.
+        response.close()
+        await _send(send, response.body, more=False)
+
+    @classmethod
+    def mount(cls, url='/', application=None):
+        if application is None:
+            # If no explicit application is passed; use
+            # the default application.
+            application = _default
+
+        # Route requests for this resource from the application.
+        application.mount(url, cls)
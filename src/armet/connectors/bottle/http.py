@@ -25,9 +25,10 @@ class Request(http.Request):
         # Initialize the request headers.
         self.headers = RequestHeaders()
 
-        # Set the method and body of the request.
+        # Set the method and body of the request; the body is read from
+        # its (spooled) file as needed.
         request = bottle.request
-        kwargs.update(body=request.body.read())
+        kwargs.update(body=request.body)
         kwargs.update(method=request.method)
 
         # Elide the thread-safe request copy and the global bottle.request.
@@ -100,17 +101,16 @@ class Response(http.Response):
         # to have a thread-safe response handle as well as an
         # asynchronous queue to give to WSGI.
         if self.asynchronous:
-            from gevent import queue
-
             self._handle = self._handle.copy()
-            self._queue = queue.Queue()
+            self.queue = http.queue.GeventQueue(
+                self.high_watermark, self.low_watermark)
 
         # Initialize the response headers.
         self.headers = ResponseHeaders(self, self._handle)
 
     def __iter__(self):
         # Return the asynchronous queue.
-        return self._queue
+        return self.queue
 
     @property
     def status(self):
@@ -134,7 +134,7 @@ class Response(http.Response):
                 super(Response, Response).body.__set__(self, None)
 
                 # Write the chunk to the asynchronous queue.
-                self._queue.put(value)
+                self.queue.put(value)
                 return
 
         # Set the underlying store.
@@ -147,4 +147,4 @@ class Response(http.Response):
         if self.asynchronous:
             # Close the asynchronous queue and terminate the connection
             # to the client.
-            self._queue.put(StopIteration)
+            self.queue.put(StopIteration)
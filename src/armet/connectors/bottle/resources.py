@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 from __future__ import absolute_import, unicode_literals, division
 import bottle
+from armet.resources.utils import connector_super
 from . import http
 
 
@@ -9,21 +10,28 @@ class Resource(object):
     @classmethod
     def view(cls, *args, **kwargs):
         # Construct request and response wrappers.
-        async = cls.meta.asynchronous
-        request = http.Request(path=kwargs.get('path', ''), asynchronous=async)
-        response = http.Response(asynchronous=async)
+        asynchronous = cls.meta.asynchronous
+        request = http.Request(
+            path=kwargs.get('path', ''), asynchronous=asynchronous)
+        response = http.Response(
+            asynchronous=asynchronous,
+            high_watermark=cls.meta.high_watermark,
+            low_watermark=cls.meta.low_watermark)
+
+        # The resource handler the connector was installed over.
+        view = connector_super(cls, Resource, 'view').view
 
         # Defer the execution thread if we're running asynchronously.
-        if async:
+        if asynchronous:
             # Defer the view to pass of control.
             import gevent
-            gevent.spawn(super(cls.__base__, cls).view, request, response)
+            gevent.spawn(view, request, response)
 
             # Construct and return a streamer.
             return cls.stream(response, response)
 
         # Pass control off to the resource handler.
-        return super(cls.__base__, cls).view(request, response)
+        return view(request, response)
 
     @classmethod
     def mount(cls, url='/', application=None):
@@ -59,8 +59,9 @@ class Request(http.Request):
         # Initialize the request headers.
         self.headers = RequestHeaders(request)
 
-        # Set the method and body of the request.
-        kwargs.update(body=request.body)
+        # Set the method and body of the request; the request is itself
+        # a file-like object over the body that is read as needed.
+        kwargs.update(body=request)
         kwargs.update(method=self._handle.method)
 
         # Continue the initialization.
@@ -130,15 +131,15 @@ class Response(http.Response):
         # If we're dealing with an asynchronous response, we need
         # to have an asynchronous queue to give to WSGI.
         if self.asynchronous:
-            from gevent import queue
-            self._queue = queue.Queue()
+            self.queue = http.queue.GeventQueue(
+                self.high_watermark, self.low_watermark)
 
         # Initialize the response headers.
         self.headers = ResponseHeaders(self, self._handle)
 
     def __iter__(self):
         # Return the asynchronous queue.
-        return self._queue
+        return self.queue
 
     @property
     def status(self):
@@ -157,7 +158,7 @@ class Response(http.Response):
                 super(Response, Response).body.__set__(self, None)
 
                 # Write the chunk to the asynchronous queue.
-                self._queue.put(value)
+                self.queue.put(value)
                 return
 
         # Set the underlying store.
@@ -170,4 +171,4 @@ class Response(http.Response):
         if self.asynchronous:
             # Close the asynchronous queue and terminate the connection
             # to the client.
-            self._queue.put(StopIteration)
+            self.queue.put(StopIteration)
@@ -4,9 +4,13 @@ import operator
 import six
 from six.moves import map, reduce
 from django.conf import urls
-from django.db.models import Q
+from django.db import transaction
+from django.db.models import Q, ForeignKey, ManyToManyField
+from django.db.models.fields import FieldDoesNotExist
 from django.views.decorators import csrf
 from armet import utils
+from armet.http import exceptions
+from armet.resources.utils import connector_super
 from . import http
 from armet.query import parser, Query, QuerySegment, constants
 
@@ -17,23 +21,30 @@ class Resource(object):
     @csrf.csrf_exempt
     def view(cls, django_request, *args, **kwargs):
         # Construct request and response wrappers.
-        async = cls.meta.asynchronous
+        asynchronous = cls.meta.asynchronous
         path = kwargs.get('path') or ''
-        request = http.Request(django_request, path=path, asynchronous=async)
-        response = http.Response(asynchronous=async)
+        request = http.Request(
+            django_request, path=path, asynchronous=asynchronous)
+        response = http.Response(
+            asynchronous=asynchronous,
+            high_watermark=cls.meta.high_watermark,
+            low_watermark=cls.meta.low_watermark)
+
+        # The resource handler the connector was installed over.
+        view = connector_super(cls, Resource, 'view').view
 
         # Defer the execution thread if we're running asynchronously.
-        if async:
+        if asynchronous:
             # Defer the view to pass of control.
             import gevent
-            gevent.spawn(super(cls.__base__, cls).view, request, response)
+            gevent.spawn(view, request, response)
 
             # Construct and return the generator response.
             response._handle.content = cls.stream(response, response)
             return response._handle
 
         # Pass control off to the resource handler.
-        result = super(cls.__base__, cls).view(request, response)
+        result = view(request, response)
 
         # Configure the response and return it.
         response._handle.content = result
@@ -65,26 +76,22 @@ def build_clause(query, attributes):
     clause = None
     last = None
     for seg in query.segments:
-        # Get the attribute in question.
-        attribute = attributes[seg.path[0]]
+        if isinstance(seg, Query):
+            # Construct the clause from the (parenthesized) group.
+            q = build_clause(seg, attributes)
 
-        # Replace the initial path segment with the expanded
-        # attribute path.
-        seg.path[0:1] = attribute.path.split('.')
+        elif seg.values:
+            q = build_segment(seg, attributes)
 
-        # Boolean's should use `exact` rather than `iexact`.
-        if attribute.type is bool:
-            op = '__exact'
         else:
-            op = OPERATOR_MAP[seg.operator]
+            # Segment only carries directives; nothing to filter on.
+            q = None
 
-        # Build the path from the segment.
-        path = '__'.join(seg.path) + op
+        if q is None:
+            continue
 
-        # Construct a Q-object from the segment.
-        q = reduce(operator.or_,
-                   map(lambda x: Q((path, x)),
-                       map(attribute.try_clean, seg.values)))
+        if seg.negated:
+            q = ~q
 
         # Combine the segment with the last.
         clause = last.combinator(clause, q) if last is not None else q
@@ -94,18 +101,226 @@ def build_clause(query, attributes):
     return clause
 
 
+def build_segment(seg, attributes):
+    # Get the attribute in question.
+    attribute = attributes[seg.path[0]]
+
+    # Expand the initial path segment to the attribute path; the
+    # (shared) query itself is left untouched.
+    path = attribute.path.split('.') + list(seg.path[1:])
+
+    # Boolean's should use `exact` rather than `iexact`.
+    if attribute.type is bool:
+        op = '__exact'
+    else:
+        op = OPERATOR_MAP[seg.operator]
+
+    # Build the path from the segment.
+    path = '__'.join(path) + op
+
+    # Construct a Q-object from the segment.
+    return reduce(operator.or_,
+                  map(lambda x: Q((path, x)),
+                      map(attribute.try_clean, seg.values)))
+
+
+#! Maximum number of loading strategies for requested sets of fields to
+#! retain for each resource.
+FIELDS_CACHE_SIZE = 64
+
+
+class ModelResourceOptions(object):
+
+    def __init__(self, meta, name, bases):
+        #! Relations to follow with a join when reading (as passed to
+        #! `QuerySet.select_related`). Derived from the paths of the
+        #! attributes when not given.
+        self.select_related = meta.get('select_related')
+
+        #! Relations to fetch with a query per relation when reading (as
+        #! passed to `QuerySet.prefetch_related`). Derived from the paths
+        #! of the attributes when not given.
+        self.prefetch_related = meta.get('prefetch_related')
+
+        #! Fields to restrict the selected columns to when reading (as
+        #! passed to `QuerySet.only`). Derived from the paths of the
+        #! attributes when not given; an empty sequence selects every
+        #! column.
+        self.only = meta.get('only')
+
+
+def build_load_options(model, paths):
+    """Derives the relations to follow and the fields to select in order
+    to resolve the attribute paths against the model.
+
+    @returns
+        A tuple of the sequences to pass to `select_related`,
+        `prefetch_related` and `only`.
+    """
+    select_related, prefetch_related, only = set(), set(), set()
+    prune = True
+    for path in paths:
+        target = model
+        names = []
+        for name in path.split('.'):
+            try:
+                field = (target._meta.pk if name == 'pk'
+                         else target._meta.get_field(name))
+
+            except FieldDoesNotExist:
+                # Not a field (eg. a property); which may read any column
+                # of the model so nothing may be deferred.
+                prune = False
+                break
+
+            names.append(name)
+            lookup = '__'.join(names)
+
+            if isinstance(field, ManyToManyField):
+                # A collection; fetch it with a query per relation and
+                # leave its columns alone.
+                prefetch_related.add(lookup)
+                break
+
+            only.add(lookup)
+
+            if not isinstance(field, ForeignKey):
+                # A column; further segments resolve against its value.
+                break
+
+            # Follow the forward relation with a join.
+            select_related.add(lookup)
+            target = field.rel.to
+
+    return (sorted(select_related), sorted(prefetch_related),
+            sorted(only) if prune else [])
+
+
 class ModelResource(object):
 
+    @classmethod
+    def bind_model(cls, attributes):
+        """Derives how to load the items for the bound attributes."""
+        cls._load_options = cls.build_load_options(six.itervalues(attributes))
+
+        # Loading strategies for requested sets of fields; derived
+        # on demand.
+        cls._field_load_options = utils.LRUCache(FIELDS_CACHE_SIZE)
+
+    @classmethod
+    def build_load_options(cls, attributes):
+        """Derives how to load the items for the passed attributes (and
+        the slug); preferring those given in the configuration.
+        """
+        paths = [x.path for x in attributes if x.path]
+        if cls.meta.slug.path:
+            paths.append(cls.meta.slug.path)
+
+        derived = build_load_options(cls.meta.model, paths)
+        return tuple(
+            value if value is not None else default
+            for value, default in zip((
+                cls.meta.select_related,
+                cls.meta.prefetch_related,
+                cls.meta.only), derived))
+
+    def load(self, queryset):
+        """Applies the loading strategy to the queryset."""
+        fields = self.fields()
+        if fields is None:
+            options = self._load_options
+
+        else:
+            # Derive (and retain) the strategy for the requested fields.
+            options = self._field_load_options.get(fields)
+            if options is None:
+                options = self.build_load_options(
+                    self.attributes[x] for x in fields)
+
+                self._field_load_options.set(fields, options)
+
+        select_related, prefetch_related, only = options
+        if select_related:
+            queryset = queryset.select_related(*select_related)
+
+        if prefetch_related:
+            queryset = queryset.prefetch_related(*prefetch_related)
+
+        if only:
+            queryset = queryset.only(*only)
+
+        return queryset
+
+    @staticmethod
+    def related_model(model, name):
+        """Retrieves the model targeted by the named relation, if any.
+        """
+        try:
+            field = model._meta.get_field(name)
+
+        except FieldDoesNotExist:
+            # Not a field on the model (eg. a property or reverse relation).
+            return None
+
+        if isinstance(field, ForeignKey):
+            # Forward relation; the value is an instance of the
+            # related model.
+            return field.rel.to
+
     def filter(self, clause, queryset):
         # Filter the queryset by the passed clause.
         return queryset.filter(clause).distinct()
 
-    def read(self):
+    def order(self, queryset):
+        sorting = self.sorting()
+        if not sorting and self.pagination() == (None, None, None):
+            # Neither sorted nor paginated; leave the order alone.
+            return queryset
+
+        # Sort by the requested attributes and then by the slug; pages are
+        # only stable over a consistent ordering.
+        return queryset.order_by(*(
+            ('-' if descending else '') + attribute.path.replace('.', '__')
+            for attribute, descending in
+            sorting + [(self.meta.slug, False)]))
+
+    def paginate(self, queryset):
+        limit, offset, after = self.pagination()
+
+        if after is not None:
+            # Begin the page after the passed item; this is an index scan
+            # rather than skipping over the preceding rows.
+            path = self.meta.slug.path.replace('.', '__')
+            queryset = queryset.filter(**{path + '__gt': after})
+
+        if not offset and limit is None:
+            # Not sliced.
+            return queryset
+
+        # Slicing the queryset applies an OFFSET and LIMIT to the query.
+        offset = offset or 0
+        if limit is not None:
+            return queryset[offset:offset + limit]
+
+        return queryset[offset:]
+
+    def select(self, slugs=None, operation='read'):
+        """Builds the queryset of the items being accessed; filtered by the
+        query string (or slug, or passed slugs) and by authorization
+        for the operation.
+        """
         # Initialize the queryset to the model manager.
-        queryset = self.meta.model.objects
+        queryset = self.meta.model.objects.all()
 
         query = None
-        if self.slug is not None:
+        if slugs is not None:
+            # Select each of the passed items at once.
+            query = Query(segments=[QuerySegment(
+                path=self.meta.slug.path.split('.'),
+                operator=constants.OPERATOR_EQUAL[0],
+                values=list(slugs))])
+
+        elif self.slug is not None:
             # This is an item-access (eg. GET /<name>/:slug); ignore the
             # query string and generate a query-object based on the slug.
             query = Query(segments=[QuerySegment(
@@ -116,7 +331,12 @@ class ModelResource(object):
         elif self.request.query:
             # This is a list-access; use the query string and construct
             # a query object from it.
-            query = parser.parse(self.request.query)
+            try:
+                query = parser.parse(self.request.query)
+
+            except ValueError:
+                # The query string is malformed.
+                raise exceptions.BadRequest()
 
         # Determine if we need to filter the queryset in some way; and if so,
         # filter it.
@@ -125,17 +345,40 @@ class ModelResource(object):
             queryset = self.filter(clause, queryset)
 
         # Filter the queryset by asserting authorization.
-        queryset = self.meta.authorization.filter(
-            self.request.user, 'read', self, queryset)
+        return self.meta.authorization.filter(
+            self.request.user, operation, self, queryset)
+
+    def read(self):
+        # Select the items; loading the related items and only the
+        # columns that will be prepared.
+        queryset = self.load(self.select())
 
         if self.slug is not None:
             # Attempt to return just the single result we should have.
             result = queryset.all()[:1]
             return result[0] if result else None
 
+        # Order the queryset and restrict it to the requested page.
+        queryset = self.paginate(self.order(queryset.all()))
+
+        if self.meta.streaming:
+            if queryset._prefetch_related_lookups:
+                # The iterator of a queryset does not prefetch; the related
+                # items would then be read with a query per item. Read the
+                # items up front instead (in a query per lookup).
+                return iter(queryset)
+
+            # Return an iterator over the queryset that bypasses the
+            # result cache of the queryset.
+            return queryset.iterator()
+
         # Return the entire queryset.
         return list(queryset.all())
 
+    def count_items(self):
+        # Count the items in the database rather than reading them.
+        return self.select().count()
+
     def create(self, data):
         # Instantiate a new target.
         target = self.meta.model()
@@ -183,3 +426,88 @@ class ModelResource(object):
 
         # Destroy the target.
         target.delete()
+
+    def targets(self, data):
+        """Reads the items identified by the slugs of the cleaned items
+        of the data; in a single query.
+        """
+        slugs = [self.item_slug(x) for x in data]
+        if not slugs:
+            return []
+
+        if any(slug is None for slug in slugs):
+            # Each item must identify its target.
+            raise exceptions.BadRequest()
+
+        found = dict((self.meta.slug.get(x), x)
+                     for x in self.select(slugs=slugs))
+
+        try:
+            return [found[slug] for slug in slugs]
+
+        except KeyError:
+            # An item does not exist; nothing is changed.
+            raise exceptions.NotFound()
+
+    def authorize(self, operation, targets):
+        # Ensure the user is authorized to perform this action on all
+        # of the targets before any of them is changed.
+        authz = self.meta.authorization
+        _, denied = authz.authorize_many(
+            self.request.user, operation, self, targets)
+
+        if denied:
+            authz.unauthorized()
+
+    def create_many(self, data):
+        targets = []
+        for item in data:
+            # Instantiate a new target and set each attribute on it.
+            target = self.meta.model()
+            for name, attribute in six.iteritems(self.attributes):
+                value = item.get(name)
+                if value is not None:
+                    attribute.set(target, value)
+
+            targets.append(target)
+
+        self.authorize('create', targets)
+
+        # Save the targets in a single transaction; each is saved on its
+        # own (rather than with `bulk_create`) so that the primary keys
+        # are set and the save signals are sent.
+        with transaction.atomic():
+            for target in targets:
+                target.save()
+
+        return targets
+
+    def update_many(self, data):
+        # Grab the existing targets.
+        targets = self.targets(data)
+
+        for target, item in zip(targets, data):
+            # Set each of the passed attributes on the target.
+            for name, attribute in six.iteritems(self.attributes):
+                if name in item:
+                    attribute.set(target, item[name])
+
+        self.authorize('update', targets)
+
+        # Save the targets in a single transaction.
+        with transaction.atomic():
+            for target in targets:
+                target.save()
+
+        return targets
+
+    def destroy_many(self):
+        # Grab the existing targets matched by the query.
+        targets = list(self.select(operation='destroy'))
+
+        self.authorize('destroy', targets)
+
+        # Delete the targets with a single query; the selected queryset
+        # is distinct and so cannot be deleted itself.
+        self.meta.model.objects.filter(
+            pk__in=[x.pk for x in targets]).delete()
@@ -34,14 +34,16 @@ class Request(http.Request):
     def __init__(self, *args, **kwargs):
         # Elide the thread-safe request copy and the global bottle.request.
         request = flask.request
-        async = kwargs['asynchronous']
-        self._handle = request if not async else flask.Request(request.environ)
+        asynchronous = kwargs['asynchronous']
+        self._handle = (request if not asynchronous
+                        else flask.Request(request.environ))
 
         # Initialize the request headers.
         self.headers = RequestHeaders(self._handle)
 
-        # Set the method and body of the request.
-        body = LimitedStream(request.input_stream, len(self)).read()
+        # Set the method and body of the request; the body is read from
+        # the input stream as needed.
+        body = LimitedStream(request.input_stream, len(self))
         kwargs.update(body=body)
         kwargs.update(method=request.method)
 
@@ -114,15 +116,15 @@ class Response(http.Response):
         # If we're dealing with an asynchronous response, we need
         # to have an asynchronous queue to give to WSGI.
         if self.asynchronous:
-            from gevent import queue
-            self._queue = queue.Queue()
+            self.queue = http.queue.GeventQueue(
+                self.high_watermark, self.low_watermark)
 
         # Initialize the response headers.
         self.headers = ResponseHeaders(self, self._handle)
 
     def __iter__(self):
         # Return the asynchronous queue.
-        return self._queue
+        return self.queue
 
     @property
     def status(self):
@@ -141,7 +143,7 @@ class Response(http.Response):
                 super(Response, Response).body.__set__(self, None)
 
                 # Write the chunk to the asynchronous queue.
-                self._queue.put(value)
+                self.queue.put(value)
                 return
 
         # Set the underlying store.
@@ -154,4 +156,4 @@ class Response(http.Response):
         if self.asynchronous:
             # Close the asynchronous queue and terminate the connection
             # to the client.
-            self._queue.put(StopIteration)
+            self.queue.put(StopIteration)
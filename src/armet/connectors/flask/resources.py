@@ -3,6 +3,7 @@ from __future__ import absolute_import, unicode_literals, division
 import collections
 import flask
 from werkzeug.routing import BaseConverter
+from armet.resources.utils import connector_super
 from . import http
 
 
@@ -26,22 +27,28 @@ class Resource(object):
             path += '/'
 
         # Construct request and response wrappers.
-        async = cls.meta.asynchronous
-        request = http.Request(path=path, asynchronous=async)
-        response = http.Response(asynchronous=async)
+        asynchronous = cls.meta.asynchronous
+        request = http.Request(path=path, asynchronous=asynchronous)
+        response = http.Response(
+            asynchronous=asynchronous,
+            high_watermark=cls.meta.high_watermark,
+            low_watermark=cls.meta.low_watermark)
+
+        # The resource handler the connector was installed over.
+        view = connector_super(cls, Resource, 'view').view
 
         # Defer the execution thread if we're running asynchronously.
-        if async:
+        if asynchronous:
             # Defer the view to pass of control.
             import gevent
-            gevent.spawn(super(cls.__base__, cls).view, request, response)
+            gevent.spawn(view, request, response)
 
             # Construct and return the generator response.
             response._handle.response = cls.stream(response, response)
             return response._handle
 
         # Pass control off to the resource handler.
-        result = super(cls.__base__, cls).view(request, response)
+        result = view(request, response)
 
         if isinstance(result, collections.Iterator):
             # Construct and return the generator response.
@@ -4,9 +4,26 @@ import six
 import operator
 from functools import partial
 from six.moves import map, reduce
+from sqlalchemy import bindparam
+from sqlalchemy.exc import InvalidRequestError
+from sqlalchemy.orm import (
+    ColumnProperty, RelationshipProperty, joinedload, load_only)
+from armet import http
 from armet.exceptions import ImproperlyConfigured
+from armet.utils import LRUCache
 from armet.query import parser, Query, QuerySegment, constants
 
+try:
+    from sqlalchemy.orm import selectinload
+
+except ImportError:
+    # SQLAlchemy < 1.2; load collections with a subquery instead.
+    from sqlalchemy.orm import subqueryload as selectinload
+
+#! Whether collections are loaded with a subquery of the query itself;
+#! which cannot be combined with fetching the rows in batches.
+SUBQUERY_LOADS = selectinload.__name__ == 'subqueryload'
+
 
 class ModelResourceOptions(object):
 
@@ -18,10 +35,37 @@ class ModelResourceOptions(object):
                 'A session factory (via sessionmaker) is required by '
                 'the SQLAlchemy model connector.')
 
+        #! Relationship paths (eg. `user` or `user.groups`) to load along
+        #! with the items being read. By default these are derived from
+        #! the paths of the included attributes; an empty sequence
+        #! disables eager loading.
+        self.eager = meta.get('eager')
+
 
 def iequal_helper(x, y):
-    # Boolean values should use op.eq
-    return operator.eq(x, y) if issubclass(type(y), bool) else x.ilike(y)
+    # Boolean values should use op.eq; the value may be a bound parameter.
+    value = getattr(y, 'value', y)
+    return operator.eq(x, y) if issubclass(type(value), bool) else x.ilike(y)
+
+
+#! Number of rows to fetch at a time when streaming a list.
+STREAMING_BATCH_SIZE = 100
+
+#! Maximum number of clause templates to retain.
+CLAUSE_CACHE_SIZE = 512
+
+#! Name of the parameter bound to the nth value of a query.
+PARAMETER = 'armet_{}'
+
+#! Clause templates keyed by the resource and shape of the query.
+_clauses = LRUCache(CLAUSE_CACHE_SIZE)
+
+#! Maximum number of sets of loader options to retain.
+LOADER_CACHE_SIZE = 256
+
+#! Loader options (and whether they load a collection) keyed by the
+#! resource and requested fields.
+_loaders = LRUCache(LOADER_CACHE_SIZE)
 
 
 # Build an operator map to use for sqlalchemy.
@@ -35,39 +79,65 @@ OPERATOR_MAP = {
 }
 
 
-def build_segment(model, segment, attr):
+def build_segment(model, path, segment, values):
     # Get the associated column for the initial path.
-    path = segment.path.pop(0)
-    col = model.__dict__[path]
+    col = model.__dict__[path[0]]
 
     # Resolve the inner-most path segment.
-    if segment.path:
+    if len(path) > 1:
         return col.has(build_segment(
-            col.property.mapper.class_, segment, attr))
+            col.property.mapper.class_, path[1:], segment, values))
 
     # Determine the operator.
     op = OPERATOR_MAP[segment.operator]
 
     # Apply the operator to the values and return the expression
-    return reduce(operator.or_,
-                  map(partial(op, col),
-                      map(attr.try_clean, segment.values)))
+    return reduce(operator.or_, map(partial(op, col), values))
 
 
-def build_clause(query, attributes, model):
+def build_clause(query, attributes, model, operands=None):
+    """Constructs the expression that filters by the query.
+
+    @param[in] operands
+        An iterator over the operands to test against, in the order the
+        values appear in the query (eg. bound parameters); if not given
+        the cleaned values themselves are used.
+    """
     # Iterate through each query segment.
     clause = None
     last = None
     for seg in query.segments:
-        # Get the attribute in question.
-        attribute = attributes[seg.path[0]]
+        if isinstance(seg, Query):
+            # Construct the clause from the (parenthesized) group.
+            q = build_clause(seg, attributes, model, operands)
+
+        elif seg.values:
+            # Get the attribute in question.
+            attribute = attributes[seg.path[0]]
+
+            # Expand the initial path segment to the attribute path; the
+            # (shared) query itself is left untouched.
+            path = attribute.path.split('.') + list(seg.path[1:])
+
+            # Determine the values to test against.
+            if operands is None:
+                values = list(map(attribute.try_clean, seg.values))
+
+            else:
+                values = [next(operands) for _ in seg.values]
 
-        # Replace the initial path segment with the expanded
-        # attribute path.
-        seg.path[0:1] = attribute.path.split('.')
+            # Construct the clause from the segment.
+            q = build_segment(model, path, seg, values)
 
-        # Construct the clause from the segment.
-        q = build_segment(model, seg, attribute)
+        else:
+            # Segment only carries directives; nothing to filter on.
+            q = None
+
+        if q is None:
+            continue
+
+        if seg.negated:
+            q = ~q
 
         # Combine the segment with the last.
         clause = last.combinator(clause, q) if last is not None else q
@@ -77,6 +147,124 @@ def build_clause(query, attributes, model):
     return clause
 
 
+def query_shape(query, attributes, values):
+    """Describes the structure of the query apart from its values.
+
+    The cleaned values are appended to the passed list in the order they
+    appear in the query. Queries of the same shape filter through the same
+    expression with only the values bound to it differing.
+    """
+    shape = []
+    for seg in query.segments:
+        if isinstance(seg, Query):
+            shape.append((
+                query_shape(seg, attributes, values),
+                seg.negated, seg.combinator))
+
+        elif seg.values:
+            attribute = attributes[seg.path[0]]
+            cleaned = list(map(attribute.try_clean, seg.values))
+            values.extend(cleaned)
+
+            # The type of each value is part of the shape as it determines
+            # the operation (eg. booleans are never compared with LIKE).
+            shape.append((
+                tuple(seg.path), seg.operator, seg.negated, seg.combinator,
+                tuple(type(x) for x in cleaned)))
+
+    return tuple(shape)
+
+
+def compile_clause(resource, query, attributes, model):
+    """Retrieves the (cached) expression that filters by the query.
+
+    The expression is built once per resource and shape of query with
+    its values as bound parameters.
+
+    @returns
+        A tuple of the expression and the parameters to bind to it.
+    """
+    values = []
+    key = resource, query_shape(query, attributes, values)
+
+    clause = _clauses.get(key)
+    if clause is None:
+        # Build the template; null values are tested against directly
+        # as they alter the operation (eg. `IS NULL`).
+        operands = iter([
+            bindparam(PARAMETER.format(index), value)
+            if value is not None else None
+            for index, value in enumerate(values)])
+
+        clause = build_clause(query, attributes, model, operands)
+        _clauses.set(key, clause)
+
+    params = dict((PARAMETER.format(index), value)
+                  for index, value in enumerate(values)
+                  if value is not None)
+
+    return clause, params
+
+
+def build_load_options(model, paths):
+    """Constructs the loader options that eagerly load the relationships
+    traversed by the attribute paths.
+
+    Scalar relationships are joined into the query; collections are
+    loaded by a second query per relationship (rather than per row).
+
+    @returns
+        A tuple of the list of options and whether any of them loads
+        a collection.
+    """
+    options = []
+    collections = False
+    for path in sorted(set(paths)):
+        load = None
+        target = model
+        for name in path.split('.'):
+            # Resolve the relationship; stop at the first segment
+            # that is not one (eg. a column).
+            attribute = getattr(target, name, None)
+            prop = getattr(attribute, 'property', None)
+            if not isinstance(prop, RelationshipProperty):
+                break
+
+            strategy = selectinload if prop.uselist else joinedload
+            collections = collections or prop.uselist
+            if load is None:
+                load = strategy(attribute)
+
+            else:
+                load = getattr(load, strategy.__name__)(attribute)
+
+            target = prop.mapper.class_
+
+        if load is not None:
+            options.append(load)
+
+    return options, collections
+
+
+def build_column_options(model, paths):
+    """Constructs the loader option that restricts the selected columns to
+    those needed to resolve the attribute paths; or None if the columns
+    cannot be determined (eg. a path names a property).
+    """
+    columns = []
+    for path in paths:
+        attribute = getattr(model, path.split('.')[0], None)
+        prop = getattr(attribute, 'property', None)
+        if isinstance(prop, ColumnProperty):
+            columns.append(attribute)
+
+        elif not isinstance(prop, RelationshipProperty):
+            # Not a mapped property; which may read any column.
+            return None
+
+    return load_only(*columns) if columns else None
+
+
 class ModelResource(object):
     """Specializes the RESTFul model resource protocol for SQLAlchemy.
 
@@ -89,16 +277,159 @@ class ModelResource(object):
         # Establish a session using our session type object.
         self.session = self.meta.Session()
 
-    def filter(self, clause, queryset):
-        # Filter the queryset by the passed clause.
-        return queryset.filter(clause).distinct()
+    @staticmethod
+    def related_model(model, name):
+        """Retrieves the model targeted by the named relationship, if any.
+        """
+        try:
+            prop = getattr(model, name).property
+            if not prop.uselist:
+                # Scalar relationship; the value is an instance of
+                # the related model.
+                return prop.mapper.class_
+
+        except (AttributeError, InvalidRequestError):
+            # Not a relationship or the relationship is not yet resolvable.
+            pass
+
+    @classmethod
+    def load_options(cls, fields=None):
+        """Retrieves the loader options applied to a read of the passed
+        fields (or of every attribute).
+
+        The options are built on first use (once the mappers are
+        configured) and retained.
+        """
+        return cls._load_strategy(fields)[0]
+
+    @classmethod
+    def _load_strategy(cls, fields=None):
+        # Retrieve the loader options of a read of the passed fields and
+        # whether they load a collection.
+        key = cls, fields
+        strategy = _loaders.get(key)
+        if strategy is None:
+            attributes = list(six.itervalues(cls.attributes)
+                              if fields is None else
+                              (cls.attributes[x] for x in fields))
+
+            paths = [x.path for x in attributes if x.include and x.path]
+
+            # Load every relationship traversed by an included attribute
+            # unless told otherwise.
+            eager = cls.meta.eager
+            options, collections = build_load_options(
+                cls.meta.model, paths if eager is None else eager)
+
+            if fields is not None:
+                # Select only the columns of the requested fields (and
+                # those needed to identify the items).
+                option = build_column_options(
+                    cls.meta.model, paths + [cls.meta.slug.path])
+
+                if option is not None:
+                    options.append(option)
+
+            strategy = options, collections
+            _loaders.set(key, strategy)
+
+        return strategy
 
-    def read(self):
+    def filter(self, clause, queryset):
+        # Filter the queryset by the passed clause; related items are
+        # tested with `EXISTS` (rather than joined) so no item is repeated.
+        # Note that `DISTINCT` may not be combined with ordering by the
+        # columns of joined models (on PostgreSQL).
+        return queryset.filter(clause)
+
+    def resolve_column(self, path):
+        """Resolves the column named by the attribute path.
+
+        @returns
+            A tuple of the relationships traversed to reach the column
+            (eg. to be joined) and the column.
+        """
+        relationships = []
+        target = self.meta.model
+        names = path.split('.')
+        for name in names[:-1]:
+            relationship = getattr(target, name, None)
+            prop = getattr(relationship, 'property', None)
+            if not isinstance(prop, RelationshipProperty):
+                raise http.exceptions.BadRequest()
+
+            relationships.append(relationship)
+            target = prop.mapper.class_
+
+        column = getattr(target, names[-1], None)
+        if not isinstance(getattr(column, 'property', None), ColumnProperty):
+            # Not a column that the database can sort or filter by.
+            raise http.exceptions.BadRequest()
+
+        return relationships, column
+
+    def order(self, queryset):
+        sorting = self.sorting()
+        if not sorting and self.pagination() == (None, None, None):
+            # Neither sorted nor paginated; leave the order alone.
+            return queryset
+
+        # Sort by the requested attributes and then by the slug; pages are
+        # only stable over a consistent ordering.
+        joined = set()
+        for attribute, descending in sorting + [(self.meta.slug, False)]:
+            relationships, column = self.resolve_column(attribute.path)
+            for relationship in relationships:
+                if relationship.property.uselist:
+                    # A collection; the items would be repeated for each
+                    # of the related items.
+                    raise http.exceptions.BadRequest()
+
+                # Join the related model to sort by its column.
+                if relationship not in joined:
+                    queryset = queryset.outerjoin(relationship)
+                    joined.add(relationship)
+
+            queryset = queryset.order_by(
+                column.desc() if descending else column)
+
+        return queryset
+
+    def paginate(self, queryset):
+        limit, offset, after = self.pagination()
+
+        if after is not None:
+            # Begin the page after the passed item; this is an index scan
+            # rather than skipping over the preceding rows. The related
+            # models of a dotted slug were joined in order to sort by it.
+            _, column = self.resolve_column(self.meta.slug.path)
+            queryset = queryset.filter(column > after)
+
+        if offset:
+            queryset = queryset.offset(offset)
+
+        if limit is not None:
+            queryset = queryset.limit(limit)
+
+        return queryset
+
+    def select(self, slugs=None, operation='read'):
+        """Builds the query of the items being accessed; filtered by the
+        query string (or slug, or passed slugs) and by authorization
+        for the operation.
+        """
         # Initialize the query to the model.
         queryset = self.session.query(self.meta.model)
 
         query = None
-        if self.slug is not None:
+        if slugs is not None:
+            # Select each of the passed items at once.
+            query = Query(segments=[QuerySegment(
+                path=self.meta.slug.path.split('.'),
+                operator=constants.OPERATOR_EQUAL[0],
+                values=list(slugs))])
+
+        elif self.slug is not None:
             # This is an item-access (eg. GET /<name>/:slug); ignore the
             # query string and generate a query-object based on the slug.
             query = Query(segments=[QuerySegment(
@@ -109,21 +440,55 @@ class ModelResource(object):
         elif self.request.query:
             # This is a list-access; use the query string and construct
             # a query object from it.
-            query = parser.parse(self.request.query)
+            try:
+                query = parser.parse(self.request.query)
+
+            except ValueError:
+                # The query string is malformed.
+                raise http.exceptions.BadRequest()
 
         # Determine if we need to filter the queryset in some way; and if so,
         # filter it.
         clause = None
         if query is not None:
-            clause = build_clause(query, self.attributes, self.meta.model)
-            queryset = self.filter(clause, queryset)
+            clause, params = compile_clause(
+                type(self), query, self.attributes, self.meta.model)
+
+            queryset = self.filter(clause, queryset).params(params)
 
         # Filter the queryset by asserting authorization.
-        queryset = self.meta.authorization.filter(
-            self.request.user, 'read', self, queryset)
+        return self.meta.authorization.filter(
+            self.request.user, operation, self, queryset)
+
+    def read(self):
+        # Select the items; loading the related items that will be
+        # prepared along with them.
+        options, collections = self._load_strategy(self.fields())
+        queryset = self.select().options(*options)
+
+        if self.slug is not None:
+            # Attempt to return just the single result we should have.
+            return queryset.first()
+
+        # Order the queryset and restrict it to the requested page.
+        queryset = self.paginate(self.order(queryset))
+
+        if self.meta.streaming:
+            if collections and SUBQUERY_LOADS:
+                # The collections would be loaded for a batch of rows at a
+                # time by re-running the query; fetch the rows at once.
+                return iter(queryset)
+
+            # Return the query itself to be iterated over lazily; fetching
+            # the rows in batches.
+            return queryset.yield_per(STREAMING_BATCH_SIZE)
 
-        # Return the queryset.
-        return queryset.all() if self.slug is None else queryset.first()
+        # Return the entire queryset.
+        return queryset.all()
+
+    def count_items(self):
+        # Count the items in the database rather than reading them.
+        return self.select().count()
 
     def create(self, data):
         # Instantiate a new target.
@@ -178,3 +543,100 @@ class ModelResource(object):
 
         # Commit the session.
         self.session.commit()
+
+    def targets(self, data):
+        """Reads the items identified by the slugs of the cleaned items
+        of the data; in a single query.
+        """
+        slugs = [self.item_slug(x) for x in data]
+        if not slugs:
+            return []
+
+        if any(slug is None for slug in slugs):
+            # Each item must identify its target.
+            raise http.exceptions.BadRequest()
+
+        found = dict((self.meta.slug.get(x), x)
+                     for x in self.select(slugs=slugs))
+
+        try:
+            return [found[slug] for slug in slugs]
+
+        except KeyError:
+            # An item does not exist; nothing is changed.
+            raise http.exceptions.NotFound()
+
+    def authorize(self, operation, targets):
+        # Ensure the user is authorized to perform this action on all
+        # of the targets before any of them is changed.
+        authz = self.meta.authorization
+        _, denied = authz.authorize_many(
+            self.request.user, operation, self, targets)
+
+        if denied:
+            # Discard the changes made to the targets (which may have
+            # been flushed by a query of the authorization).
+            self.session.rollback()
+            authz.unauthorized()
+
+    def commit(self):
+        # Commit the session without expiring the committed items; they
+        # are prepared in the response as they were written rather than
+        # being reloaded one by one.
+        expire = self.session.expire_on_commit
+        self.session.expire_on_commit = False
+        try:
+            self.session.commit()
+
+        finally:
+            self.session.expire_on_commit = expire
+
+    def create_many(self, data):
+        targets = []
+        for item in data:
+            # Instantiate a new target and set each attribute on it.
+            target = self.meta.model()
+            for name, attribute in six.iteritems(self.attributes):
+                value = item.get(name)
+                if value is not None:
+                    attribute.set(target, value)
+
+            targets.append(target)
+
+        self.authorize('create', targets)
+
+        # Add the targets to the session and insert them in a single
+        # transaction.
+        self.session.add_all(targets)
+        self.commit()
+
+        return targets
+
+    def update_many(self, data):
+        # Grab the existing targets.
+        targets = self.targets(data)
+
+        for target, item in zip(targets, data):
+            # Set each of the passed attributes on the target.
+            for name, attribute in six.iteritems(self.attributes):
+                if name in item:
+                    attribute.set(target, item[name])
+
+        self.authorize('update', targets)
+
+        # Update the targets in a single transaction.
+        self.commit()
+
+        return targets
+
+    def destroy_many(self):
+        # Grab the existing targets matched by the query.
+        targets = self.select(operation='destroy').all()
+
+        self.authorize('destroy', targets)
+
+        # Remove the targets in a single transaction.
+        for target in targets:
+            self.session.delete(target)
+
+        self.session.commit()
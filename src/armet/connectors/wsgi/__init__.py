@@ -0,0 +1,8 @@
+# -*- coding: utf-8 -*-
+from __future__ import absolute_import, unicode_literals, division
+from .resources import Application, application
+
+__all__ = [
+    'Application',
+    'application'
+]
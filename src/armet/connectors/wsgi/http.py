@@ -0,0 +1,227 @@
+# -*- coding: utf-8 -*-
+from __future__ import absolute_import, unicode_literals, division
+import six
+from wsgiref.util import request_uri
+from armet import http
+
+
+def _text(value):
+    """Decodes a string from the WSGI environ as UTF-8 text.
+
+    WSGI (PEP 3333) passes the strings of the environ as latin-1 decoded
+    native strings on python 3 and as bytes on python 2.
+    """
+    if six.PY3:
+        value = value.encode('latin1')
+
+    return value.decode('utf8', 'replace')
+
+
+class RequestHeaders(http.request.Headers):
+
+    def __init__(self, environ):
+        #! Header values keyed by their lower-cased name.
+        self._store = store = {}
+
+        #! Header names in Http-Header-Case.
+        self._names = names = []
+
+        # Pull the headers out of the environ once; each is present
+        # as HTTP_<NAME> save for the content type and length.
+        for key, value in six.iteritems(environ):
+            if key.startswith('HTTP_'):
+                key = key[5:]
+
+            elif key not in ('CONTENT_TYPE', 'CONTENT_LENGTH') or not value:
+                continue
+
+            name = self.normalize(key.replace('_', '-'))
+            store[name.lower()] = value
+            names.append(name)
+
+        # Continue the initialization.
+        super(RequestHeaders, self).__init__()
+
+    def __getitem__(self, name):
+        return self._store[name.lower()]
+
+    def __iter__(self):
+        return iter(self._names)
+
+    def __len__(self):
+        return len(self._names)
+
+    def __contains__(self, name):
+        return name.lower() in self._store
+
+
+class RequestInput(object):
+    """
+    Reads the input stream of the request without reading past the
+    end of the body; the stream itself is not required to stop there
+    (eg. on a persistent connection).
+    """
+
+    def __init__(self, stream, length):
+        #! The input stream of the request.
+        self._stream = stream
+
+        #! Number of bytes remaining in the body.
+        self._remaining = length
+
+    def _limit(self, count):
+        if count is None or count < 0 or count > self._remaining:
+            return self._remaining
+
+        return count
+
+    def read(self, count=-1):
+        chunk = self._stream.read(self._limit(count))
+        self._remaining -= len(chunk)
+        return chunk
+
+    def readline(self, count=-1):
+        chunk = self._stream.readline(self._limit(count))
+        self._remaining -= len(chunk)
+        return chunk
+
+
+class Request(http.Request):
+
+    def __init__(self, environ, *args, **kwargs):
+        #! The WSGI environ of the request.
+        self._environ = environ
+
+        # Initialize the request headers.
+        self.headers = RequestHeaders(environ)
+
+        # Set the method and body of the request; the body is read from
+        # the input stream as needed.
+        length = environ.get('CONTENT_LENGTH')
+        length = int(length) if length and length.isdigit() else 0
+        body = RequestInput(environ['wsgi.input'], length) if length else b''
+        kwargs.update(body=body)
+        kwargs.update(method=environ['REQUEST_METHOD'])
+
+        # Continue the initialization.
+        super(Request, self).__init__(*args, **kwargs)
+
+    @property
+    def protocol(self):
+        return self._environ['wsgi.url_scheme'].upper()
+
+    @property
+    def mount_point(self):
+        environ = self._environ
+        path = _text(environ.get('SCRIPT_NAME', '') +
+                     environ.get('PATH_INFO', ''))
+        return path.rsplit(self.path)[0] if self.path else path
+
+    @property
+    def query(self):
+        return _text(self._environ.get('QUERY_STRING', ''))
+
+    @property
+    def uri(self):
+        return request_uri(self._environ)
+
+
+class ResponseHeaders(http.response.Headers):
+
+    def __init__(self, response):
+        #! Reference to the response object.
+        self._response = response
+
+        #! Tuples of the Http-Header-Case name and the value of each
+        #! header keyed by the lower-cased name.
+        self._store = {}
+
+        # Continue the initialization.
+        super(ResponseHeaders, self).__init__()
+
+    def __setitem__(self, name, value):
+        self._response.require_open()
+        self._store[name.lower()] = (self.normalize(name), value)
+
+    def __getitem__(self, name):
+        return self._store[name.lower()][1]
+
+    def __contains__(self, name):
+        return name.lower() in self._store
+
+    def __delitem__(self, name):
+        self._response.require_open()
+        del self._store[name.lower()]
+
+    def __len__(self):
+        return len(self._store)
+
+    def __iter__(self):
+        return (name for name, _ in six.itervalues(self._store))
+
+
+class Response(http.Response):
+
+    def __init__(self, *args, **kwargs):
+        #! The status code of the response.
+        self._status = http.client.OK
+
+        # Complete the initialization.
+        super(Response, self).__init__(*args, **kwargs)
+
+        # If we're dealing with an asynchronous response, we need
+        # to have an asynchronous queue to give to WSGI.
+        if self.asynchronous:
+            self.queue = http.queue.GeventQueue(
+                self.high_watermark, self.low_watermark)
+
+        # Initialize the response headers.
+        self.headers = ResponseHeaders(self)
+
+    def __iter__(self):
+        # Return the asynchronous queue.
+        return self.queue
+
+    @property
+    def status(self):
+        return self._status
+
+    @status.setter
+    def status(self, value):
+        self.require_open()
+        self._status = value
+
+    @property
+    def status_line(self):
+        """The status of the response as expected by `start_response`."""
+        reason = http.client.responses.get(self._status, '')
+        return str('{} {}'.format(self._status, reason))
+
+    @property
+    def header_list(self):
+        """The headers of the response as expected by `start_response`."""
+        return [(name, str(value))
+                for name, value in six.itervalues(self.headers._store)]
+
+    @http.Response.body.setter
+    def body(self, value):
+        if value:
+            if self.asynchronous:
+                # Unset the underlying store.
+                super(Response, Response).body.__set__(self, None)
+
+                # Write the chunk to the asynchronous queue.
+                self.queue.put(value)
+                return
+
+        # Set the underlying store.
+        super(Response, Response).body.__set__(self, value)
+
+    def close(self):
+        # Perform general clean-up and a final flush.
+        super(Response, self).close()
+
+        if self.asynchronous:
+            # Close the asynchronous queue and terminate the connection
+            # to the client.
+            self.queue.put(StopIteration)
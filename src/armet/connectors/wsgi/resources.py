@@ -0,0 +1,109 @@
+# -*- coding: utf-8 -*-
+from __future__ import absolute_import, unicode_literals, division
+import re
+import collections
+from armet import http as base_http
+from armet.resources.utils import connector_super
+from . import http
+
+
+class Application(object):
+    """A WSGI application that routes requests to mounted resources.
+
+    @code
+        application = Application()
+        PollResource.mount('/api/', application)
+    @endcode
+    """
+
+    def __init__(self):
+        #! Mounted resources as tuples of the compiled pattern that
+        #! matches their requests and the resource.
+        self.routes = []
+
+    def mount(self, url, resource):
+        """Routes requests beneath `url` followed by the resource name
+        to the passed resource.
+        """
+        pattern = r'^{}{}($|[/:(.].*)'.format(
+            re.escape(url), re.escape(resource.meta.name))
+        self.routes.append((re.compile(pattern, re.DOTALL), resource))
+
+    def __call__(self, environ, start_response):
+        path = http._text(environ.get('PATH_INFO', '')) or '/'
+        for pattern, resource in self.routes:
+            match = pattern.match(path)
+            if match is not None:
+                # Pass control off to the resource.
+                return resource.view(environ, start_response, match.group(1))
+
+        # Nothing is mounted here.
+        status = base_http.client.NOT_FOUND
+        start_response(str('{} {}'.format(
+            status, base_http.client.responses[status])), [])
+        return []
+
+
+#! The default application that resources are mounted on.
+application = _default = Application()
+
+
+class Resource(object):
+
+    @classmethod
+    def view(cls, environ, start_response, path=''):
+        # Construct request and response wrappers.
+        asynchronous = cls.meta.asynchronous
+        request = http.Request(
+            environ, path=path, asynchronous=asynchronous)
+        response = http.Response(
+            asynchronous=asynchronous,
+            high_watermark=cls.meta.high_watermark,
+            low_watermark=cls.meta.low_watermark)
+
+        # The resource handler the connector was installed over.
+        view = connector_super(cls, Resource, 'view').view
+
+        # Defer the execution thread if we're running asynchronously.
+        if asynchronous:
+            # Defer the view to pass of control.
+            import gevent
+            gevent.spawn(view, request, response)
+
+            # Construct a streamer; this waits on the first chunk so the
+            # status and headers are known by the time it returns.
+            result = cls.stream(response, response)
+
+        else:
+            # Pass control off to the resource handler.
+            result = view(request, response)
+
+        # Start the response.
+        start_response(response.status_line, response.header_list)
+
+        if environ['REQUEST_METHOD'] == 'HEAD':
+            if isinstance(result, collections.Iterator):
+                # Run the streamed response through so the handler
+                # finishes; its chunks are not sent.
+                for _ in result:
+                    pass
+
+            # The response to `HEAD` has no body.
+            return []
+
+        if isinstance(result, collections.Iterator):
+            # Return the streamed response.
+            return result
+
+        # Return the body of the response, if any.
+        return [result] if result else []
+
+    @classmethod
+    def mount(cls, url='/', application=None):
+        if application is None:
+            # If no explicit application is passed; use
+            # the default application.
+            application = _default
+
+        # Route requests for this resource from the application.
+        application.mount(url, cls)
@@ -1,5 +1,6 @@
 # -*- coding: utf-8 -*-
 from __future__ import absolute_import, unicode_literals, division
+import six
 
 
 class Deserializer(object):
@@ -20,11 +21,19 @@ class Deserializer(object):
             # The object was of an unsupported type.
             return False
 
-    def deserialize(self, text=None):
+    def deserialize(self, text=None, encoding='utf8'):
         """Parses the text into a format consumable by python.
 
+        @param[in] text
+            The text to parse; or the bytes of it (in the passed
+            encoding).
+
         @throws ValueError
             To indicate this deserializer cannot deserialize the
             passed text.
         """
+        if isinstance(text, six.binary_type):
+            # Ensure the text is decoded.
+            text = text.decode(encoding)
+
         return text
@@ -25,8 +25,18 @@ class URLDeserializer(Deserializer):
         try:
             # Attempt to desserialize the URL using the
             # URL decoder.
+            kwargs = {}
+            if six.PY3:
+                # Parse the text; decoding the escaped octets in the
+                # encoding as well.
+                if isinstance(text, six.binary_type):
+                    text = text.decode(encoding)
+
+                kwargs.update(encoding=encoding)
+
             data = OrderedDict()
-            for name, value in parse_qsl(text, keep_blank_values=True):
+            pairs = parse_qsl(text, keep_blank_values=True, **kwargs)
+            for name, value in pairs:
                 # Ensure values are properly decoded if neccessary.
                 if isinstance(value, six.binary_type):
                     value = value.decode(encoding)
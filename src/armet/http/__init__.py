@@ -5,13 +5,14 @@ from __future__ import absolute_import, unicode_literals, division
 from six.moves import http_client as client
 from .request import Request
 from .response import Response
-from . import exceptions
+from . import exceptions, queue
 
 __all__ = [
     'client',
     'Request',
     'Response',
-    'exceptions'
+    'exceptions',
+    'queue'
 ]
 
 try:
@@ -0,0 +1,120 @@
+# -*- coding: utf-8 -*-
+from __future__ import absolute_import, unicode_literals, division
+import six
+
+
+class Queue(object):
+    """Describes the queue of the chunks of an asynchronous response that
+    have yet to be sent to the client.
+
+    The queue is bounded by watermarks (in bytes); once the depth of the
+    queue reaches the high watermark the producer is paused until the
+    client has been sent enough of it that the depth is down to the low
+    watermark. How the producer is paused depends on the implementation
+    of the queue (eg. it blocks the greenlet that writes to the response).
+
+    The end of the response is queued as `StopIteration`.
+    """
+
+    def __init__(self, high_watermark=None, low_watermark=None):
+        #! Depth (in bytes) at which the producer is paused; None to
+        #! leave the queue unbounded.
+        self.high_watermark = high_watermark
+
+        #! Depth (in bytes) at which a paused producer is resumed.
+        self.low_watermark = low_watermark or 0
+
+        #! Number of bytes in the queue.
+        self.depth = 0
+
+        #! Greatest number of bytes that were in the queue at once.
+        self.peak = 0
+
+        #! Number of times the producer was paused.
+        self.pauses = 0
+
+        #! True while the producer is paused.
+        self.paused = False
+
+    def _enter(self, chunk):
+        """Accounts for a chunk put on the queue.
+
+        @returns
+            True if the producer is to be paused.
+        """
+        if chunk is StopIteration:
+            return False
+
+        self.depth += len(chunk)
+        if self.depth > self.peak:
+            self.peak = self.depth
+
+        high = self.high_watermark
+        if high is None or self.paused or self.depth < high:
+            return False
+
+        self.paused = True
+        self.pauses += 1
+        return True
+
+    def _leave(self, chunk):
+        """Accounts for a chunk taken off of the queue.
+
+        @returns
+            True if a paused producer is to be resumed.
+        """
+        if chunk is StopIteration:
+            return False
+
+        self.depth -= len(chunk)
+        if not self.paused or self.depth > self.low_watermark:
+            return False
+
+        self.paused = False
+        return True
+
+
+class GeventQueue(Queue, six.Iterator):
+    """Queue that blocks the greenlet that writes to the response while
+    it is paused.
+    """
+
+    def __init__(self, *args, **kwargs):
+        from gevent import queue, event
+
+        super(GeventQueue, self).__init__(*args, **kwargs)
+
+        #! The underlying (unbounded) queue of the chunks.
+        self._queue = queue.Queue()
+
+        #! Set while the producer may continue.
+        self._resumed = event.Event()
+        self._resumed.set()
+
+    def put(self, chunk):
+        """Puts the chunk on the queue; blocking while paused."""
+        self._queue.put(chunk)
+        if self._enter(chunk):
+            self._resumed.clear()
+
+        if self.paused:
+            # Wait for the client to catch up.
+            self._resumed.wait()
+
+    def get(self):
+        """Takes the next chunk off of the queue; waiting for one."""
+        chunk = self._queue.get()
+        if self._leave(chunk):
+            self._resumed.set()
+
+        return chunk
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        chunk = self.get()
+        if chunk is StopIteration:
+            raise StopIteration()
+
+        return chunk
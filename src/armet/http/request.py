@@ -32,7 +32,8 @@ class Headers(collections.Mapping):
             self._headers = headers
 
         def __missing__(self, name):
-            self[name] = value = self.headers._Header(self, name)
+            # Split the values of the header once; on first access.
+            self[name] = value = self._headers._Header(self, name)
             return value
 
     def __init__(self):
@@ -92,11 +93,14 @@ class Request(six.Iterator):
     headers = None
 
     def __init__(self, body, path, method, asynchronous, *args, **kwargs):
-        #! The body of the request.
-        self.body = body
+        #! The body of the request; either its bytes or a file-like object
+        #! to read them from (limited to the length of the body). Nothing
+        #! is read from a file-like object until the body is accessed.
+        self._body = body
 
-        #! A file interface over the body of the request.
-        self._stream = io.BytesIO(self.body)
+        #! A file interface over the body of the request; created on
+        #! first use.
+        self._stream_ = None
 
         #! The captured path of the request, after the mount point.
         #! Example: GET /api/poll/23 => '/23'
@@ -105,27 +109,83 @@ class Request(six.Iterator):
         #! True if we're asynchronous.
         self.asynchronous = asynchronous
 
-        # Determine the actual HTTP method; apply the override header.
-        override = self.headers.get('X-Http-Method-Override')
-        if override:
-            # Passed method was overriden; store override.
-            self.method = override.upper()
+        #! The HTTP method the request was made with; the override header
+        #! is applied on first access of `method`.
+        self._method = method
+        self._method_overridden = False
 
-        else:
-            # Passed method is the actual method.
-            self.method = method.upper()
+        #! Cookie jar of the request; parsed on first access of `cookies`.
+        self._cookies = None
 
-        #! Cookie jar full of python morsel objects that represent the
-        #! cookies that were sent with the request.
-        text = self.get('Cookie')
-        self.cookies = http_cookies.SimpleCookie()
-        if text:
-            self.cookies.load(str(text))
+        #! The `Content-Type` of the request parsed into a tuple of its
+        #! primary type, subtype and parameters (or an empty tuple if not
+        #! given); parsed on first need.
+        self._content_type = None
 
         #! A reference to the bound resource; this is set in the resource
         #! view method after traversal.
         self._resource = None
 
+    @property
+    def method(self):
+        """The (upper-cased) HTTP method of the request; as overridden by
+        the `X-Http-Method-Override` header, if given.
+        """
+        if not self._method_overridden:
+            # Determine the actual HTTP method; apply the override header.
+            override = self.headers.get('X-Http-Method-Override')
+            self._method = (override or self._method).upper()
+            self._method_overridden = True
+
+        return self._method
+
+    @method.setter
+    def method(self, value):
+        self._method = value
+        self._method_overridden = True
+
+    @property
+    def cookies(self):
+        """
+        Cookie jar full of python morsel objects that represent the
+        cookies that were sent with the request.
+        """
+        if self._cookies is None:
+            self._cookies = http_cookies.SimpleCookie()
+            text = self.get('Cookie')
+            if text:
+                self._cookies.load(str(text))
+
+        return self._cookies
+
+    @property
+    def _stream(self):
+        """A file interface over the body of the request."""
+        if self._stream_ is None:
+            if hasattr(self._body, 'read'):
+                # Read the body as needed from its source.
+                self._stream_ = self._body
+
+            else:
+                # Wrap the bytes; this shares (rather than copies) them
+                # until written to.
+                self._stream_ = io.BytesIO(self._body or b'')
+
+        return self._stream_
+
+    @property
+    def body(self):
+        """The entire body of the request.
+
+        A body that is read as needed is read in full (from where it
+        was read up to) on first access.
+        """
+        if hasattr(self._body, 'read'):
+            self._body = self._stream.read()
+            self._stream_ = None
+
+        return self._body
+
     def bind(self, resource):
         """Binds this to the passed resource object.
 
@@ -170,11 +230,16 @@ class Request(six.Iterator):
         Reads the charset value from the `Content-Type` header, if available;
         else, returns nothing.
         """
-        # Get the `Content-Type` header, if available.
-        content_type = self.headers.get('Content-Type')
-        if content_type:
-            # Parse out the primary type and parameters from the media type.
-            ptype, _, params = mimeparse.parse_mime_type(content_type)
+        if self._content_type is None:
+            # Get the `Content-Type` header, if available, and parse out
+            # the primary type and parameters from the media type.
+            content_type = self.headers.get('Content-Type')
+            self._content_type = (
+                mimeparse.parse_mime_type(content_type)
+                if content_type else ())
+
+        if self._content_type:
+            ptype, _, params = self._content_type
 
             # Return the specified charset or the default depending on the
             # primary type.
@@ -191,14 +256,16 @@ class Request(six.Iterator):
             # Chunk was empty; return an empty string.
             return ''
 
+        if deserialize or format is not None:
+            # Deserialize the chunk using the passed format; the
+            # deserializer decodes the bytes itself.
+            chunk, _ = self._resource.deserialize(chunk, format=format)
+            return chunk
+
         if type(chunk) is six.binary_type:
             # If received a byte string; decode it.
             chunk = chunk.decode(self.encoding)
 
-        if deserialize or format is not None:
-            # Deserialize the chunk using the passed format.
-            chunk, _ = self._resource.deserialize(chunk, format=format)
-
         # Whatever else we were passed; return it.
         return chunk
 
@@ -216,7 +283,10 @@ class Request(six.Iterator):
             done. If not provided, the content-type header is looked at to
             determine an appropriate deserializer.
         """
-        return self._coerce(self._stream.read(count), deserialize, format)
+        # Not every stream takes a negative count to mean the rest of
+        # it (eg. django's `LimitedStream`); the count is not forwarded.
+        chunk = self._stream.read() if count < 0 else self._stream.read(count)
+        return self._coerce(chunk, deserialize, format)
 
     def readline(self, count=-1, deserialize=False, format=None):
         """Read and return one line from the stream.
@@ -234,7 +304,10 @@ class Request(six.Iterator):
             This is not the method that connectors will override; refer to
             `self._readline` instead.
         """
-        return self._coerce(self._stream.readline(count), deserialize, format)
+        # Like `read`; a negative count is not forwarded.
+        stream = self._stream
+        line = stream.readline() if count < 0 else stream.readline(count)
+        return self._coerce(line, deserialize, format)
 
     def deserialize(self, format=None):
         """Deserializes the request body using a determined deserializer.
@@ -248,7 +321,7 @@ class Request(six.Iterator):
             A tuple of the deserialized data and an instance of the
             deserializer used.
         """
-        return self._resource.deserialize(self.read(), format=format)
+        return self._resource.deserialize(self._stream.read(), format=format)
 
     def __iter__(self):
         """File-like objects are implicitly iterators."""
@@ -4,11 +4,18 @@ import collections
 import abc
 import six
 import mimeparse
-import io
+import hashlib
+from email.utils import parsedate_tz, mktime_tz
 from armet import exceptions
 from . import request, client
 
 
+def _opaque_tag(tag):
+    """Strips the weakness indicator from an entity tag."""
+    tag = tag.strip()
+    return tag[2:] if tag.startswith('W/') else tag
+
+
 class Headers(collections.MutableMapping, request.Headers):
     """Describes a mutable mapping abstraction over response headers.
     """
@@ -132,6 +139,12 @@ class Response(object):
     #! set by the dervied class to an instance of a derived Headers class.
     headers = None
 
+    #! Queue of the chunks of an asynchronous response yet to be sent to
+    #! the client; set by the derived class to an instance of a derived
+    #! `armet.http.queue.Queue` class. Its `depth`, `peak` and `pauses`
+    #! describe how far behind the client is.
+    queue = None
+
     def __init__(self, asynchronous, *args, **kwargs):
         #! True if the response object is closed.
         self._closed = False
@@ -142,6 +155,20 @@ class Response(object):
         #! True if we're asynchronous.
         self.asynchronous = asynchronous
 
+        #! Bounds (in bytes) of the queue of the chunks of an asynchronous
+        #! response; see `ResourceOptions.high_watermark`.
+        self.high_watermark = kwargs.get('high_watermark')
+        self.low_watermark = kwargs.get('low_watermark')
+
+        #! True if the body is written (so that its length and entity tag
+        #! are described) but is not sent; eg. in response to `HEAD`.
+        self.head = False
+
+        #! True to derive a strong entity tag (`ETag`) from the body when
+        #! the response is closed (unless one was set) and to answer with
+        #! `304 Not Modified` if the client already has that body.
+        self.conditional = False
+
         #! Default the status code to OK.
         self.status = client.OK
 
@@ -155,8 +182,12 @@ class Response(object):
         #! via the standard rules.
         self._encoding = None
 
-        #! The underlying file stream to write incoming data to.
-        self._stream = io.BytesIO()
+        #! The chunks of bytes written to the response that are not yet
+        #! flushed; joined once when they are.
+        self._chunks = []
+
+        #! The total length of the chunks not yet flushed.
+        self._length = 0
 
         #! The content chunk to return to the client.
         self._body = None
@@ -243,19 +274,79 @@ class Response(object):
         # Ensure we're not closed.
         self.require_not_closed()
 
-        if not self.streaming or self.asynchronous:
-            # We're not streaming, auto-write content-length if not
-            # already set.
+        if (self.conditional and not self.streaming
+                and self.status == client.OK):
+            if 'ETag' not in self.headers:
+                # Tag the body that is about to be sent.
+                self.headers['ETag'] = self.entity_tag()
+
+            if self.is_not_modified(self._resource._request):
+                # The client already has this body.
+                self.not_modified()
+
+        if not self.streaming and self.status != client.NOT_MODIFIED:
+            # We're not streaming (the headers of an asynchronous response
+            # are sent with its first chunk), auto-write content-length if
+            # not already set.
             if 'Content-Length' not in self.headers:
                 self.headers['Content-Length'] = self.tell()
 
         # Flush out the current buffer.
-        self.flush()
+        self._release()
 
         # We're done with the response; inform the HTTP connector
         # to close the response stream.
         self._closed = True
 
+    def getvalue(self):
+        """Returns the body written so far that has not been sent."""
+        return b''.join([self._body or b''] + self._chunks)
+
+    def entity_tag(self):
+        """Derives a strong entity tag from the (unsent) body."""
+        return '"{}"'.format(hashlib.sha1(self.getvalue()).hexdigest())
+
+    def is_not_modified(self, request):
+        """
+        Tests if the representation cached by the client (as described by
+        the conditional headers of the request) matches the validators
+        (`ETag` and `Last-Modified`) of this response.
+        """
+        if request.method not in ('GET', 'HEAD'):
+            # Only safe requests are answered with `304 Not Modified`.
+            return False
+
+        matches = request.get('If-None-Match')
+        if matches:
+            # The entity tag takes precedence over the modification date.
+            tag = self.headers.get('ETag')
+            if not tag:
+                return False
+
+            # Compare the tags weakly; as must be done for `If-None-Match`.
+            tags = set(_opaque_tag(x) for x in matches.split(','))
+            return '*' in tags or _opaque_tag(tag) in tags
+
+        since = request.get('If-Modified-Since')
+        modified = self.headers.get('Last-Modified')
+        if since and modified:
+            since, modified = parsedate_tz(since), parsedate_tz(modified)
+            if since is not None and modified is not None:
+                return mktime_tz(modified) <= mktime_tz(since)
+
+        return False
+
+    def not_modified(self):
+        """
+        Discards the body and informs the client that its cached
+        representation is current.
+        """
+        self.require_open()
+        self._chunks = []
+        self._length = 0
+        self._body = None
+        self.status = client.NOT_MODIFIED
+
     @property
     def closed(self):
         """True if the stream is closed."""
@@ -267,7 +358,7 @@ class Response(object):
         This does not include data that has been flushed or set directly
         on the body.
         """
-        return self._stream.tell() + len(self._body or '')
+        return self._length + len(self._body or b'')
 
     def write(self, chunk, serialize=False, format=None):
         """Writes the given chunk to the output buffer.
@@ -307,7 +398,8 @@ class Response(object):
 
         if type(chunk) is six.binary_type:
             # If passed a byte string, we hope the user encoded it properly.
-            self._stream.write(chunk)
+            self._chunks.append(chunk)
+            self._length += len(chunk)
 
         elif isinstance(chunk, six.string_types):
             encoding = self.encoding
@@ -321,19 +413,51 @@ class Response(object):
                     'Attempting to write textual data without an encoding.')
 
             # Write the encoded data into the byte stream.
-            self._stream.write(chunk)
+            self._chunks.append(chunk)
+            self._length += len(chunk)
 
         elif isinstance(chunk, collections.Iterable):
-            # If passed some kind of iterator, attempt to recurse into
-            # oblivion.
-            for section in chunk:
-                self.write(section)
+            # If passed some kind of iterator, write each of its chunks.
+            self.writelines(chunk)
 
         else:
             # Bail; we have no idea what to do with this.
             raise exceptions.InvalidOperation(
                 'Attempting to write something not recognized.')
 
+    def writelines(self, chunks):
+        """Writes each of the chunks of the iterable to the output buffer.
+
+        @param[in] chunks
+            An iterable of byte arrays or unicode strings (or anything else
+            that `write` accepts).
+        """
+
+        # Ensure we're not closed.
+        self.require_not_closed()
+
+        append = self._chunks.append
+        encoding = None
+        for chunk in chunks:
+            if type(chunk) is not six.binary_type:
+                if not isinstance(chunk, six.string_types):
+                    # Leave anything else to `write`.
+                    self.write(chunk)
+                    continue
+
+                if encoding is None:
+                    encoding = self.encoding
+                    if encoding is None:
+                        # Bail; we don't have an encoding.
+                        raise exceptions.InvalidOperation(
+                            'Attempting to write textual data without '
+                            'an encoding.')
+
+                chunk = chunk.encode(encoding)
+
+            append(chunk)
+            self._length += len(chunk)
+
     def serialize(self, data, format=None):
         """Serializes the data into this response using a serializer.
 
@@ -363,18 +487,32 @@ class Response(object):
         # Ensure we're not closed.
         self.require_not_closed()
 
-        # Pull out the accumulated chunk.
-        chunk = self._stream.getvalue()
-        self._stream.truncate(0)
-        self._stream.seek(0)
-
-        # Append the chunk to the body.
-        self.body = chunk if (self._body is None) else (self._body + chunk)
+        if self.streaming or self.asynchronous:
+            # Hand the written chunks to the transport. Otherwise, nothing
+            # is sent before the response is closed; the chunks are kept
+            # until then (rather than being appended to the body on each
+            # flush).
+            self._release()
 
         if self.asynchronous:
             # We are now streaming because we're asynchronous.
             self.streaming = True
 
+    def _release(self):
+        # Join the written chunks onto the body that has not been sent.
+        chunks = self._chunks
+        if self._body:
+            chunks.insert(0, self._body)
+
+        self._chunks = []
+        self._length = 0
+        if self.head:
+            # The body is described but not sent.
+            self.body = None
+            return
+
+        self.body = b''.join(chunks)
+
     def send(self, *args, **kwargs):
         """Writes the passed chunk and flushes it to the client."""
         self.write(*args, **kwargs)
@@ -1,9 +1,10 @@
 # -*- coding: utf-8 -*-
 from __future__ import absolute_import, unicode_literals, division
+import re
 import six
 from six.moves import cStringIO as StringIO
 import operator
-from itertools import chain
+from armet.utils import LRUCache
 from . import constants
 
 
@@ -13,10 +14,6 @@ COMBINATORS = {
     constants.LOGICAL_OR: operator.or_}
 
 
-#! Set of characters that begin an operator.
-OPERATOR_BEGIN_CHARS = set(x[0] for _, x in constants.OPERATORS if x)
-OPERATOR_BEGIN_CHARS.add(constants.NEGATION[1])
-
 #! Dictionary of operator symbols to operators.
 OPERATOR_SYMBOL_MAP = dict((v, k) for k, v in constants.OPERATORS if v)
 
@@ -24,15 +21,79 @@ OPERATOR_SYMBOL_MAP = dict((v, k) for k, v in constants.OPERATORS if v)
 #! List of operator keywords.
 OPERATOR_KEYWORDS = set(k for k, _ in constants.OPERATORS)
 
+#! Maximum number of parsed queries to retain; the least recently
+#! used query is evicted once the cache is full.
+CACHE_SIZE = 256
+
+#! Parsed queries keyed by their text.
+_cache = LRUCache(CACHE_SIZE)
+
+#! Operator of a segment that does not state one.
+_DEFAULT_OPERATOR = constants.OPERATOR_IEQUAL[0]
+
+#! Path keywords that negate the segment or state its operator.
+_KEYWORDS = OPERATOR_KEYWORDS | set((constants.NEGATION[0],))
+
+#! Characters that may not appear in a path (or directive) as they
+#! begin an operator, a directive, a group or a combinator.
+_RESERVED = re.escape(''.join(set(
+    ''.join(x for _, x in constants.OPERATORS if x) +
+    constants.NEGATION[1] +
+    constants.DIRECTIVE +
+    constants.GROUP_BEGIN + constants.GROUP_END +
+    constants.LOGICAL_AND + constants.LOGICAL_OR)))
+
+#! Matches a single term of a query: either the beginning of a (possibly
+#! negated) group or a segment (eg. `!foo.bar:asc<=3,4`) as its path,
+#! directives, operator and values; the operator symbol is matched
+#! greedily and validated afterwards. Values may contain parentheses
+#! (eg. `name=foo(bar)` or `name="a)"`); a closing parenthesis that
+#! neither closes one opened in the values nor is quoted ends the
+#! enclosing group.
+_TERM = re.compile(r"""
+    (?P<group>{negation}*{group})
+    |
+    (?P<negation>{negation}*)
+    (?P<path>[^{reserved}]*)
+    (?P<directives>(?:{directive}[^{reserved}]*)*)
+    (?:(?P<operator>[{symbols}]+)
+       (?P<values>[^{end}"]*(?:(?:
+           "[^"{combinators}]*"|{begin}[^{end}"]*{close}|[{begin}"]
+       )[^{end}"]*)*))?
+""".format(
+    negation=re.escape(constants.NEGATION[1]),
+    group=re.escape(constants.GROUP_BEGIN),
+    reserved=_RESERVED,
+    directive=re.escape(constants.DIRECTIVE),
+    symbols=re.escape(''.join(set(
+        ''.join(x for _, x in constants.OPERATORS if x) +
+        constants.NEGATION[1]))),
+    combinators=re.escape(constants.LOGICAL_AND + constants.LOGICAL_OR),
+    begin=re.escape(constants.GROUP_BEGIN),
+    close=re.escape(constants.GROUP_END),
+    end=re.escape(
+        constants.GROUP_BEGIN + constants.GROUP_END +
+        constants.LOGICAL_AND + constants.LOGICAL_OR)), re.VERBOSE)
+
 
 class Query(object):
     """Represents a complete query expression.
+
+    A query is a sequence of segments combined from left to right; a
+    segment may itself be a (parenthesized) query.
     """
 
-    def __init__(self, segments=None):
-        #! The various query segments.
+    def __init__(self, segments=None, **kwargs):
+        #! The various query segments (or grouped queries).
         self.segments = [] if segments is None else segments
 
+        #! Negation; if this group has been negated.
+        self.negated = kwargs.get('negated', False)
+
+        #! The combinator that is used to combine this group and the
+        #! next segment.
+        self.combinator = kwargs.get('combinator', operator.and_)
+
     def __str__(self):
         """Format the query for debugging purposes.
         """
@@ -44,16 +105,20 @@ class Query(object):
             if segment.negated:
                 o.write('not ')
 
-            o.write('"{}"'.format('.'.join(segment.path)))
+            if isinstance(segment, Query):
+                o.write(str(segment))
+
+            else:
+                o.write('"{}"'.format('.'.join(segment.path)))
 
-            if segment.values:
-                o.write(' :{}'.format(segment.operator))
+                if segment.values:
+                    o.write(' :{}'.format(segment.operator))
 
-            for jndex, value in enumerate(segment.values):
-                if jndex:
-                    o.write(' OR')
+                for jndex, value in enumerate(segment.values):
+                    if jndex:
+                        o.write(' OR')
 
-                o.write(" '{}'".format(value))
+                    o.write(" '{}'".format(value))
 
             o.write(')')
 
@@ -65,51 +130,111 @@ class Query(object):
 
 
 def parse(text, encoding='utf8'):
-    """Parse the querystring into a normalized form."""
-    # Initialize the query object.
-    query = Query()
+    """Parse the querystring into a normalized form.
 
+    Parsed queries are cached by their text and shared between callers;
+    the returned query must not be modified.
+    """
     # Decode the text if we got bytes.
     if isinstance(text, six.binary_type):
         text = text.decode(encoding)
 
-    # Iterate through the characters in the query string; one-by-one
-    # in order to perform one-pass parsing.
-    stream = StringIO()
+    query = _cache.get(text)
+    if query is None:
+        # Parse and cache the query; errors propagate uncached.
+        query = _parse(text)
+        _cache.set(text, query)
 
-    for character in text:
+    return query
 
-        # We want to stop reading the query and pass it off to someone
-        # when we reach a logical or grouping operator.
-        if character in (constants.LOGICAL_AND, constants.LOGICAL_OR):
 
-            if not stream.tell():
-                # There is no content in the stream; a logical operator
-                # was found out of place.
-                raise ValueError('Found `{}` out of place'.format(
-                    character))
+def cache_info():
+    """Reports the hits, misses and size of the parse cache."""
+    return _cache.info()
 
-            # Parse the segment up till the combinator
-            segment = parse_segment(stream.getvalue(), character)
-            query.segments.append(segment)
-            stream.truncate(0)
-            stream.seek(0)
 
-        else:
-            # This isn't a special character, just roll with it.
-            stream.write(character)
+def cache_clear():
+    """Empties the parse cache and resets its statistics."""
+    _cache.clear()
 
-    # TODO: Throw some nonsense here if the query string ended with a
-    # & or ;, because that makes no sense.
 
-    if stream.tell():
-        # Append the remainder of the query string.
-        query.segments.append(parse_segment(stream.getvalue()))
+def _parse(text):
+    # Parse the text as a sequence of segments and groups.
+    query, index = _parse_query(text, 0, 0)
+    if index < len(text):
+        # Only an unbalanced group end stops the top-level query early.
+        raise ValueError('Found `{}` out of place'.format(text[index]))
 
     # Return the constructed query object.
     return query
 
 
+def _parse_query(text, index, depth):
+    """Parses segments and groups from the index until the end of the
+    text or of the enclosing group.
+
+    @returns
+        The query and the index at which parsing stopped.
+    """
+    query = Query()
+    segments = query.segments
+    length = len(text)
+    match_term = _TERM.match
+    while index < length:
+        match = match_term(text, index)
+        group, negation, path, directives, symbol, values = match.groups()
+        if group is not None:
+            # Found the beginning of a group; parse it as its own query.
+            segment, index = _parse_query(text, match.end(), depth + 1)
+            if index >= length or text[index] != constants.GROUP_END:
+                raise ValueError('Expected `{}`'.format(constants.GROUP_END))
+
+            if not segment.segments:
+                raise ValueError('Found an empty group')
+
+            # The match is each `!` followed by the `(`; the group is
+            # negated by an odd number of them (an even length).
+            segment.negated = len(group) % 2 == 0
+            index += 1
+
+        else:
+            # Parse a single segment.
+            segment = _build_segment(
+                negation, path, directives, symbol, values)
+
+            index = match.end()
+
+        segments.append(segment)
+
+        if index >= length:
+            break
+
+        character = text[index]
+        combinator = COMBINATORS.get(character)
+        if combinator is None:
+            if character != constants.GROUP_END or not depth:
+                raise ValueError(
+                    'Found `{}` out of place'.format(character))
+
+            # The end of the enclosing group.
+            break
+
+        # Move past the combinator; a combinator that ends the query (or
+        # the enclosing group) is ignored (eg. `a=1&`).
+        index += 1
+        if index >= length or (
+                depth and text[index] == constants.GROUP_END):
+            break
+
+        if text[index] in COMBINATORS:
+            raise ValueError('Found `{}` out of place'.format(character))
+
+        # Set the combinator of the segment and the next.
+        segment.combinator = combinator
+
+    return query, index
+
+
 class QuerySegment(object):
     """
     Represents a single query segment with a subject path (`x.a.g`),
@@ -117,134 +242,105 @@ class QuerySegment(object):
     a set of values (`5,12,56`).
     """
 
-    def __init__(self, **kwargs):
+    def __init__(self, path=None, operator=constants.OPERATOR_IEQUAL[0],
+                 negated=False, directives=None, values=None,
+                 combinator=operator.and_):
         #! Path to the attribute being tested (as a list of segments).
-        self.path = kwargs.get('path', [])
+        self.path = [] if path is None else path
 
         #! This is the operator that is being applied to the attribute path.
-        self.operator = kwargs.get('operator', constants.OPERATOR_IEQUAL[0])
+        self.operator = operator
 
         #! Negation; if this operation has been negated.
-        self.negated = kwargs.get('negated', False)
+        self.negated = negated
 
         #! Directives. Directives are a key-value way of specifying commands
         #! on an attribute path.
-        self.directives = kwargs.get('directives', [])
+        self.directives = [] if directives is None else directives
 
         #! Values. Set of values that the attribute path is being checked
         #! against. Only one has to match.
-        self.values = kwargs.get('values', [])
+        self.values = [] if values is None else values
 
         #! The combinator that is used to combine this and the next
         #! query.
-        self.combinator = kwargs.get('combinator', operator.and_)
+        self.combinator = combinator
 
 
-def _parse_operator(segment, iterator):
-    """Parses the operator (eg. '==' or '<')."""
-    stream = StringIO()
-    for character in iterator:
-        if character == constants.NEGATION[1]:
-            if stream.tell():
-                # Negation can only occur at the start of an operator.
+def _build_segment(negation, path, directives, symbol, values):
+    """Constructs a query segment from the parts of a matched segment.
+    """
+    path = path.split(constants.SEP_PATH)
+    negated = len(negation) % 2 == 1 if negation else False
+    operator = _DEFAULT_OPERATOR
+
+    if symbol is not None:
+        # Negation can only occur at the start of an operator.
+        operator = OPERATOR_SYMBOL_MAP.get(symbol)
+        if operator is None:
+            stripped = symbol.lstrip(constants.NEGATION[1])
+
+            # The symbol is matched greedily; the longest operator it
+            # begins with is the operator and the rest begins the values
+            # (eg. `a=<1` tests for `<1`).
+            for end in range(len(stripped), 0, -1):
+                operator = OPERATOR_SYMBOL_MAP.get(stripped[:end])
+                if operator is not None:
+                    break
+
+            else:
+                raise ValueError('Unexpected operator `{}`.'.format(symbol))
+
+            if stripped[end:].startswith(constants.NEGATION[1]):
                 raise ValueError('Unexpected negation.')
 
-            # We've been negated.
-            segment.negated = not segment.negated
-            continue
-
-        if (stream.getvalue() + character not in OPERATOR_SYMBOL_MAP and
-                stream.getvalue() + character not in OPERATOR_BEGIN_CHARS):
-            # We're no longer an operator.
-            break
-
-        # Expand the operator
-        stream.write(character)
-
-    # Check for existance.
-    text = stream.getvalue()
-    if text not in OPERATOR_SYMBOL_MAP:
-        # Doesn't exist because of a mis-placed negation in the middle
-        # of the path.
-        raise ValueError('Unexpected negation.')
-
-    # Set the found operator.
-    segment.operator = OPERATOR_SYMBOL_MAP[text]
-
-    # Return the remaining characters.
-    return chain(character, iterator)
-
-
-def parse_segment(text, combinator=constants.LOGICAL_AND):
-    # Initialize a query segment.
-    segment = QuerySegment()
+            values = stripped[end:] + (values or '')
+            if (len(symbol) - len(stripped)) % 2:
+                negated = not negated
 
-    # Construct an iterator over the segment text.
-    iterator = iter(text)
-    stream = StringIO()
-
-    # Iterate through the characters in the segment; one-by-one
-    # in order to perform one-pass parsing.
-    for character in iterator:
-
-        if (character == constants.NEGATION[1]
-                and not stream.tell() and not segment.path):
-            # We've been negated.
-            segment.negated = not segment.negated
-            continue
-
-        if character in OPERATOR_BEGIN_CHARS:
-            # Found an operator; pull out what we can.
-            iterator = _parse_operator(segment, chain(character, iterator))
-
-            # We're done here; go to the value parser
-            break
-
-        if character == constants.SEP_PATH:
-            # A path separator, push the current stack into the path
-            segment.path.append(stream.getvalue())
-            stream.truncate(0)
-            stream.seek(0)
-
-            # Keep checking for more path segments.
-            continue
-
-        # Append the text to the stream
-        stream.write(character)
-
-    # Write any remaining information into the path.
-    segment.path.append(stream.getvalue())
+        if not values:
+            # An operator must be followed by the values to test for.
+            raise ValueError('Expected a value after `{}`.'.format(symbol))
 
     # Attempt to normalize the path.
-    try:
+    if path[-1] in _KEYWORDS:
         # The keyword 'not' can be the last item which
         # negates this query.
-        if segment.path[-1] == constants.NEGATION[0]:
-            segment.negated = not segment.negated
-            segment.path.pop(-1)
+        if path[-1] == constants.NEGATION[0]:
+            negated = not negated
+            path.pop(-1)
 
         # The last keyword can explicitly state the operation; in which
         # case the operator symbol **must** be `=`.
-        if segment.path[-1] in OPERATOR_KEYWORDS:
-            if segment.operator != constants.OPERATOR_IEQUAL[0]:
+        if path and path[-1] in OPERATOR_KEYWORDS:
+            if operator != _DEFAULT_OPERATOR:
                 raise ValueError(
                     'Explicit operations must use the `=` symbol.')
 
-            segment.operator = segment.path.pop(-1)
+            operator = path.pop(-1)
 
-        # Make sure we still have a path left.
-        if not segment.path:
-            raise IndexError()
-
-    except IndexError:
+    # Make sure we still have a path left.
+    if not path or not path[0]:
         # Ran out of path items after removing operations and negation.
-        raise ValueError('No path specified in {}'.format(text))
+        raise ValueError('No path specified in {}{}{}{}{}'.format(
+            negation, '.'.join(path), directives, symbol or '', values or ''))
+
+    # Construct the query segment; values are not complicated (yet) so
+    # just slice and dice until we get a list of possible values.
+    return QuerySegment(
+        path, operator, negated,
+        directives.split(constants.DIRECTIVE)[1:] if directives else None,
+        values.split(constants.SEP_VALUE) if values else None)
+
+
+def parse_segment(text, combinator=constants.LOGICAL_AND):
+    # Parse the entire text as a single segment.
+    match = _TERM.match(text)
+    if match.group('group') is not None or match.end() != len(text):
+        raise ValueError('Found `{}` out of place'.format(
+            text[match.end() - 1 if match.group('group') else match.end()]))
 
-    # Values are not complicated (yet) so just slice and dice
-    # until we get a list of possible values.
-    segment.values = ''.join(iterator)
-    if segment.values:
-        segment.values = segment.values.split(constants.SEP_VALUE)
+    segment = _build_segment(*match.groups()[1:])
 
     # Set the combinator.
     segment.combinator = COMBINATORS[combinator]
@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 from __future__ import absolute_import, unicode_literals, division
 import collections
+import operator
 import six
 import uuid
 import datetime
@@ -50,13 +51,24 @@ class Attribute(object):
         #! Eg. user.name could be obj['user'].name
         self.path = path
 
+        #! Accessor that retrieves the value of this attribute from an item.
+        #! Replaced by a compiled accessor when the attribute is bound to
+        #! the type of the items it is accessed on.
+        self.getter = lambda target: None
+
         if self.path:
             # Explode the path into segments.
-            self._segments = path.split('.')
+            self._segments = tuple(path.split('.'))
+
+            # Initialize the accessors for arbitrary items.
+            self.getter = lambda target: self._walk(target, self._segments)
+            self._parent_getter = lambda target: self._walk(
+                target, self._segments[:-1])
 
-            # Initialize the getters and setters.
-            self._getters = []
-            self._setter = None
+            # Initialize the cache of (segment, type) to getters and
+            # of type to setters.
+            self._getters = {}
+            self._setters = {}
 
     def clone(self):
         # Construct a new this.
@@ -116,44 +128,112 @@ class Attribute(object):
 
         return setter
 
-    def get(self, target, parent=False):
-        """Retrieves the value of this attribute from the passed object."""
-        if not self.path:
-            # If we do not have a path; we cannot automatically
-            # resolve our value; return nothing.
-            return None
+    def _walk(self, target, segments):
+        """Resolves the segments one by one against the passed target.
 
-        for getter in self._getters[:-1 if parent else None]:
-            # Iterate and resolve the attribute path.
+        This works for any kind of target (and for targets of differing
+        kinds) as the getter for each segment is built for, and cached
+        against, the type of the object it is applied to.
+        """
+        for segment in segments:
+            if target is None:
+                # We no longer have a value to use to attempt
+                # to resolve additional segments; bail.
+                return None
+
+            # Retrieve or build the getter corresponding to this path
+            # segment for this type of object.
+            key = segment, type(target)
+            getter = self._getters.get(key)
+            if getter is None:
+                getter = self._make_getter(segment, key[1], target)
+                self._getters[key] = getter
+
+            # Utilize the getter now.
             target = getter(target)
 
-        if self._segments and target is not None:
-            # Value isn't none and we still have additional segments left
-            # to resolve into getters.
-            while self._segments:
-                if target is None:
-                    # We no longer have a value to use to attempt
-                    # to resolve additional segments; bail for now.
-                    break
+        # Return what has been accessed.
+        return target
+
+    def _compile(self, segments, cls, related):
+        """
+        Builds an accessor for the segments for items of the passed type;
+        the leading run of segments that are plain attributes of known
+        types are fused into a single `operator.attrgetter`.
+        """
+        fused = []
+        for segment in segments:
+            if cls is None or issubclass(cls, collections.Mapping):
+                # Unknown or dynamic type; resolve the rest at runtime.
+                break
+
+            obj = getattr(cls, segment, None)
+            if obj is not None and hasattr(obj, '__call__'):
+                # Callable class attributes are invoked by the getter.
+                break
 
-                # Remove any path segments that have been resolved
-                # into getters.
-                segment = self._segments.pop(0)
+            fused.append(segment)
+            cls = related(cls, segment) if related is not None else None
 
-                # Build the getter corresponding to this path
-                # segment.
-                getter = self._make_getter(
-                    segment, target.__class__, target)
+        if not fused:
+            # Nothing can be resolved ahead of time.
+            return lambda target: self._walk(target, segments)
 
-                # Append the getter.
-                self._getters.append(getter)
+        getter = operator.attrgetter('.'.join(fused))
+        rest = segments[len(fused):]
 
-                if self._segments or not parent:
-                    # Utilize the getter now.
-                    target = getter(target)
+        def accessor(target):
+            try:
+                value = getter(target)
+
+            except AttributeError:
+                # Some item of another type or a missing value in the
+                # middle of the path; resolve it one segment at a time.
+                return self._walk(target, segments)
+
+            return self._walk(value, rest) if rest else value
+
+        return accessor
+
+    def bind(self, cls, related=None):
+        """
+        Compiles the accessors of this attribute against the type of
+        the items it is accessed on.
+
+        @param[in] cls
+            The type of the items (eg. the model class).
+
+        @param[in] related
+            A function that receives a type and an attribute name and
+            returns the type of the value of the attribute, if known
+            (eg. the model class targeted by a relationship).
+        """
+        if not self.path:
+            # Nothing to compile.
+            return
+
+        self.getter = self._compile(self._segments, cls, related)
+        self._parent_getter = self._compile(
+            self._segments[:-1], cls, related)
+
+        if len(self._segments) == 1:
+            # The parent is the item; its setter is known.
+            self._setters[cls] = self._make_setter(
+                self._segments[-1], cls, None)
+
+    def get(self, target, parent=False):
+        """Retrieves the value of this attribute from the passed object."""
+        if not self.path:
+            # If we do not have a path; we cannot automatically
+            # resolve our value; return nothing.
+            return None
+
+        if parent:
+            # Iterate and resolve the parent of the value.
+            return self._parent_getter(target)
 
         # Return what has been accessed.
-        return target
+        return self.getter(target)
 
     def set(self, target, value):
         """Stores the value on the passed target."""
@@ -163,15 +243,18 @@ class Attribute(object):
             return
 
         # Iterate and resolve the parent of our target.
-        parent = self.get(target, parent=True)
+        parent = self._parent_getter(target)
 
-        if self._setter is None:
+        setter = self._setters.get(type(parent))
+        if setter is None:
             # Resolve our setter if needed.
-            self._setter = self._make_setter(
-                self.path.split('.')[-1], parent.__class__, parent)
+            setter = self._make_setter(
+                self._segments[-1], type(parent), parent)
+
+            self._setters[type(parent)] = setter
 
         # Set the target.
-        self._setter(parent, value)
+        setter(parent, value)
 
     def prepare(self, value):
         """Prepares the value for serialization."""
@@ -2,14 +2,50 @@
 from __future__ import absolute_import, unicode_literals, division
 import six
 import logging
-from collections import Sequence
+import hashlib
+import calendar
+import uuid
+from email.utils import formatdate
+from collections import Sequence, Mapping, Iterable
+from six.moves import map
 from armet import http
 from armet.resources.resource import base
+from .meta import _compile_preparer
 
 
 logger = logging.getLogger(__name__)
 
 
+def _is_stream(data):
+    """
+    Tests if the data is a lazy iterable of items (eg. a generator
+    or a queryset) rather than a single item or a sequence.
+    """
+    return (isinstance(data, Iterable)
+            and not isinstance(data, (Sequence, Mapping, six.string_types)))
+
+
+#! Headers of a read that are cached along with its body.
+CACHED_HEADERS = (
+    'Content-Type', 'Content-Range', 'Link', 'ETag', 'Last-Modified')
+
+
+def _cache_key(*parts):
+    """Derives a (fixed-length) cache key from the parts."""
+    digest = hashlib.sha1()
+    for part in parts:
+        digest.update(six.text_type(part).encode('utf8'))
+        digest.update(b'\0')
+
+    return digest.hexdigest()
+
+
+def _is_sequence(data):
+    """Tests if the data is a sequence of items (eg. a JSON array)."""
+    return (isinstance(data, Sequence)
+            and not isinstance(data, six.string_types))
+
+
 class ManagedResource(base.Resource):
     """Implements the RESTful resource protocol for managed resources.
 
@@ -83,6 +119,23 @@ class ManagedResource(base.Resource):
     #! requested. None if a list is being requested.
     slug = None
 
+    #! The directives given after the name of the resource in the path
+    #! (eg. `/poll:limit=10:offset=20`). Directives are either a bare name
+    #! or a name followed by `=` and a comma-separated list of values.
+    directives = ()
+
+    #! Specialized preparation cycle for a single item.
+    #! Generated by the metaclass.
+    _item_preparer = None
+
+    #! Specialized clean cycle for a single item.
+    #! Generated by the metaclass.
+    _item_cleaner = None
+
+    #! Specialized preparation cycles for requested sets of fields.
+    #! Generated by the metaclass.
+    _field_preparers = None
+
     @classmethod
     def parse(cls, path):
         result = super(ManagedResource, cls).parse(path)
@@ -117,8 +170,206 @@ class ManagedResource(base.Resource):
         if not set(args).issubset(self.allowed_operations):
             raise http.exceptions.Forbidden()
 
+    def directive(self, name, default=None):
+        """Retrieves the values of the named directive.
+
+        @returns
+            The list of values given for the directive (empty if it was
+            given without values); or `default` if it was not given.
+        """
+        for directive in self.directives:
+            key, _, value = directive.partition('=')
+            if key == name:
+                return value.split(',') if value else []
+
+        return default
+
+    def _integer_directive(self, name, default=None):
+        """Retrieves the value of the named directive as an integer."""
+        values = self.directive(name)
+        if values is None:
+            return default
+
+        try:
+            value, = values
+            value = int(value)
+
+        except ValueError:
+            # Not exactly one integer.
+            raise http.exceptions.BadRequest()
+
+        if value < 0:
+            raise http.exceptions.BadRequest()
+
+        return value
+
+    def pagination(self):
+        """Retrieves the requested page of a list access.
+
+        Pages are requested with the `limit` directive combined with
+        either the `offset` directive (eg. `/poll:limit=10:offset=20`) or
+        the `after` directive, which names the slug of the last item of
+        the previous page (eg. `/poll:limit=10:after=20`).
+
+        @returns
+            A tuple of the limit, offset and the (cleaned) slug after
+            which the page begins; each of which are None if not requested.
+        """
+        limit = self._integer_directive('limit', self.meta.page_size)
+        offset = self._integer_directive('offset')
+
+        after = self.directive('after')
+        if after is not None:
+            if len(after) != 1 or offset is not None or self.sorting():
+                # A page begins after exactly one item (in the order of
+                # the slug) and cannot also begin at an offset.
+                raise http.exceptions.BadRequest()
+
+            try:
+                after = self.meta.slug.clean(after[0])
+
+            except ValueError:
+                # Not a valid slug.
+                raise http.exceptions.BadRequest()
+
+        return limit, offset, after
+
+    def sorting(self):
+        """Retrieves the order requested with the `sort` directive
+        (eg. `/poll:sort=-created,name`); attribute names prefixed with
+        `-` are sorted in descending order.
+
+        @returns
+            A list of (attribute, descending) pairs in order of precedence.
+        """
+        names = self.directive('sort')
+        if not names:
+            return []
+
+        order = []
+        for name in names:
+            descending = name.startswith('-')
+            attribute = self.attributes.get(name[1:] if descending else name)
+            if attribute is None or not attribute.path:
+                # Not an attribute that can be sorted by.
+                raise http.exceptions.BadRequest()
+
+            order.append((attribute, descending))
+
+        return order
+
+    def _uri(self, directives):
+        """Builds the URI of this resource with the passed directives."""
+        request = self.request
+        return '{}://{}{}{}{}{}{}'.format(
+            request.protocol.lower(),
+            request.host,
+            request.mount_point,
+            ''.join(':' + x for x in directives),
+            '({})'.format(self.query) if self.query else '',
+            '/' if self.meta.trailing_slash else '',
+            '?' + request.query if request.query else '')
+
+    def make_pagination_headers(self, items):
+        """Describes the returned page of items in the response headers.
+
+        Sets `Content-Range` for pages selected by offset and a `Link` to
+        the next page if the page was filled.
+        """
+        limit, offset, after = self.pagination()
+        if limit is None and offset is None and after is None:
+            # Not paginated.
+            return
+
+        if after is None and items:
+            # The range of the page is known by its offset.
+            start = offset or 0
+            self.response['Content-Range'] = 'items {}-{}/*'.format(
+                start, start + len(items) - 1)
+
+        if limit is None or len(items) < limit or not items:
+            # This is the last page.
+            return
+
+        # Retain all the directives that do not select the page.
+        directives = [x for x in self.directives if x.partition('=')[0]
+                      not in ('limit', 'offset', 'after')]
+
+        directives.append('limit={}'.format(limit))
+        if offset is not None or self.sorting():
+            # Continue by offset; pages only continue after an item when
+            # in the order of the slug.
+            directives.append('offset={}'.format(
+                (offset or 0) + len(items)))
+
+        else:
+            # Continue after the last item.
+            slug = self.meta.slug.prepare(self.meta.slug.get(items[-1]))
+            directives.append('after={}'.format(slug))
+
+        self.response['Link'] = '<{}>; rel="next"'.format(
+            self._uri(directives))
+
+    def fields(self):
+        """Retrieves the attributes requested with the `fields` directive
+        (eg. `/poll:fields=id,question`).
+
+        @returns
+            A tuple of the names of the requested attributes, in the order
+            they are declared; or None if every attribute is requested.
+        """
+        names = self.directive('fields')
+        if names is None:
+            return None
+
+        names = set(names)
+        fields = tuple(name for name, attribute in six.iteritems(
+            self.attributes) if attribute.include and name in names)
+
+        if len(fields) != len(names):
+            # Requested an attribute that does not exist.
+            raise http.exceptions.BadRequest()
+
+        return fields
+
+    @classmethod
+    def field_preparer(cls, fields):
+        """Retrieves the preparation cycle for the passed fields."""
+        preparer = cls._field_preparers.get(fields)
+        if preparer is None:
+            preparer = _compile_preparer(cls.attributes, cls.preparers, fields)
+            cls._field_preparers.set(fields, preparer)
+
+        return preparer
+
+    def route(self, request, response):
+        fields = self.fields()
+        if fields is not None:
+            # Prepare only the requested attributes.
+            self._item_preparer = self.field_preparer(fields)
+
+        # Continue on to the requested method.
+        return super(ManagedResource, self).route(request, response)
+
     def make_response(self, data=None, status=http.client.OK):
-        """Fills the response object from the passed data."""
+        """Fills the response object from the passed data.
+
+        @returns
+            A generator of the serialized chunks if the data is streamed
+            to the client; else, nothing.
+        """
+        if _is_stream(data) and not self.response.asynchronous:
+            # Determine the serializer before the response starts.
+            Serializer = self.determine_serializer(self.request)
+            if Serializer is not None:
+                # Make sure that the status code is set.
+                self.response.status = status
+
+                # Prepare and encode the items one at a time as they
+                # are streamed to the client.
+                serializer = Serializer(self.request, self.response)
+                return serializer.stream(map(self.item_prepare, data))
+
         if data is not None:
             # Prepare the data for transmission.
             data = self.prepare(data)
@@ -143,25 +394,17 @@ class ManagedResource(base.Resource):
 
             return data
 
+        if _is_stream(data):
+            # Prepare each item of a lazy iterable into a new list.
+            return [self.item_prepare(item) for item in data]
+
         # Prepare just the singular value and return.
         return self.item_prepare(data)
 
     def item_prepare(self, item):
-        # Initialize the object that hold the resultant item.
-        obj = {}
-
-        # Iterate through the attributes and build the object from the item.
-        for name, attribute in self.attributes.items():
-            if attribute.include:
-                # Run the attribute through its prepare cycle.
-                obj[name] = attribute.prepare(
-                    # Optional preparation cycle on the resource.
-                    self.preparers[name](
-                        # Retrieves the value from the object.
-                        self, item, attribute.get(item)))
-
-        # Return the resultant object.
-        return obj
+        # Delegate to the preparation cycle generated for this resource
+        # by the metaclass.
+        return self._item_preparer(self, item)
 
     def clean(self, data):
         if not data:
@@ -181,19 +424,9 @@ class ManagedResource(base.Resource):
         return self.item_clean(data)
 
     def item_clean(self, item):
-        # Initialize the object that hold the resultant item.
-        obj = {}
-
-        # Iterate through the attributes and build the object from the item.
-        for name, attribute in self.attributes.items():
-            if attribute.include:
-                # Run the attribute through its prepare cycle.
-                obj[name] = self.cleaners[name](
-                    # Micro preparation cycle on the attribute object.
-                    self, attribute.clean(item.get(name)))
-
-        # Return the resultant object.
-        return obj
+        # Delegate to the clean cycle generated for this resource
+        # by the metaclass.
+        return self._item_cleaner(self, item)
 
     @property
     def http_allowed_methods(self):
@@ -220,6 +453,31 @@ class ManagedResource(base.Resource):
         # Ensure we're allowed to read the resource.
         self.assert_operations('read')
 
+        key = self.cache_key() if self.meta.cache is not None else None
+        if key is not None and self.restore_response(key):
+            # Answered from the cache without reading the items.
+            return
+
+        result = self.make_read_response()
+        if key is not None and result is None:
+            self.store_response(key)
+
+        return result
+
+    def make_read_response(self):
+        """Reads the items and fills the response object from them.
+
+        @returns
+            A generator of the serialized chunks if the items are streamed
+            to the client; else, nothing.
+        """
+        if self.slug is None and self.directive('count') is not None:
+            # Only the number of items was requested (eg. `/poll:count`);
+            # this is not an item so it is not prepared.
+            self.response.write({'count': self.count()}, serialize=True)
+            self.response.status = http.client.OK
+            return
+
         try:
             # Delegate to `read` to retrieve the items.
             items = self.read()
@@ -232,8 +490,187 @@ class ManagedResource(base.Resource):
             # Requested a specific resource but nothing is returned.
             raise http.exceptions.NotFound()
 
+        if self.slug is None and isinstance(items, Sequence):
+            # Describe the page of items that is being returned.
+            self.make_pagination_headers(items)
+
+        if self.meta.conditional and self.validate(items):
+            # The client already has the items; they are neither prepared
+            # nor serialized.
+            return
+
         # Build the response object.
-        self.make_response(items)
+        return self.make_response(items)
+
+    def _generation(self, *names):
+        """Retrieves the token of the named generation of the cached
+        responses; which is replaced to discard them.
+        """
+        key = _cache_key('generation', self.meta.name, *names)
+        token = self.meta.cache.get(key)
+        if token is None:
+            # Begin a new generation (which is never expired).
+            token = uuid.uuid4().hex
+            self.meta.cache.set(key, token, timeout=0)
+
+        return token
+
+    def cache_key(self):
+        """Derives the key of the cached response to this read.
+
+        @returns
+            The key; or None if the response is not to be cached.
+        """
+        Serializer = self.determine_serializer(self.request)
+        if Serializer is None:
+            # Not acceptable; nothing to look for.
+            return None
+
+        if self.slug is None:
+            generation = self._generation('list')
+
+        else:
+            generation = self._generation('item', six.text_type(self.slug))
+
+        scope = self.meta.authorization.scope(self.request.user, self)
+        return _cache_key(
+            'response', self.meta.name, self._generation(), generation,
+            scope, Serializer.media_types[0], self.slug,
+            self.request.query, *self.directives)
+
+    def restore_response(self, key):
+        """Fills the response object from the cached response, if any.
+
+        @returns
+            True if the response was found in the cache.
+        """
+        entry = self.meta.cache.get(key)
+        if entry is None:
+            return False
+
+        headers, body = entry
+        for name, value in headers:
+            self.response[name] = value
+
+        self.response.status = http.client.OK
+        if 'ETag' not in self.response.headers and self.meta.conditional:
+            # Tag the body as it is sent.
+            self.response.conditional = True
+
+        elif (self.meta.conditional
+                and self.response.is_not_modified(self.request)):
+            # The client already has the items.
+            self.response.not_modified()
+            return True
+
+        self.response.write(body)
+        return True
+
+    def store_response(self, key):
+        """Caches the response (if complete) under the key."""
+        response = self.response
+        if response.status != http.client.OK or response.streaming:
+            # Only a complete representation is cached.
+            return
+
+        headers = [(name, response[name]) for name in CACHED_HEADERS
+                   if name in response.headers]
+
+        self.meta.cache.set(key, (headers, response.getvalue()))
+
+    def invalidate(self, slugs=None):
+        """Discards the cached responses that a write may have changed.
+
+        @param[in] slugs
+            The slugs of the items written; every list is discarded along
+            with them. None to discard every cached response.
+        """
+        cache = self.meta.cache
+        if cache is None:
+            return
+
+        if slugs is None:
+            cache.delete(_cache_key('generation', self.meta.name))
+            return
+
+        cache.delete(_cache_key('generation', self.meta.name, 'list'))
+        for slug in slugs:
+            cache.delete(_cache_key(
+                'generation', self.meta.name, 'item', six.text_type(slug)))
+
+    def validate(self, items):
+        """
+        Sends the validators (`ETag` and `Last-Modified`) of the read items
+        and tests them against the conditional headers of the request.
+
+        Without a `version` attribute the entity tag is derived from the
+        serialized body as the response is closed.
+
+        @returns
+            True if the response has been made as `304 Not Modified`.
+        """
+        if _is_stream(items):
+            # Items that are streamed can't be inspected in advance.
+            return False
+
+        if self.slug is not None:
+            items = [items]
+
+        version = self.meta.version
+        if version is None:
+            # Tag (and test) the serialized body instead.
+            self.response.conditional = True
+
+        else:
+            # Tag the versions of the items (identified by their slugs;
+            # different items may be at the same version) in the
+            # representation that was negotiated.
+            Serializer = self.determine_serializer(self.request)
+            slug = self.meta.slug
+            digest = hashlib.sha1()
+            for value in ([Serializer and Serializer.media_types[0],
+                           self.request.query] + list(self.directives) +
+                          [(slug.get(x), version.get(x)) for x in items]):
+                digest.update(six.text_type(value).encode('utf8'))
+                digest.update(b'\0')
+
+            self.response['ETag'] = '"{}"'.format(digest.hexdigest())
+
+        if self.meta.last_modified is not None:
+            dates = [self.meta.last_modified.get(x) for x in items]
+            dates = [x for x in dates if x is not None]
+            if dates:
+                timestamp = calendar.timegm(max(dates).utctimetuple())
+                self.response['Last-Modified'] = formatdate(
+                    timestamp, usegmt=True)
+
+        if (not self.response.conditional
+                and self.response.is_not_modified(self.request)):
+            # The client already has the items.
+            self.response.not_modified()
+            return True
+
+        return False
+
+    def head(self, request, response):
+        """Processes a `HEAD` request.
+
+        Responds with the headers of the equivalent `GET` (including the
+        `Content-Length` and entity tag of its body) without sending the
+        body. As with `GET`, a client that already has the items (or a
+        cached response) is answered before they are prepared.
+        """
+        return self.get(request, response)
+
+    def count(self):
+        """Counts the items of a list access without reading them."""
+        try:
+            # Delegate to the model connector to count the items.
+            return self.count_items()
+
+        except AttributeError:
+            # No count method defined.
+            raise http.exceptions.NotImplemented()
 
     def post(self, request, response):
         """Processes a `POST` request."""
@@ -247,6 +684,21 @@ class ManagedResource(base.Resource):
         # Deserialize and clean the incoming object.
         data = self.clean(self.request.read(deserialize=True))
 
+        if _is_sequence(data):
+            # Create all of the items at once.
+            try:
+                items = self.create_many(data)
+
+            except AttributeError:
+                # No bulk create method defined.
+                raise http.exceptions.NotImplemented()
+
+            # The lists may now include the new items.
+            self.invalidate(())
+
+            # Build the response object.
+            return self.make_response(items, status=http.client.CREATED)
+
         try:
             # Delegate to `create` to create the item.
             item = self.create(data)
@@ -255,14 +707,60 @@ class ManagedResource(base.Resource):
             # No read method defined.
             raise http.exceptions.NotImplemented()
 
+        # The lists may now include the new item.
+        self.invalidate(())
+
         # Build the response object.
         self.make_response(item, status=http.client.CREATED)
 
+    def _update_many(self, partial=False):
+        """Updates the items of a list access from the array in the body;
+        each item identifies its target by its slug.
+        """
+        # Deserialize the incoming array.
+        data = self.request.read(deserialize=True)
+        if (not _is_sequence(data)
+                or not all(isinstance(x, Mapping) for x in data)):
+            # Only an array of items (objects) can be applied to a list.
+            raise http.exceptions.BadRequest()
+
+        # Note which attributes each item gave before cleaning.
+        given = [set(item) for item in data]
+        data = self.clean(data)
+        if partial:
+            # Only update the given attributes of each item.
+            data = [dict((name, value) for name, value in six.iteritems(x)
+                         if name in names) for x, names in zip(data, given)]
+
+        # Ensure we're allowed to update the resources.
+        self.assert_operations('update')
+
+        try:
+            # Delegate to `update_many` to update the items.
+            items = self.update_many(data)
+
+        except AttributeError:
+            # No bulk update method defined.
+            raise http.exceptions.NotImplemented()
+
+        # Discard the cached responses of the targets; by the slugs the
+        # targets have (the slug path need not be an exposed attribute).
+        self.invalidate(self.meta.slug.get(x) for x in items)
+
+        # Build the response object.
+        self.make_response(items, status=http.client.OK)
+
+    def item_slug(self, data):
+        """Retrieves the slug of the cleaned item data."""
+        for name, attribute in six.iteritems(self.attributes):
+            if attribute.path == self.meta.slug.path:
+                return data.get(name)
+
     def put(self, request, response):
         """Processes a `PUT` request."""
         if self.slug is None:
-            # Mass-PUT is not implemented.
-            raise http.exceptions.NotImplemented()
+            # Replace each of the items in the array.
+            return self._update_many()
 
         try:
             # Check if the resource exists.
@@ -287,6 +785,8 @@ class ManagedResource(base.Resource):
                 # No read method defined.
                 raise http.exceptions.NotImplemented()
 
+            self.invalidate((self.slug,))
+
             # Build the response object.
             self.make_response(target, status=http.client.OK)
 
@@ -302,25 +802,45 @@ class ManagedResource(base.Resource):
                 # No read method defined.
                 raise http.exceptions.NotImplemented()
 
+            self.invalidate((self.slug,))
+
             # Build the response object.
             self.make_response(target, status=http.client.CREATED)
 
+    def patch(self, request, response):
+        """Processes a `PATCH` request."""
+        if self.slug is not None:
+            # Patching a single item is not implemented.
+            raise http.exceptions.NotImplemented()
+
+        # Update the given attributes of each of the items in the array.
+        return self._update_many(partial=True)
+
     def delete(self, request, response):
         """Processes a `DELETE` request."""
-        if self.slug is None:
-            # Mass-DELETE is not implemented.
+        if self.slug is None and not self.request.query:
+            # Mass-DELETE is only done for the items matched by a query.
             raise http.exceptions.NotImplemented()
 
         # Ensure we're allowed to destroy a resource.
         self.assert_operations('destroy')
 
         try:
-            # Delegate to `destroy` to destroy the item.
-            self.destroy()
+            # Delegate to `destroy` to destroy the item (or the
+            # queried items).
+            if self.slug is None:
+                self.destroy_many()
+
+            else:
+                self.destroy()
 
         except AttributeError:
             # No read method defined.
             raise http.exceptions.NotImplemented()
 
+        # The items destroyed by a query are not known; discard every
+        # cached response.
+        self.invalidate(None if self.slug is None else (self.slug,))
+
         # Build the response object.
         self.make_response(status=http.client.NO_CONTENT)
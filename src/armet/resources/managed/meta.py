@@ -2,15 +2,127 @@
 from __future__ import absolute_import, unicode_literals, division
 import six
 import collections
+from armet.utils import LRUCache
 from armet.resources.attributes import Attribute
 from ..resource.meta import ResourceBase
 from . import options
 
 
+#! Number of preparation cycles for requested sets of fields to retain
+#! for each resource.
+FIELDS_CACHE_SIZE = 64
+
+
+def _identity_prepare(self, obj, value):
+    return value
+
+
+def _identity_clean(self, value):
+    return value
+
+
+def _overrides(attribute, name):
+    """Tests if the attribute overrides the named no-op method."""
+    method = six.get_unbound_function(getattr(type(attribute), name))
+    return method is not six.get_unbound_function(getattr(Attribute, name))
+
+
+def _compile(name, signature, expressions, namespace):
+    """
+    Generates a function with the passed signature that returns a
+    dictionary built from the passed (key, expression) pairs.
+    """
+    body = ', '.join('{}: {}'.format(*x) for x in expressions)
+    source = 'def {}({}):\n    return {{{}}}\n'.format(name, signature, body)
+    six.exec_(source, namespace)
+    return namespace[name]
+
+
+def _compile_preparer(attributes, preparers, fields=None):
+    """
+    Generates the function used to prepare an item for serialization
+    with all excluded attributes and no-op steps removed.
+
+    @param[in] fields
+        The names of the attributes to prepare; if not given all
+        included attributes are prepared.
+    """
+    namespace = {}
+    expressions = []
+    for index, (name, attribute) in enumerate(six.iteritems(attributes)):
+        if not attribute.include:
+            # Excluded attributes are never prepared.
+            continue
+
+        if fields is not None and name not in fields:
+            # Not requested.
+            continue
+
+        # Retrieve the value from the item.
+        namespace['key_{}'.format(index)] = name
+        expression = 'None'
+        if attribute.path:
+            namespace['get_{}'.format(index)] = attribute.getter
+            expression = 'get_{}(item)'.format(index)
+
+        # Optional preparation cycle on the resource.
+        if preparers[name] is not _identity_prepare:
+            namespace['hook_{}'.format(index)] = preparers[name]
+            expression = 'hook_{}(self, item, {})'.format(index, expression)
+
+        # Micro preparation cycle on the attribute object.
+        if _overrides(attribute, 'prepare'):
+            namespace['prepare_{}'.format(index)] = attribute.prepare
+            expression = 'prepare_{}({})'.format(index, expression)
+
+        expressions.append(('key_{}'.format(index), expression))
+
+    return _compile('item_prepare', 'self, item', expressions, namespace)
+
+
+def _compile_cleaner(attributes, cleaners):
+    """
+    Generates the function used to clean an item after deserialization
+    with all excluded attributes and no-op steps removed.
+    """
+    namespace = {}
+    expressions = []
+    for index, (name, attribute) in enumerate(six.iteritems(attributes)):
+        if not attribute.include:
+            # Excluded attributes are never cleaned.
+            continue
+
+        # Retrieve the value from the item.
+        namespace['key_{}'.format(index)] = name
+        expression = 'item.get(key_{})'.format(index)
+
+        # Micro cleaning cycle on the attribute object.
+        if _overrides(attribute, 'clean'):
+            namespace['clean_{}'.format(index)] = attribute.clean
+            expression = 'clean_{}({})'.format(index, expression)
+
+        # Optional cleaning cycle on the resource.
+        if cleaners[name] is not _identity_clean:
+            namespace['hook_{}'.format(index)] = cleaners[name]
+            expression = 'hook_{}(self, {})'.format(index, expression)
+
+        expressions.append(('key_{}'.format(index), expression))
+
+    return _compile('item_clean', 'self, item', expressions, namespace)
+
+
 class ManagedResourceBase(ResourceBase):
 
     options = options.ManagedResourceOptions
 
+    @classmethod
+    def _bind_attributes(cls, resource, attributes):
+        """Binds the attributes to the type of items the resource manages.
+
+        Managed resources make no assumptions about their items; the
+        attributes resolve their paths against each item as it comes.
+        """
+
     def __new__(cls, name, bases, attrs):
         # Construct the class object.
         self = super(ManagedResourceBase, cls).__new__(cls, name, bases, attrs)
@@ -37,12 +149,15 @@ class ManagedResourceBase(ResourceBase):
         for attr in attributes:
             attributes[attr] = attributes[attr].clone()
 
+        # Compile the attribute accessors for the items of this resource.
+        cls._bind_attributes(self, attributes)
+
         # Cache access to the attribute preparation cycle.
         self.preparers = preparers = {}
         for key in attributes:
             prepare = getattr(self, 'prepare_{}'.format(key), None)
             if not prepare:
-                prepare = lambda self, obj, value: value
+                prepare = _identity_prepare
             preparers[key] = prepare
 
         # Cache access to the attribute clean cycle.
@@ -50,8 +165,19 @@ class ManagedResourceBase(ResourceBase):
         for key in attributes:
             clean = getattr(self, 'clean_{}'.format(key), None)
             if not clean:
-                clean = lambda self, value: value
+                clean = _identity_clean
             cleaners[key] = clean
 
+        # Generate the specialized item preparation and clean cycles.
+        self._item_preparer = staticmethod(
+            _compile_preparer(attributes, preparers))
+
+        self._item_cleaner = staticmethod(
+            _compile_cleaner(attributes, cleaners))
+
+        # Preparation cycles for the sets of fields requested of this
+        # resource; generated on demand.
+        self._field_preparers = LRUCache(FIELDS_CACHE_SIZE)
+
         # Return the constructed class object.
         return self
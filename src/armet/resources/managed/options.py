@@ -157,6 +157,57 @@ class ManagedResourceOptions(options.ResourceOptions):
             else:
                 self.detail_allowed_operations = self.allowed_operations
 
+        #! Whether to stream list responses to the client. When set, the
+        #! model connectors read lists lazily and the items are prepared
+        #! and serialized one at a time as they are sent to the client
+        #! rather than all at once.
+        #!
+        #! Resources that return a lazy iterable (eg. a generator) from
+        #! `read` are streamed regardless.
+        self.streaming = meta.get('streaming', False)
+
+        #! Default number of items to return from a list access when the
+        #! client does not request a limit (with the `limit` directive).
+        #! None returns every item.
+        self.page_size = meta.get('page_size')
+
+        #! Attribute (or path) holding a version of each item that changes
+        #! whenever the item does (eg. a revision counter). When set, the
+        #! entity tag (`ETag`) of a read is derived from the versions of
+        #! the items read; conditional requests are then answered with
+        #! `304 Not Modified` before the items are prepared or serialized.
+        self.version = meta.get('version')
+        if isinstance(self.version, six.string_types):
+            self.version = Attribute(self.version)
+
+        #! Attribute (or path) holding the time each item was last modified
+        #! at (as a `datetime`); sent as the `Last-Modified` of a read and
+        #! compared against `If-Modified-Since`.
+        self.last_modified = meta.get('last_modified')
+        if isinstance(self.last_modified, six.string_types):
+            self.last_modified = Attribute(self.last_modified)
+
+        #! Whether to send validators with reads and honor conditional
+        #! requests (`If-None-Match` and `If-Modified-Since`). Without a
+        #! `version` or `last_modified` attribute, the entity tag is a
+        #! hash of the serialized body. Defaults to whether either
+        #! attribute is given.
+        self.conditional = meta.get('conditional', bool(
+            self.version or self.last_modified))
+
+        #! Backend to cache the serialized responses of reads in (eg. an
+        #! instance of `armet.caches.MemoryCache`). Responses are cached
+        #! per item or list, query, directives, format and authorization
+        #! scope; writes through this resource discard the responses
+        #! they may have changed. Writes made otherwise are only seen
+        #! once the cached responses expire. None to not cache.
+        #!
+        #! Note that `armet.caches.SharedMemoryCache` holds each key in a
+        #! single slot; a key that maps to the slot of another silently
+        #! evicts it (including the generation tokens that responses are
+        #! keyed by, which only causes a needless re-read).
+        self.cache = meta.get('cache')
+
         #! Attribute to use for the slug or url segment
         #! that identifies the resource. The slug attribute is
         #! a special attribute; there are a couple of requirements.
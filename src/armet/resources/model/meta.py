@@ -1,5 +1,6 @@
 # -*- coding: utf-8 -*-
 from __future__ import absolute_import, unicode_literals, division
+import six
 from ..managed import meta
 from . import options
 
@@ -9,3 +10,21 @@ class ModelResourceBase(meta.ManagedResourceBase):
     options = options.ModelResourceOptions
 
     connectors = ['http', 'model']
+
+    @classmethod
+    def _bind_attributes(cls, resource, attributes):
+        model = resource.meta.model
+        if model is None:
+            # Abstract resource; nothing to bind to.
+            return
+
+        # Resolve the attribute paths against the model; the model connector
+        # knows how to follow relationships to the related model.
+        related = getattr(resource, 'related_model', None)
+        for attribute in six.itervalues(attributes):
+            attribute.bind(model, related)
+
+        # Let the model connector prepare to load the attributes.
+        bind = getattr(resource, 'bind_model', None)
+        if bind is not None:
+            bind(attributes)
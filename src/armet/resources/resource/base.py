@@ -1,7 +1,6 @@
 # -*- coding: utf-8 -*-
 from __future__ import absolute_import, unicode_literals, division
 import logging
-import re
 import six
 import collections
 import mimeparse
@@ -33,6 +32,16 @@ class Resource(object):
     #! Generated by the metaclass.
     _serializer_map = None
 
+    #! Maps the names of the allowed serializers to their media types.
+    #! Generated by the metaclass.
+    _available_serializers = None
+
+    #! Negotiated serializer (and deserializer) names by the value of
+    #! the `Accept` (and `Content-Type`) header; an empty name when
+    #! none was acceptable. Generated by the metaclass.
+    _serializer_cache = None
+    _deserializer_cache = None
+
     def __new__(cls, request, response, *args, **kwargs):
         # Parse any arguments out of the path and traverse down the
         # path using any defined patterns.
@@ -47,33 +56,6 @@ class Resource(object):
         # Return our constructed instance.
         return obj
 
-    def __getattribute__(self, name):
-        if name.startswith('__') or name == 'connectors':
-            # Bail early.
-            return super(Resource, self).__getattribute__(name)
-
-        # Attempt to get the attribute from self first.
-        if name in self.__dict__ or name in type(self).__dict__:
-            # Return the attribute normally.
-            return super(Resource, self).__getattribute__(name)
-
-        # Attempt to get the attribute from a connector.
-        if self.connectors and isinstance(self.connectors[0], type):
-            for connector in self.connectors:
-                attr = connector.__dict__.get(name)
-                if attr is not None:
-                    # Found attribute.
-                    if hasattr(attr, '__get__'):
-                        # This has a descriptor; wrap it to use the
-                        # current cls.
-                        return attr.__get__(self)
-
-                    # Return a normal attribute.
-                    return attr
-
-        # We can't find anything; continue as normal.
-        return super(Resource, self).__getattribute__(name)
-
     @classmethod
     def redirect(cls, request, response):
         """Redirect to the canonical URI for this resource."""
@@ -124,6 +106,11 @@ class Resource(object):
             # Redirect to the version with the correct trailing slash.
             return cls.redirect(request, response)
 
+        if request.method == 'HEAD':
+            # The body is described (as it would be for `GET`) but is
+            # not sent.
+            response.head = True
+
         try:
             # Instantiate the resource.
             obj = cls(request, response)
@@ -137,52 +124,87 @@ class Resource(object):
             # This is used to facilitate the serializer and deserializer.
             obj._request = request
 
-            # Initiate the dispatch cycle and handle its result on
-            # synchronous requests.
+            # Initiate the dispatch cycle.
             result = obj.dispatch(request, response)
 
-            if not response.asynchronous:
-                # There is several things that dispatch is allowed to return.
-                if (isinstance(result, collections.Iterable) and
-                        not isinstance(result, six.string_types)):
-                    # Return the stream generator.
-                    return cls.stream(response, result)
+            if utils.isawaitable(result):
+                # The request was dispatched to an asynchronous (`async def`)
+                # handler; the connector awaits the result and hands it to
+                # `complete` (or the error it raised to `fail`).
+                return result
 
-                else:
-                    # Leave it up to the response to throw or write whatever
-                    # we got back.
-                    response.end(result)
-                    if response.body:
-                        # Return the body if there was any set.
-                        return response.body
-
-        except http.exceptions.BaseHTTPException as e:
+            # Handle the result of the dispatch cycle.
+            return cls.complete(request, response, result)
+
+        except (http.exceptions.BaseHTTPException, Exception) as ex:
+            # Handle the error that interrupted the dispatch cycle.
+            return cls.fail(request, response, ex)
+
+    @classmethod
+    def complete(cls, request, response, result):
+        """Handles the result of the dispatch cycle on synchronous requests.
+
+        @returns
+            The body of the response, if any; or a generator of its chunks
+            if the response is streamed.
+        """
+        if response.asynchronous:
+            # The response is written and closed by the handler.
+            return None
+
+        # There is several things that dispatch is allowed to return.
+        if (isinstance(result, collections.Iterable) and
+                not isinstance(result, six.string_types)):
+            # Return the stream generator.
+            return cls.stream(response, result)
+
+        # Leave it up to the response to throw or write whatever
+        # we got back.
+        response.end(result)
+        if response.body:
+            # Return the body if there was any set.
+            return response.body
+
+    @classmethod
+    def fail(cls, request, response, error):
+        """Handles an error raised during the dispatch cycle.
+
+        @note
+            This must be invoked while the error is being handled (in the
+            `except` block) so unexpected errors are logged with their
+            traceback.
+
+        @returns
+            The body of the response, if any.
+        """
+        if isinstance(error, http.exceptions.BaseHTTPException):
             # Something that we can handle and return properly happened.
             # Set response properties from the exception.
-            response.status = e.status
-            response.headers.update(e.headers)
+            response.status = error.status
+            response.headers.update(error.headers)
 
-            if e.content:
+            if error.content:
                 # Write the exception body if present and close
                 # the response.
                 # TODO: Use the plain-text encoder.
-                response.send(e.content, serialize=True, format='json')
+                response.send(error.content, serialize=True, format='json')
 
             # Terminate the connection and return the body.
             response.close()
             if response.body:
                 return response.body
 
-        except Exception:
-            # Something unexpected happened.
-            # Log error message to the logger.
-            logger.exception('Internal server error')
+            return None
 
-            # Write a debug message for the client.
-            if not response.streaming and not response.closed:
-                response.status = http.client.INTERNAL_SERVER_ERROR
-                response.headers.clear()
-                response.close()
+        # Something unexpected happened.
+        # Log error message to the logger.
+        logger.exception('Internal server error')
+
+        # Write a debug message for the client.
+        if not response.streaming and not response.closed:
+            response.status = http.client.INTERNAL_SERVER_ERROR
+            response.headers.clear()
+            response.close()
 
     @classmethod
     def parse(cls, path):
@@ -191,16 +213,60 @@ class Resource(object):
         This uses one of the many defined patterns on the options class. But,
         it defaults to a no-op if there are no defined patterns.
         """
-        # Iterate through the available patterns.
-        for resource, pattern in cls.meta.patterns:
-            # Attempt to match the path.
-            match = re.match(pattern, path)
-            if match is not None:
-                # Found something.
-                return resource, match.groupdict(), match.string[match.end():]
+        if not cls.meta.patterns:
+            # No patterns at all; no-op.
+            return None
 
-        # No patterns at all; return unsuccessful.
-        return None if not cls.meta.patterns else False
+        # Match the path against all of the patterns at once.
+        result = cls.meta.router.match(path)
+        return result if result is not None else False
+
+    @classmethod
+    def resolve(cls, path):
+        """Resolves the resource that is accessed by the passed path.
+
+        This follows traversal through the defined patterns until a resource
+        is found that does not traverse any further.
+
+        @param[in] path
+            The path of the request, after the mount point.
+
+        @returns
+            A tuple of the resolved resource class, the dictionary of
+            parameters parsed along the way and the path as seen by the
+            resolved resource.
+        """
+        resource = cls
+        params = {}
+        while True:
+            # Attempt to parse the path using a pattern.
+            result = resource.parse(path)
+            if result is None:
+                # No parsing was requested; no-op.
+                return resource, params, path
+
+            elif not result:
+                # Parsing failed; raise 404.
+                raise http.exceptions.NotFound()
+
+            # Partition out the result.
+            target, data, rest = result
+
+            if target is not None:
+                # Modify the path appropriately for the traversal target.
+                remainder = data.pop('path', None)
+                path = remainder if remainder is not None else rest
+
+            # Parameters parsed nearer to the root take precedence.
+            for name, value in six.iteritems(data):
+                params.setdefault(name, value)
+
+            if target is None:
+                # No traversal; return parameters.
+                return resource, params, path
+
+            # Continue traversal with the target.
+            resource = target
 
     @classmethod
     def traverse(cls, request, params=None):
@@ -209,37 +275,12 @@ class Resource(object):
         This makes use of the patterns array to implement simple traversal.
         This defaults to a no-op if there are no defined patterns.
         """
-        # Attempt to parse the path using a pattern.
-        result = cls.parse(request.path)
-        if result is None:
-            # No parsing was requested; no-op.
-            return cls, {}
-
-        elif not result:
-            # Parsing failed; raise 404.
-            raise http.exceptions.NotFound()
-
-        # Partition out the result.
-        resource, data, rest = result
-
+        resource, data, request.path = cls.resolve(request.path)
         if params:
             # Append params to data.
             data.update(params)
 
-        if resource is None:
-            # No traversal; return parameters.
-            return cls, data
-
-        # Modify the path appropriately.
-        if data.get('path') is not None:
-            request.path = data.pop('path')
-
-        elif rest is not None:
-            request.path = rest
-
-        # Send us through traversal again.
-        result = resource.traverse(request, params=data)
-        return result
+        return resource, data
 
     @classmethod
     def stream(cls, response, sequence):
@@ -323,12 +364,18 @@ class Resource(object):
             # the `Content-Type` header.
             media_ranges = request.get('Content-Type')
             if media_ranges:
-                # Parse the media ranges and determine the deserializer
-                # that is the closest match.
-                media_types = six.iterkeys(self._deserializer_map)
-                media_type = mimeparse.best_match(media_types, media_ranges)
-                if media_type:
-                    format = self._deserializer_map[media_type]
+                format = self._deserializer_cache.get(media_ranges)
+                if format is None:
+                    # Parse the media ranges and determine the deserializer
+                    # that is the closest match.
+                    media_types = six.iterkeys(self._deserializer_map)
+                    media_type = mimeparse.best_match(
+                        media_types, media_ranges)
+
+                    format = self._deserializer_map.get(media_type, '')
+                    self._deserializer_cache.set(media_ranges, format)
+
+                if format:
                     Deserializer = self.meta.deserializers[format]
 
             else:
@@ -342,7 +389,8 @@ class Resource(object):
                 # Attempt to deserialize the data using the determined
                 # deserializer.
                 deserializer = Deserializer()
-                return deserializer.deserialize(text), deserializer
+                return deserializer.deserialize(
+                    text, request.encoding or 'utf8'), deserializer
 
             except ValueError:
                 # Failed to deserialize the data.
@@ -351,6 +399,58 @@ class Resource(object):
         # Failed to determine a deserializer; or failed to deserialize.
         raise http.exceptions.UnsupportedMediaType()
 
+    @classmethod
+    def determine_serializer(cls, request, format=None):
+        """Determines the serializer to use to serialize a response.
+
+        @param[in] request
+            The request object to pull the `Accept` header from.
+
+        @param[in] format
+            A specific format to serialize in; if provided, no detection is
+            done.
+
+        @returns
+            The serializer class; or None if no acceptable serializer
+            could be determined.
+        """
+        Serializer = None
+        if format:
+            # An explicit format was given; do not attempt to auto-detect
+            # a serializer.
+            Serializer = cls.meta.serializers[format]
+
+        if not Serializer:
+            # Determine an appropriate serializer to use by
+            # introspecting the request object and looking at the `Accept`
+            # header.
+            media_ranges = (request.get('Accept') or '*/*').strip()
+            if not media_ranges:
+                # Default the media ranges to */*
+                media_ranges = '*/*'
+
+            if media_ranges != '*/*':
+                format = cls._serializer_cache.get(media_ranges)
+                if format is None:
+                    # Parse the media ranges and determine the serializer
+                    # that is the closest match.
+                    media_types = six.iterkeys(cls._serializer_map)
+                    media_type = mimeparse.best_match(
+                        media_types, media_ranges)
+
+                    format = cls._serializer_map.get(media_type, '')
+                    cls._serializer_cache.set(media_ranges, format)
+
+                if format:
+                    Serializer = cls.meta.serializers[format]
+
+            else:
+                # Client indicated no preference; use the default.
+                default = cls.meta.default_serializer
+                Serializer = cls.meta.serializers[default]
+
+        return Serializer
+
     @utils.boundmethod
     def serialize(self, data, response=None, request=None, format=None):
         """Serializes the data using a determined serializer.
@@ -384,35 +484,10 @@ class Resource(object):
                 # Ensure we have a response object.
                 request = self._request
 
-        Serializer = None
-        if format:
-            # An explicit format was given; do not attempt to auto-detect
-            # a serializer.
-            Serializer = self.meta.serializers[format]
-
-        if not Serializer:
-            # Determine an appropriate serializer to use by
-            # introspecting the request object and looking at the `Accept`
-            # header.
-            media_ranges = (request.get('Accept') or '*/*').strip()
-            if not media_ranges:
-                # Default the media ranges to */*
-                media_ranges = '*/*'
-
-            if media_ranges != '*/*':
-                # Parse the media ranges and determine the serializer
-                # that is the closest match.
-                media_types = six.iterkeys(self._serializer_map)
-                media_type = mimeparse.best_match(media_types, media_ranges)
-                if media_type:
-                    format = self._serializer_map[media_type]
-                    Serializer = self.meta.serializers[format]
-
-            else:
-                # Client indicated no preference; use the default.
-                default = self.meta.default_serializer
-                Serializer = self.meta.serializers[default]
+        # Determine the serializer to use.
+        Serializer = self.determine_serializer(request, format)
 
+        available = self._available_serializers
         if Serializer:
             try:
                 # Attempt to serialize the data using the determined
@@ -421,20 +496,15 @@ class Resource(object):
                 return serializer.serialize(data), serializer
 
             except ValueError:
-                # Failed to serialize the data.
-                pass
-
-        # Either failed to determine a serializer or failed to serialize
-        # the data; construct a list of available and valid encoders.
-        available = {}
-        for name in self.meta.allowed_serializers:
-            Serializer = self.meta.serializers[name]
-            instance = Serializer(request, None)
-            if instance.can_serialize(data):
-                available[name] = Serializer.media_types[0]
+                # Failed to serialize the data; offer every other
+                # serializer (without trying each of them on the data).
+                available = dict(
+                    (name, media_type)
+                    for name, media_type in six.iteritems(available)
+                    if self.meta.serializers[name] is not Serializer)
 
         # Raise a Not Acceptable exception.
-        raise http.exceptions.NotAcceptable(available)
+        raise http.exceptions.NotAcceptable(dict(available))
 
     @classmethod
     def _process_cross_domain_request(cls, request, response):
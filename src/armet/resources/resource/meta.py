@@ -6,6 +6,12 @@ from armet import utils
 from . import options
 
 
+#! Maximum number of distinct `Accept` (or `Content-Type`) header values
+#! to remember the negotiated serializer (or deserializer) of for each
+#! resource.
+NEGOTIATION_CACHE_SIZE = 128
+
+
 #! Map of connector class objects in their connector modules.
 CONNECTORS = {
     'http': {
@@ -27,30 +33,6 @@ class ResourceBase(type):
     #! Connectors to instantiate and mixin to the inheritance.
     connectors = ['http']
 
-    def __getattribute__(self, name):
-        if name == 'connectors' or name.startswith('__'):
-            # Return immediately.
-            return super(ResourceBase, self).__getattribute__(name)
-
-        # Attempt to get the attribute from a connector.
-        connectors = self.__dict__.get('connectors')
-        if connectors and isinstance(connectors[0], type):
-            for connector in self.connectors:
-                attr = connector.__dict__.get(name)
-                if attr is not None:
-                    # Found attribute.
-                    if hasattr(attr, '__get__'):
-                        # This has a descriptor; wrap it to use the
-                        # current cls.
-                        return attr.__get__(None, self)
-                        # return lambda *a, **kw: attr.__get__(self, *a, **kw)
-
-                    # Return a normal attribute.
-                    return attr
-
-        # Found nothing; continue as normal.
-        return super(ResourceBase, self).__getattribute__(name)
-
     @classmethod
     def _is_resource(cls, name, bases):
         if name == 'NewBase':
@@ -122,6 +104,12 @@ class ResourceBase(type):
             for media_type in serializer.media_types:
                 smap[media_type] = key
 
+        # Describe the available serializers to clients that accept none
+        # of them.
+        self._available_serializers = dict(
+            (key, self.meta.serializers[key].media_types[0])
+            for key in self.meta.allowed_serializers)
+
         # Generate a deserializer map that maps media ranges to deserializer
         # names.
         self._deserializer_map = dmap = {}
@@ -130,6 +118,11 @@ class ResourceBase(type):
             for media_type in deserializer.media_types:
                 dmap[media_type] = key
 
+        # Remember the outcome of negotiation for each header value; the
+        # values seen in practice are few.
+        self._serializer_cache = utils.LRUCache(NEGOTIATION_CACHE_SIZE)
+        self._deserializer_cache = utils.LRUCache(NEGOTIATION_CACHE_SIZE)
+
         # Filter the available connectors according to the
         # metaclass restriction set.
         for key in list(meta.connectors.keys()):
@@ -158,5 +151,26 @@ class ResourceBase(type):
                     # Found a connector class for this connector
                     connectors.append(klass)
 
+        # Freeze the connector chain; it is fixed for the lifetime of
+        # the class object.
+        self.connectors = connectors = tuple(connectors)
+
+        # Flatten the attributes provided by the connectors onto the class
+        # object itself so they resolve through normal attribute lookup.
+        # Attributes declared directly on the class take precedence; after
+        # that the first connector to provide an attribute wins. An
+        # attribute is only installed on the first class to get it; its
+        # subclasses inherit it (so `connector_super` resolves past it).
+        installed = {}
+        for connector in reversed(connectors):
+            for key, value in six.iteritems(vars(connector)):
+                if not key.startswith('__') and key not in attrs:
+                    installed[key] = value
+
+        for key, value in six.iteritems(installed):
+            if not any(vars(base).get(key) is value
+                       for base in self.__mro__[1:]):
+                setattr(self, key, value)
+
         # Return the constructed instance.
         return self
@@ -5,6 +5,7 @@ import six
 from importlib import import_module
 from armet import utils, authentication, authorization
 from armet.exceptions import ImproperlyConfigured
+from .router import Router
 
 
 def _merge(options, name, bases, default=None):
@@ -84,6 +85,19 @@ class ResourceOptions(object):
         #! terminate the connection.
         self.asynchronous = meta.get('asynchronous', False)
 
+        #! Bounds (in bytes) of the chunks of an asynchronous response that
+        #! are queued for the client.
+        #!
+        #! Once `high_watermark` bytes are queued, `response.send()` blocks
+        #! until the client has been sent enough that no more than
+        #! `low_watermark` bytes remain (on asyncio, where `send()` cannot
+        #! block, `await response.drain()` waits for that instead).
+        #! A `high_watermark` of None leaves the queue unbounded.
+        self.high_watermark = meta.get('high_watermark', 65536)
+        self.low_watermark = meta.get('low_watermark')
+        if self.low_watermark is None and self.high_watermark is not None:
+            self.low_watermark = self.high_watermark // 4
+
         #! Connectors to use to connect to the environment.
         #!
         #! This is a dictionary that maps hooks (keys) to the connector to use
@@ -94,8 +108,11 @@ class ResourceOptions(object):
         #!
         #! The available connectors are as follows:
         #!  - http:
+        #!      > asgi
+        #!      > bottle
         #!      > django
         #!      > flask
+        #!      > wsgi
         #!
         #! They may be used as follows:
         #!
@@ -186,14 +203,18 @@ class ResourceOptions(object):
         #!         ]
         #!
         #! @endcode
-        self.patterns = meta.get('patterns', [])
-        for index, pattern in enumerate(self.patterns):
+        self.patterns = []
+        for pattern in meta.get('patterns', []):
             # Coerce simple form.
             if isinstance(pattern, six.string_types):
                 pattern = (None, pattern)
 
             # Compile the expression.
-            self.patterns[index] = (pattern[0], re.compile(pattern[1]))
+            self.patterns.append((pattern[0], re.compile(pattern[1])))
+
+        #! Router that matches the request path against all of the
+        #! patterns in a single pass.
+        self.router = Router(self.patterns)
 
         #! Trailing slash handling.
         #! The value indicates which URI is the canonical URI and the
@@ -0,0 +1,101 @@
+# -*- coding: utf-8 -*-
+from __future__ import absolute_import, unicode_literals, division
+import re
+
+
+#! Expression that finds named groups and named back-references in the
+#! source of a pattern.
+_NAMED = re.compile(r'\(\?P(?:<(?P<group>\w+)>|=(?P<reference>\w+)\))')
+
+#! Expression that finds numbered back-references in the source
+#! of a pattern; these cannot survive being merged with other patterns.
+_NUMBERED = re.compile(r'\\[1-9]')
+
+#! Expression that finds inline global flags (eg. `(?i)`) in the source of
+#! a pattern; these are only allowed at the start of an expression.
+_GLOBAL_FLAGS = re.compile(r'(?<!\\)\(\?[aiLmsux]+\)')
+
+
+class Router(object):
+    """Matches a path against an ordered sequence of patterns.
+
+    The patterns are merged into a single alternation at construction so
+    that resolving a path costs one expression match regardless of how many
+    patterns are declared. Named groups are renamed per-pattern so patterns
+    may freely reuse group names.
+
+    Only the patterns of a single resource are merged; the patterns of a
+    traversal target are matched by the router of the target against what
+    remains of the path (which a pattern may choose with a named group),
+    so resolving costs one match per level of traversal.
+    """
+
+    def __init__(self, patterns):
+        #! The ordered sequence of (resource, compiled pattern) pairs.
+        self.patterns = patterns
+
+        #! The merged expression; None if the patterns could not be
+        #! merged (eg. they use differing or inline global flags or
+        #! numbered references).
+        self.expression = None
+
+        #! Maps the name of each alternative in the merged expression to its
+        #! resource and a sequence of its (renamed, original) group names.
+        self._targets = {}
+
+        flags = set(pattern.flags for _, pattern in patterns)
+        if len(flags) != 1:
+            # Nothing to merge or the patterns can't share an expression.
+            return
+
+        alternatives = []
+        for index, (resource, pattern) in enumerate(patterns):
+            if _NUMBERED.search(pattern.pattern):
+                # Numbered groups would be renumbered by the merge.
+                return
+
+            if _GLOBAL_FLAGS.search(pattern.pattern):
+                # Inline global flags would no longer be at the start.
+                return
+
+            names = []
+
+            def rename(match, index=index, names=names):
+                group, reference = match.group('group', 'reference')
+                if group is not None:
+                    names.append(('_{}_{}'.format(index, group), group))
+                    return '(?P<_{}_{}>'.format(index, group)
+
+                return '(?P=_{}_{})'.format(index, reference)
+
+            source = _NAMED.sub(rename, pattern.pattern)
+            alternatives.append('(?P<_{}>{})'.format(index, source))
+            self._targets['_{}'.format(index)] = resource, names
+
+        self.expression = re.compile('|'.join(alternatives), flags.pop())
+
+    def match(self, path):
+        """Matches the path against the patterns.
+
+        @returns
+            A tuple of the target resource (or None), the dictionary of
+            named groups and the unmatched remainder of the path; or None if
+            no pattern matched.
+        """
+        if self.expression is None:
+            # Fall back to matching each pattern in turn.
+            for resource, pattern in self.patterns:
+                match = pattern.match(path)
+                if match is not None:
+                    return resource, match.groupdict(), path[match.end():]
+
+            return None
+
+        match = self.expression.match(path)
+        if match is None:
+            return None
+
+        # The outermost group of the matched alternative closes last.
+        resource, names = self._targets[match.lastgroup]
+        data = {original: match.group(name) for name, original in names}
+        return resource, data, path[match.end():]
@@ -34,3 +34,25 @@ def classconnect(name):
             cls.__name__, name))
 
     return proxy
+
+
+def connector_super(cls, connector, name):
+    """
+    Returns a proxy (as `super` does) that resolves attributes past the
+    class the named attribute of the connector was installed on.
+
+    This is used by a connector to defer to the resource implementation
+    it was installed over; regardless of how deeply the resource is
+    subclassed.
+
+    @code
+        connector_super(cls, Resource, 'view').view(request, response)
+    @endcode
+    """
+    value = vars(connector)[name]
+    for base in cls.__mro__:
+        if vars(base).get(name) is value:
+            return super(base, cls)
+
+    raise AttributeError("type object '%s' has no connector attribute '%s'" % (
+        cls.__name__, name))
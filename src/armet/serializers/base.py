@@ -43,3 +43,23 @@ class Serializer(object):
         # Return the serialized data.
         # This has normally been transformed by a base class.
         return data
+
+    def stream(self, data):
+        """
+        Transforms an iterable of objects into an iterable of chunks of
+        the serialized text.
+
+        The chunks are yielded instead of being written to the response;
+        only the headers are applied to the response, before the first
+        chunk is produced. By default, the iterable is serialized at once.
+
+        @throws ValueError
+            To indicate this serializer does not support the encoding of the
+            specified object.
+        """
+        if self.response is not None:
+            # Set the content type.
+            self.response['Content-Type'] = self.media_types[0]
+
+        # Serialize everything without writing it to the response.
+        yield type(self)(self.request).serialize(list(data))
@@ -11,6 +11,10 @@ class JSONSerializer(Serializer):
 
     media_types = media_types.JSON
 
+    #! Number of characters to gather before yielding a chunk when
+    #! streaming a sequence of objects.
+    chunk_size = 8192
+
     @staticmethod
     def _default(obj):
         if isinstance(obj, Iterable):
@@ -47,3 +51,26 @@ class JSONSerializer(Serializer):
 
         # Return us to the base to enclose it inside of a response object.
         return super(JSONSerializer, self).serialize(text)
+
+    def stream(self, data):
+        if self.response is not None:
+            # Set the content type.
+            self.response['Content-Type'] = self.media_types[0]
+
+        # Encode the items one by one; gathering them into chunks
+        # of at least `chunk_size` characters.
+        encode = json.JSONEncoder(**self.options).encode
+        chunk, size = ['['], 1
+        for index, item in enumerate(data):
+            if index:
+                chunk.append(',')
+
+            text = encode(item)
+            chunk.append(text)
+            size += len(text)
+            if size >= self.chunk_size:
+                yield ''.join(chunk)
+                chunk, size = [], 0
+
+        chunk.append(']')
+        yield ''.join(chunk)
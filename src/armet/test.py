@@ -92,6 +92,10 @@ class Client:
         kwargs.setdefault('method', 'PUT')
         return self.request(*args, **kwargs)
 
+    def patch(self, *args, **kwargs):
+        kwargs.setdefault('method', 'PATCH')
+        return self.request(*args, **kwargs)
+
     def delete(self, *args, **kwargs):
         kwargs.setdefault('method', 'DELETE')
         return self.request(*args, **kwargs)
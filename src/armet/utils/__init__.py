@@ -1,14 +1,17 @@
 # -*- coding: utf-8 -*-
 from __future__ import absolute_import, unicode_literals, division
 from .decorators import classproperty, boundmethod
-from .functional import cons
+from .functional import cons, isawaitable
 from .string import dasherize
 from .package import import_module
+from .cache import LRUCache
 
 __all__ = [
     'classproperty',
     'boundmethod',
     'cons',
+    'isawaitable',
     'import_module',
-    'dasherize'
+    'dasherize',
+    'LRUCache',
 ]
@@ -0,0 +1,72 @@
+# -*- coding: utf-8 -*-
+from __future__ import absolute_import, unicode_literals, division
+import threading
+from collections import OrderedDict, namedtuple
+
+
+#! Statistics of a cache.
+CacheInfo = namedtuple('CacheInfo', ('hits', 'misses', 'maxsize', 'currsize'))
+
+
+class LRUCache(object):
+    """A bounded, thread-safe mapping that evicts the least recently
+    used entry once full.
+    """
+
+    def __init__(self, maxsize):
+        #! Maximum number of entries to retain.
+        self.maxsize = maxsize
+
+        #! Entries ordered from least to most recently used.
+        self._entries = OrderedDict()
+
+        #! Number of lookups that were served from and missed the cache.
+        self._hits = self._misses = 0
+
+        #! Guards the entries and statistics.
+        self._lock = threading.Lock()
+
+    def get(self, key, default=None):
+        """Retrieves the entry for the key, marking it as recently used.
+        """
+        with self._lock:
+            try:
+                value = self._entries.pop(key)
+
+            except KeyError:
+                self._misses += 1
+                return default
+
+            # Re-insert the entry as the most recently used.
+            self._entries[key] = value
+            self._hits += 1
+            return value
+
+    def set(self, key, value):
+        """Stores the entry for the key; evicting as needed."""
+        with self._lock:
+            self._entries.pop(key, None)
+            self._entries[key] = value
+            while len(self._entries) > self.maxsize:
+                # Evict the least recently used entry.
+                self._entries.popitem(last=False)
+
+    def delete(self, key):
+        """Removes the entry for the key, if any."""
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def info(self):
+        """Reports the hits, misses and size of the cache."""
+        with self._lock:
+            return CacheInfo(
+                self._hits, self._misses, self.maxsize, len(self._entries))
+
+    def clear(self):
+        """Empties the cache and resets its statistics."""
+        with self._lock:
+            self._entries.clear()
+            self._hits = self._misses = 0
+
+    def __len__(self):
+        return len(self._entries)
@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 from __future__ import absolute_import, unicode_literals, division
 import six
+import inspect
 import collections
 
 
@@ -27,3 +28,11 @@ def cons(collection, value):
         collection.append(value)
 
     return collection
+
+
+def isawaitable(value):
+    """Tests if the value can be awaited (eg. it is the coroutine returned
+    by an `async def` function); nothing can be before python 3.5.
+    """
+    test = getattr(inspect, 'isawaitable', None)
+    return test is not None and test(value)
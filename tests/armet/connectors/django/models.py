@@ -8,3 +8,13 @@ class Poll(models.Model):
     question = models.CharField(max_length=1024)
 
     available = models.NullBooleanField()
+
+
+class Choice(models.Model):
+
+    poll = models.ForeignKey(
+        Poll, related_name='choices', on_delete=models.CASCADE)
+
+    choice = models.CharField(max_length=256)
+
+    votes = models.IntegerField()
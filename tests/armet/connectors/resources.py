@@ -2,7 +2,7 @@
 from __future__ import absolute_import, unicode_literals, division
 import sys
 import armet
-from armet import resources
+from armet import resources, authorization
 
 # Request the generic models module inserted by the test runner.
 models = sys.modules['tests.armet.connectors.models']
@@ -10,6 +10,10 @@ models = sys.modules['tests.armet.connectors.models']
 __all__ = [
     'SimpleResource',
     'PollResource',
+    'BallotResource',
+    'ChoiceResource',
+    'StreamedChoiceResource',
+    'TallyResource',
     'StreamingResource',
     'AsyncResource',
     'AsyncStreamResource',
@@ -19,6 +23,7 @@ __all__ = [
     'LeftResource',
     'RightResource',
     'echo',
+    'pieces',
     'cookie',
     'DirectResource',
     'IndirectResource',
@@ -161,6 +166,71 @@ class PollResource(resources.ModelResource):
     available = resources.BooleanAttribute('available')
 
 
+class BallotResource(PollResource):
+
+    # The choices of the poll; a collection.
+    choice = resources.TextAttribute('choices.choice', include=False)
+
+
+class ChoiceResource(resources.ModelResource):
+
+    class Meta:
+        model = models.Choice
+
+        slug = resources.IntegerAttribute('poll.id')
+
+        conditional = True
+
+    id = resources.IntegerAttribute('id')
+
+    choice = resources.TextAttribute('choice')
+
+    votes = resources.IntegerAttribute('votes')
+
+    question = resources.TextAttribute('poll.question')
+
+
+class StreamedChoiceResource(ChoiceResource):
+
+    class Meta:
+        streaming = True
+
+        # Prefetch (rather than join) the polls; on django.
+        select_related = ()
+        prefetch_related = ('poll',)
+
+
+class TallyAuthorization(authorization.Authorization):
+
+    def is_authorized(self, user, operation, resource, item):
+        # Choices may not be given negative votes.
+        return operation == 'read' or (item.votes or 0) >= 0
+
+    def filter(self, user, operation, resource, iterable):
+        if operation == 'destroy':
+            # Only choices without votes may be destroyed; the queryset
+            # is of either model connector.
+            return getattr(iterable, 'filter_by', iterable.filter)(votes=0)
+
+        return iterable
+
+
+class TallyResource(resources.ModelResource):
+
+    class Meta:
+        model = models.Choice
+
+        version = 'votes'
+
+        authorization = TallyAuthorization()
+
+    id = resources.IntegerAttribute('id')
+
+    choice = resources.TextAttribute('choice')
+
+    votes = resources.IntegerAttribute('votes')
+
+
 class LeftResource(resources.Resource):
 
     class Meta:
@@ -194,6 +264,15 @@ def echo(request, response):
     response.write(data, serialize=True)
 
 
+@armet.resource(methods='POST')
+def pieces(request, response):
+    # Read the body a line, a few characters and the rest at a time.
+    response['Content-Type'] = 'text/plain'
+    response.write('|'.join((
+        request.readline(), request.read(2), request.read(-1),
+        request.read())))
+
+
 @armet.resource(methods='GET')
 def cookie(request, response):
     response['Content-Type'] = 'text/plain'
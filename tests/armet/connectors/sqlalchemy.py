@@ -28,6 +28,21 @@ class Poll(Base):
     available = sa.Column(sa.Boolean)
 
 
+class Choice(Base):
+
+    __tablename__ = 'choice'
+
+    id = sa.Column(sa.Integer, primary_key=True)
+
+    poll_id = sa.Column(sa.Integer, sa.ForeignKey('poll.id'))
+
+    poll = orm.relationship(Poll, backref='choices')
+
+    choice = sa.Column(sa.String(256))
+
+    votes = sa.Column(sa.Integer)
+
+
 def _load_fixture(filename):
     """
     Loads the passed fixture into the database following the
@@ -52,6 +67,11 @@ def _load_fixture(filename):
         # Add the primary key.
         item['fields']['id'] = item['pk']
 
+        # Foreign keys are named after the relationship by django.
+        for name in list(item['fields']):
+            if name + '_id' in table.c:
+                item['fields'][name + '_id'] = item['fields'].pop(name)
+
         # Add a new row.
         session.connection().execute(table.insert().values(**item['fields']))
 
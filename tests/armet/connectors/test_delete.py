@@ -1,5 +1,6 @@
 # -*- coding: utf-8 -*-
 from __future__ import absolute_import, unicode_literals, division
+import json
 from armet import http
 from .base import BaseResourceTest
 
@@ -12,3 +13,25 @@ class TestResourceDelete(BaseResourceTest):
             headers={'Content-Type': 'application/json'})
 
         assert response.status == http.client.NO_CONTENT
+
+
+class TestResourceDeleteMany(BaseResourceTest):
+
+    def choices(self):
+        _, content = self.client.request('/api/tally/')
+        return [x['choice'] for x in json.loads(content.decode('utf8'))]
+
+    def test_delete_list(self, connectors):
+        response, _ = self.client.delete(path='/api/tally/')
+
+        assert response.status == http.client.NOT_IMPLEMENTED
+        assert len(self.choices()) == 6
+
+    def test_delete_query(self, connectors):
+        response, _ = self.client.delete(path='/api/tally/?votes=0,1')
+
+        assert response.status == http.client.NO_CONTENT
+
+        # Only the items that may be destroyed are.
+        assert self.choices() == [
+            'Innie', 'Never', 'Yes', 'Twice', 'Beside']
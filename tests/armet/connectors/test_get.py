@@ -55,6 +55,18 @@ class TestResourceQuery(BaseResourceTest):
         assert len(data) == 1
         assert data[0]['question'] == 'Are you an innie or an outie?'
 
+    def test_trailing_combinator(self, connectors):
+        response, content = self.client.request('/api/poll/?id=1&')
+
+        assert response.status == http.client.OK
+        assert len(json.loads(content.decode('utf-8'))) == 1
+
+    def test_malformed(self, connectors):
+        for query in ('id=1)', 'id=', 'id=1&&id=2', 'id=!1'):
+            response, _ = self.client.request('/api/poll/?' + query)
+
+            assert response.status == http.client.BAD_REQUEST
+
     def test_param_eq_same_and(self, connectors):
         response, content = self.client.request('/api/poll/?id=1&id=2')
 
@@ -119,3 +131,183 @@ class TestResourceQuery(BaseResourceTest):
 
         assert isinstance(data, list)
         assert len(data) == 4
+
+
+class TestResourceRelated(BaseResourceTest):
+
+    def test_list(self, connectors):
+        response, content = self.client.request('/api/choice/')
+
+        assert response.status == http.client.OK
+
+        data = json.loads(content.decode('utf-8'))
+
+        assert len(data) == 6
+        assert data[0]['question'] == 'Are you an innie or an outie?'
+        assert data[0]['choice'] == 'Innie'
+
+    def test_fields(self, connectors):
+        response, content = self.client.request(
+            '/api/choice:fields=question,votes/')
+
+        assert response.status == http.client.OK
+
+        data = json.loads(content.decode('utf-8'))
+
+        assert data[1] == {
+            'question': 'Have you ever written a song?', 'votes': 5}
+
+
+class TestResourceSort(BaseResourceTest):
+
+    def sort(self, names):
+        response, content = self.client.request(
+            '/api/choice:sort={}/'.format(names))
+
+        assert response.status == http.client.OK
+
+        return [x['choice'] for x in json.loads(content.decode('utf-8'))]
+
+    def test_ascending(self, connectors):
+        assert self.sort('votes') == [
+            'Once', 'Beside', 'Yes', 'Innie', 'Twice', 'Never']
+
+    def test_descending(self, connectors):
+        assert self.sort('-votes') == [
+            'Never', 'Twice', 'Innie', 'Yes', 'Beside', 'Once']
+
+    def test_dotted(self, connectors):
+        assert self.sort('question') == [
+            'Innie', 'Yes', 'Beside', 'Once', 'Twice', 'Never']
+
+        assert self.sort('-question') == [
+            'Never', 'Twice', 'Once', 'Beside', 'Yes', 'Innie']
+
+    def test_invalid(self, connectors):
+        response, _ = self.client.request('/api/choice:sort=nothing/')
+
+        assert response.status == http.client.BAD_REQUEST
+
+    def test_filtered(self, connectors):
+        response, content = self.client.request(
+            '/api/choice:sort=-question/?votes>1')
+
+        assert response.status == http.client.OK
+
+        data = json.loads(content.decode('utf-8'))
+
+        assert [x['choice'] for x in data] == [
+            'Never', 'Twice', 'Yes', 'Innie']
+
+    def test_collection(self, connectors):
+        if connectors['model'] != 'sqlalchemy':
+            # Only the sqlalchemy connector resolves the sort paths.
+            return
+
+        response, _ = self.client.request('/api/ballot:sort=choice/')
+
+        assert response.status == http.client.BAD_REQUEST
+
+
+class TestResourceHead(BaseResourceTest):
+
+    def head(self, path, **headers):
+        response, content = self.client.request(
+            path, method='HEAD', headers=headers)
+
+        assert content == b''
+
+        return response
+
+    def compare(self, path):
+        # The headers describe the body of the equivalent `GET`.
+        response = self.head(path)
+        expected, content = self.client.request(path)
+
+        assert response.status == expected.status
+        for name in ('content-type', 'content-length', 'etag',
+                     'content-range', 'link'):
+            assert response.get(name) == expected.get(name)
+
+        return response, content
+
+    def test_item(self, connectors):
+        response, content = self.compare('/api/tally/1/')
+
+        assert response.status == http.client.OK
+        assert response['content-type'] == 'application/json'
+        assert response['content-length'] == str(len(content))
+
+    def test_list(self, connectors):
+        response, _ = self.compare('/api/tally/')
+
+        assert response.status == http.client.OK
+        assert 'content-range' not in response
+
+        response, _ = self.compare('/api/tally:limit=2:offset=1/')
+
+        assert response['content-range'] == 'items 1-2/*'
+        assert 'rel="next"' in response['link']
+
+        assert self.head('/api/tally/?votes=3')['etag'] != response['etag']
+
+    def test_body_tag(self, connectors):
+        # The entity tag of a body without versions is sent as well.
+        response, _ = self.compare('/api/choice/')
+
+        assert response['etag']
+
+    def test_not_modified(self, connectors):
+        etag = self.head('/api/tally/2/')['etag']
+        response = self.head('/api/tally/2/', **{'If-None-Match': etag})
+
+        assert response.status == http.client.NOT_MODIFIED
+
+        response = self.head('/api/tally/', **{'If-None-Match': etag})
+
+        assert response.status == http.client.OK
+
+    def test_not_found(self, connectors):
+        response = self.head('/api/tally/42/')
+
+        assert response.status == http.client.NOT_FOUND
+
+
+class TestResourceStreamed(BaseResourceTest):
+
+    def test_list(self, connectors):
+        response, content = self.client.request('/api/streamed-choice/')
+
+        assert response.status == http.client.OK
+
+        data = json.loads(content.decode('utf-8'))
+
+        assert len(data) == 6
+        assert data[0]['question'] == 'Are you an innie or an outie?'
+
+    def test_prefetch(self, connectors):
+        if connectors['model'] != 'django':
+            # Only the django connector prefetches.
+            return
+
+        from django.db import connection
+        from django.test.utils import CaptureQueriesContext
+
+        with CaptureQueriesContext(connection) as queries:
+            self.client.request('/api/streamed-choice/')
+
+        # The polls are read in a single query; not one per choice.
+        assert len(queries) == 2
+
+
+class TestResourcePagination(BaseResourceTest):
+
+    def test_after_dotted_slug(self, connectors):
+        response, content = self.client.request(
+            '/api/choice:limit=2:after=3/')
+
+        assert response.status == http.client.OK
+
+        data = json.loads(content.decode('utf-8'))
+
+        assert [x['choice'] for x in data] == ['Once', 'Twice']
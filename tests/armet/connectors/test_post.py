@@ -22,6 +22,45 @@ class TestResourcePost(BaseResourceTest):
         assert data['question'] == 'Is anybody really out there?'
         assert data['id'] == 101
 
+    def test_post_many(self, connectors):
+        data = [{'question': 'Is anybody really out there?'},
+                {'question': 'Is anybody listening?'}]
+        body = json.dumps(data)
+        response, content = self.client.post(
+            path='/api/poll/', body=body,
+            headers={'Content-Type': 'application/json'})
+
+        assert response.status == http.client.CREATED
+
+        data = json.loads(content.decode('utf8'))
+
+        assert data[1]['question'] == 'Is anybody listening?'
+
+        # Each of the items is created with its own identity.
+        first, second = [x['id'] for x in data]
+
+        assert first > 100
+        assert second == first + 1
+
+        response, content = self.client.request(
+            '/api/poll/{}/'.format(second))
+        data = json.loads(content.decode('utf8'))
+
+        assert response.status == http.client.OK
+        assert data['question'] == 'Is anybody listening?'
+
+    def test_post_many_rejected(self, connectors):
+        data = [{'choice': 'Maybe', 'votes': 1},
+                {'choice': 'Unlikely', 'votes': -1}]
+        response, _ = self.client.post(path='/api/tally/', body=data)
+
+        assert response.status == http.client.FORBIDDEN
+
+        # None of the items are created.
+        response, content = self.client.request('/api/tally/')
+
+        assert len(json.loads(content.decode('utf8'))) == 6
+
 
 class TestResourceEcho(BaseResourceTest):
 
@@ -64,3 +103,14 @@ class TestResourceEcho(BaseResourceTest):
 
     def test_echo_url_json(self, connectors):
         self.echo('url', 'json')
+
+
+class TestResourceBody(BaseResourceTest):
+
+    def test_pieces(self, connectors):
+        response, content = self.client.post(
+            path='/api/pieces/', body='first\nsecond\nthird',
+            headers={'Content-Type': 'text/plain'})
+
+        assert response.status == http.client.OK
+        assert content.decode('utf-8') == 'first\n|se|cond\nthird|'
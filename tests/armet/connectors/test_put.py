@@ -21,3 +21,69 @@ class TestResourcePut(BaseResourceTest):
         assert isinstance(data, dict)
         assert data['question'] == 'Is anybody really out there?'
         assert data['id'] == 1
+
+
+class TestResourcePutMany(BaseResourceTest):
+
+    def read(self, slug):
+        _, content = self.client.request('/api/tally/{}/'.format(slug))
+        return json.loads(content.decode('utf8'))
+
+    def test_put_many(self, connectors):
+        data = [{'id': 1, 'choice': 'In', 'votes': 4},
+                {'id': 2, 'choice': 'Out', 'votes': 6}]
+        response, content = self.client.put(path='/api/tally/', body=data)
+
+        assert response.status == http.client.OK
+        assert json.loads(content.decode('utf8')) == data
+        assert self.read(1) == data[0]
+        assert self.read(2) == data[1]
+
+    def test_put_many_rejected(self, connectors):
+        data = [{'id': 3, 'choice': 'Sure', 'votes': 7},
+                {'id': 4, 'choice': 'Nope', 'votes': -1}]
+        response, _ = self.client.put(path='/api/tally/', body=data)
+
+        assert response.status == http.client.FORBIDDEN
+
+        # None of the items are changed.
+        assert self.read(3) == {'id': 3, 'choice': 'Yes', 'votes': 2}
+        assert self.read(4) == {'id': 4, 'choice': 'Once', 'votes': 0}
+
+    def test_put_many_missing(self, connectors):
+        data = [{'id': 3, 'choice': 'Sure', 'votes': 7},
+                {'id': 42, 'choice': 'Nope', 'votes': 1}]
+        response, _ = self.client.put(path='/api/tally/', body=data)
+
+        assert response.status == http.client.NOT_FOUND
+        assert self.read(3) == {'id': 3, 'choice': 'Yes', 'votes': 2}
+
+    def test_put_many_invalid(self, connectors):
+        # Each element of the array must be an item.
+        for data in ([1, 2], [{'id': 3, 'votes': 7}, 'Nope']):
+            response, _ = self.client.put(path='/api/tally/', body=data)
+
+            assert response.status == http.client.BAD_REQUEST
+
+        response, _ = self.client.patch(path='/api/tally/', body=[None])
+
+        assert response.status == http.client.BAD_REQUEST
+        assert self.read(3) == {'id': 3, 'choice': 'Yes', 'votes': 2}
+
+    def test_patch_many(self, connectors):
+        data = [{'id': 5, 'votes': 9}, {'id': 6, 'choice': 'Aside'}]
+        response, content = self.client.patch(path='/api/tally/', body=data)
+
+        assert response.status == http.client.OK
+
+        # Only the given attributes are changed.
+        assert self.read(5) == {'id': 5, 'choice': 'Twice', 'votes': 9}
+        assert self.read(6) == {'id': 6, 'choice': 'Aside', 'votes': 1}
+
+    def test_patch_many_rejected(self, connectors):
+        data = [{'id': 5, 'votes': 10}, {'id': 6, 'votes': -1}]
+        response, _ = self.client.patch(path='/api/tally/', body=data)
+
+        assert response.status == http.client.FORBIDDEN
+        assert self.read(5)['votes'] == 9
+        assert self.read(6)['votes'] == 1
@@ -0,0 +1,162 @@
+# -*- coding: utf-8 -*-
+from __future__ import absolute_import, unicode_literals, division
+import asyncio
+import unittest
+from armet import resources, http
+from armet.connectors.asgi import Application
+from armet.connectors.asgi.http import Queue
+
+
+class Resource(resources.Resource):
+
+    class Meta:
+        connectors = {'http': 'asgi'}
+
+    def get(self, request, response):
+        response['Content-Type'] = 'text/plain'
+        return 'sync'
+
+
+class AsyncResource(Resource):
+
+    async def get(self, request, response):
+        await asyncio.sleep(0)
+        response['Content-Type'] = 'text/plain'
+        return 'async'
+
+    async def post(self, request, response):
+        chunks = []
+        async for chunk in request.stream():
+            chunks.append(chunk)
+
+        response['Content-Type'] = 'text/plain'
+        return b'-'.join(chunks).decode('utf8')
+
+    async def put(self, request, response):
+        raise http.exceptions.Forbidden()
+
+
+class StreamResource(Resource):
+
+    async def get(self, request, response):
+        async def chunks():
+            for index in range(3):
+                yield '{}'.format(index).encode('utf8')
+
+        return chunks()
+
+
+class QueuedResource(Resource):
+
+    class Meta:
+        asynchronous = True
+        high_watermark = 4
+
+    def get(self, request, response):
+        async def produce():
+            for index in range(8):
+                response.send('{}{}'.format(index, index).encode('utf8'))
+                await response.drain()
+
+            response.close()
+
+        asyncio.ensure_future(produce())
+
+
+class ApplicationTestCase(unittest.TestCase):
+
+    def setUp(self):
+        self.application = Application()
+        for resource in (Resource, AsyncResource, StreamResource,
+                         QueuedResource):
+            resource.mount('/api/', self.application)
+
+    def call(self, method, path, chunks=(b'',)):
+        messages = [{'type': 'http.request', 'body': chunk, 'more_body': True}
+                    for chunk in chunks]
+        messages[-1]['more_body'] = False
+        sent = []
+
+        async def receive():
+            return messages.pop(0)
+
+        async def send(message):
+            sent.append(message)
+
+        scope = {'type': 'http', 'method': method, 'path': path,
+                 'query_string': b'', 'headers': [(b'host', b'localhost')]}
+        loop = asyncio.new_event_loop()
+        loop.run_until_complete(self.application(scope, receive, send))
+        loop.close()
+
+        body = b''.join(message.get('body', b'') for message in sent[1:])
+        return sent[0]['status'], body
+
+    def test_sync(self):
+        assert self.call('GET', '/api/resource/') == (200, b'sync')
+
+    def test_async(self):
+        assert self.call('GET', '/api/async/') == (200, b'async')
+
+    def test_async_error(self):
+        assert self.call('PUT', '/api/async/') == (403, b'')
+
+    def test_request_stream(self):
+        result = self.call('POST', '/api/async/', [b'a', b'b', b'c'])
+
+        assert result == (200, b'a-b-c')
+
+    def test_response_stream(self):
+        assert self.call('GET', '/api/stream/') == (200, b'012')
+
+    def test_queued(self):
+        result = self.call('GET', '/api/queued/')
+
+        assert result == (200, b'0011223344556677')
+
+    def test_not_found(self):
+        assert self.call('GET', '/api/nothing/') == (404, b'')
+
+
+class QueueTestCase(unittest.TestCase):
+
+    def setUp(self):
+        self.loop = asyncio.new_event_loop()
+        self.queue = Queue(high_watermark=8, low_watermark=2)
+
+    def tearDown(self):
+        self.loop.close()
+
+    def get(self):
+        return self.loop.run_until_complete(self.queue.get())
+
+    def test_pause(self):
+        for chunk in (b'abc', b'def', b'gh'):
+            self.queue.put(chunk)
+
+        assert self.queue.paused
+        assert self.queue.depth == 8
+
+        assert self.get() == b'abc'
+        assert self.queue.paused
+
+        assert self.get() == b'def'
+        assert not self.queue.paused
+        assert self.queue.depth == 2
+
+    def test_metrics(self):
+        for _ in range(2):
+            for chunk in (b'abcd', b'efgh'):
+                self.queue.put(chunk)
+
+            while self.queue.depth:
+                self.get()
+
+        assert self.queue.peak == 8
+        assert self.queue.pauses == 2
+
+    def test_unbounded(self):
+        queue = Queue()
+        queue.put(b'x' * 1024)
+
+        assert not queue.paused
@@ -0,0 +1,97 @@
+# -*- coding: utf-8 -*-
+from __future__ import absolute_import, unicode_literals, division
+import unittest
+from armet import resources
+
+
+class User(object):
+
+    def __init__(self, name):
+        self.name = name
+
+    def shout(self):
+        return self.name.upper()
+
+
+class Poll(object):
+
+    def __init__(self, user=None):
+        self.user = user
+
+    @property
+    def owner(self):
+        return self.user
+
+
+def related(cls, name):
+    return User if (cls, name) in ((Poll, 'user'), (Poll, 'owner')) else None
+
+
+class AttributeTestCase(unittest.TestCase):
+
+    def attribute(self, path, bind=False):
+        attribute = resources.Attribute(path)
+        if bind:
+            attribute.bind(Poll, related)
+
+        return attribute
+
+    def test_no_path(self):
+        assert self.attribute(None).get(Poll()) is None
+
+    def test_mapping(self):
+        for bind in (False, True):
+            attribute = self.attribute('user.name', bind)
+
+            assert attribute.get({'user': {'name': 'x'}}) == 'x'
+            assert attribute.get({'user': None}) is None
+
+    def test_object(self):
+        for bind in (False, True):
+            attribute = self.attribute('user.name', bind)
+
+            assert attribute.get(Poll(User('x'))) == 'x'
+            assert attribute.get(Poll()) is None
+
+    def test_descriptor(self):
+        for bind in (False, True):
+            attribute = self.attribute('owner.name', bind)
+
+            assert attribute.get(Poll(User('x'))) == 'x'
+
+    def test_method(self):
+        for bind in (False, True):
+            attribute = self.attribute('user.shout', bind)
+
+            assert attribute.get(Poll(User('x'))) == 'X'
+
+    def test_heterogeneous(self):
+        attribute = self.attribute('user.name', True)
+
+        assert attribute.get({'user': User('x')}) == 'x'
+        assert attribute.get(Poll({'name': 'y'})) == 'y'
+
+    def test_parent(self):
+        for bind in (False, True):
+            attribute = self.attribute('user.name', bind)
+            user = User('x')
+
+            assert attribute.get(Poll(user), parent=True) is user
+
+    def test_set(self):
+        for bind in (False, True):
+            poll = Poll(User('x'))
+            self.attribute('user.name', bind).set(poll, 'y')
+
+            assert poll.user.name == 'y'
+
+            item = {'user': {}}
+            self.attribute('user.name', bind).set(item, 'z')
+
+            assert item['user']['name'] == 'z'
+
+    def test_clone(self):
+        attribute = self.attribute('user.name', True).clone()
+
+        assert attribute.path == 'user.name'
+        assert attribute.get({'user': {'name': 'x'}}) == 'x'
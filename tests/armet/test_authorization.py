@@ -0,0 +1,18 @@
+# -*- coding: utf-8 -*-
+from __future__ import absolute_import, unicode_literals, division
+import unittest
+from armet import authorization
+
+
+class AuthorizeManyTestCase(unittest.TestCase):
+
+    def test_partition(self):
+        class Authorization(authorization.Authorization):
+            def is_authorized(self, user, operation, resource, item):
+                return item % 2 == 0
+
+        allowed, denied = Authorization().authorize_many(
+            None, 'update', None, [1, 2, 3, 4])
+
+        assert allowed == [2, 4]
+        assert denied == [1, 3]
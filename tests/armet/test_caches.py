@@ -0,0 +1,55 @@
+# -*- coding: utf-8 -*-
+from __future__ import absolute_import, unicode_literals, division
+import unittest
+import time
+from armet import caches
+
+
+class CacheTestCase(unittest.TestCase):
+
+    def make_cache(self, **kwargs):
+        return caches.MemoryCache(**kwargs)
+
+    def test_get_set(self):
+        cache = self.make_cache()
+        cache.set('x', ([('ETag', '"1"')], b'{}'))
+
+        assert cache.get('x') == ([('ETag', '"1"')], b'{}')
+        assert cache.get('y') is None
+
+    def test_delete(self):
+        cache = self.make_cache()
+        cache.set('x', 1)
+        cache.delete('x')
+        cache.delete('y')
+
+        assert cache.get('x') is None
+
+    def test_timeout(self):
+        cache = self.make_cache(timeout=60)
+        cache.set('x', 1, timeout=0.01)
+        cache.set('y', 2)
+        time.sleep(0.02)
+
+        assert cache.get('x') is None
+        assert cache.get('y') == 2
+
+
+class SharedMemoryCacheTestCase(CacheTestCase):
+
+    def make_cache(self, **kwargs):
+        return caches.SharedMemoryCache(
+            size=64 * 1024, slot_size=1024, **kwargs)
+
+    def test_too_large(self):
+        cache = self.make_cache()
+        cache.set('x', 'small')
+        cache.set('x', 'x' * 2048)
+
+        assert cache.get('x') is None
+
+
+class ClientCacheTestCase(CacheTestCase):
+
+    def make_cache(self, **kwargs):
+        return caches.ClientCache(caches.LocalClient(), **kwargs)
@@ -75,3 +75,8 @@ class URLDeserializerTestCase(DeserializerTestCase):
         self.deserialize(b'x=2&y=51&x=781&y=165')
 
         assert self.data == {"x": ['2', '781'], "y": ['51', '165']}
+
+    def test_encoding(self):
+        self.data = self.deserializer.deserialize(b'x=caf%E9', 'latin1')
+
+        assert self.data == {'x': ['caf\xe9']}
@@ -0,0 +1,103 @@
+# -*- coding: utf-8 -*-
+from __future__ import absolute_import, unicode_literals, division
+import unittest
+from armet import http
+
+
+class Request(http.Request):
+
+    class Headers(http.request.Headers):
+
+        def __init__(self, headers):
+            super(Request.Headers, self).__init__()
+            self._store = headers
+            self.accessed = []
+
+        def __getitem__(self, name):
+            self.accessed.append(name)
+            return self._store[name]
+
+        def __iter__(self):
+            return iter(self._store)
+
+        def __len__(self):
+            return len(self._store)
+
+        def __contains__(self, name):
+            return name in self._store
+
+    def __init__(self, headers, method='GET'):
+        self.headers = self.Headers(headers)
+        super(Request, self).__init__(
+            body=b'', path='/', method=method, asynchronous=False)
+
+
+class Response(http.Response):
+
+    class Headers(dict, http.response.Headers):
+        pass
+
+    def __init__(self, *args, **kwargs):
+        self._status = None
+        super(Response, self).__init__(*args, **kwargs)
+        self.headers = self.Headers({'Content-Type': 'text/plain'})
+
+    @property
+    def status(self):
+        return self._status
+
+    @status.setter
+    def status(self, value):
+        self._status = value
+
+
+class ResponseTestCase(unittest.TestCase):
+
+    def setUp(self):
+        self.response = Response(asynchronous=False)
+
+    def test_send(self):
+        for index in range(3):
+            self.response.send('x{}'.format(index))
+
+        assert self.response.tell() == 6
+        assert self.response.getvalue() == b'x0x1x2'
+
+    def test_writelines(self):
+        self.response.writelines([b'a', 'b', None, ['c', b'd']])
+        self.response.close()
+
+        assert self.response.body == b'abcd'
+        assert self.response.headers['Content-Length'] == 4
+
+
+class RequestTestCase(unittest.TestCase):
+
+    def test_lazy(self):
+        request = Request({'Cookie': 'a=1', 'Content-Type': 'text/plain'})
+
+        assert request.headers.accessed == []
+
+    def test_cookies(self):
+        request = Request({'Cookie': 'a=1; b=2'})
+
+        assert request.cookies['b'].value == '2'
+        assert request.cookies is request.cookies
+
+    def test_method(self):
+        assert Request({}, 'post').method == 'POST'
+
+        request = Request({'X-Http-Method-Override': 'patch'}, 'POST')
+        assert request.method == 'PATCH'
+
+    def test_encoding(self):
+        request = Request({'Content-Type': 'text/plain; charset=utf-16'})
+
+        assert request.encoding == 'utf-16'
+        assert request.encoding == 'utf-16'
+        assert request.headers.accessed.count('Content-Type') == 1
+
+    def test_getlist(self):
+        request = Request({'Accept': 'text/plain,application/json'})
+
+        assert request.getlist('Accept') == ('text/plain', 'application/json')
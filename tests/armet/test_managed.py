@@ -0,0 +1,572 @@
+# -*- coding: utf-8 -*-
+from __future__ import absolute_import, unicode_literals, division
+import io
+import json
+import datetime
+import unittest
+from wsgiref.util import setup_testing_defaults
+from armet import resources, http, caches, authentication
+from armet.connectors.wsgi import Application
+
+
+class PrepareTestCase(unittest.TestCase):
+
+    def setUp(self):
+        super(PrepareTestCase, self).setUp()
+
+        class Resource(resources.ManagedResource):
+            class Meta:
+                abstract = True
+
+            name = resources.Attribute('name')
+
+            count = resources.IntegerAttribute('count')
+
+            label = resources.TextAttribute('name')
+
+            secret = resources.Attribute('secret', include=False)
+
+            computed = resources.Attribute()
+
+            def prepare_computed(self, item, value):
+                return item['count'] * 2
+
+            def clean_name(self, value):
+                return value.upper()
+
+        # Store the resource
+        self.Resource = Resource
+        self.resource = object.__new__(Resource)
+
+    def test_prepare(self):
+        item = {'name': 'x', 'count': 21, 'secret': 's'}
+        data = self.resource.item_prepare(item)
+
+        assert data == {
+            'name': 'x', 'count': 21, 'label': 'x', 'computed': 42}
+
+    def test_prepare_sequence(self):
+        items = [{'name': 'x', 'count': 1}, {'name': 'y', 'count': 2}]
+        data = self.resource.prepare(items)
+
+        assert [x['computed'] for x in data] == [2, 4]
+
+    def test_clean(self):
+        data = self.resource.item_clean({'name': 'x', 'count': ' 5 '})
+
+        assert data == {
+            'name': 'X', 'count': 5, 'label': None, 'computed': None}
+
+    def test_inherited(self):
+        class Derived(self.Resource):
+            class Meta:
+                abstract = True
+
+            extra = resources.Attribute('extra')
+
+        resource = object.__new__(Derived)
+        data = resource.item_prepare({'name': 'x', 'count': 0, 'extra': 1})
+
+        assert data['extra'] == 1
+        assert 'extra' not in self.resource.item_prepare({'count': 0})
+
+    def test_fields(self):
+        self.resource.directives = ['fields=count,computed']
+        fields = self.resource.fields()
+        prepare = self.Resource.field_preparer(fields)
+
+        assert fields == ('count', 'computed')
+        assert prepare(self.resource, {'count': 2}) == {
+            'count': 2, 'computed': 4}
+        assert self.Resource.field_preparer(fields) is prepare
+
+    def test_fields_invalid(self):
+        for directive in ('fields=nope', 'fields=secret'):
+            self.resource.directives = [directive]
+
+            with self.assertRaises(http.exceptions.BadRequest):
+                self.resource.fields()
+
+
+class PaginationTestCase(unittest.TestCase):
+
+    def setUp(self):
+        super(PaginationTestCase, self).setUp()
+
+        class Resource(resources.ManagedResource):
+            class Meta:
+                abstract = True
+                slug = resources.IntegerAttribute('id')
+                page_size = 10
+
+            name = resources.Attribute('user.name')
+
+            computed = resources.Attribute()
+
+        self.resource = object.__new__(Resource)
+
+    def paginate(self, *directives):
+        self.resource.directives = list(directives)
+        return self.resource.pagination()
+
+    def test_directive(self):
+        self.resource.directives = ['x', 'y=1,2']
+
+        assert self.resource.directive('x') == []
+        assert self.resource.directive('y') == ['1', '2']
+        assert self.resource.directive('z', 3) == 3
+
+    def test_default(self):
+        assert self.paginate() == (10, None, None)
+
+    def test_offset(self):
+        assert self.paginate('limit=5', 'offset=20') == (5, 20, None)
+
+    def test_after(self):
+        assert self.paginate('after=42') == (10, None, 42)
+
+    def test_invalid(self):
+        for directives in (['limit=x'], ['limit=-1'], ['offset=1,2'],
+                           ['after=x'], ['offset=1', 'after=2']):
+            with self.assertRaises(http.exceptions.BadRequest):
+                self.paginate(*directives)
+
+    def test_sorting(self):
+        self.resource.directives = ['sort=-name,name']
+        sorting = [(x.path, y) for x, y in self.resource.sorting()]
+
+        assert sorting == [('user.name', True), ('user.name', False)]
+
+    def test_sorting_invalid(self):
+        for directives in (['sort=nope'], ['sort=computed'],
+                           ['sort=name', 'after=1']):
+            self.resource.directives = directives
+
+            with self.assertRaises(http.exceptions.BadRequest):
+                self.resource.pagination()
+                self.resource.sorting()
+
+
+class BulkTestCase(unittest.TestCase):
+
+    def setUp(self):
+        super(BulkTestCase, self).setUp()
+
+        class Resource(resources.ManagedResource):
+            class Meta:
+                abstract = True
+                slug = resources.IntegerAttribute('id')
+
+            key = resources.IntegerAttribute('id')
+
+            name = resources.Attribute('name')
+
+        self.resource = object.__new__(Resource)
+
+    def test_item_slug(self):
+        items = self.resource.clean([{'key': '4', 'name': 'x'}, {'name': 'y'}])
+
+        assert [self.resource.item_slug(x) for x in items] == [4, None]
+
+
+class ConditionalTestCase(unittest.TestCase):
+
+    def test_options(self):
+        class Resource(resources.ManagedResource):
+            class Meta:
+                abstract = True
+                version = 'revision'
+
+        assert Resource.meta.version.path == 'revision'
+        assert Resource.meta.last_modified is None
+        assert Resource.meta.conditional
+
+    def test_default(self):
+        class Resource(resources.ManagedResource):
+            class Meta:
+                abstract = True
+
+        assert not Resource.meta.conditional
+
+
+#! Items read by the resources that are called through an application.
+ITEMS = [
+    {'id': 1, 'name': 'one', 'version': 3,
+     'modified': datetime.datetime(2013, 4, 1, 12)},
+    {'id': 2, 'name': 'two', 'version': 1,
+     'modified': datetime.datetime(2013, 5, 1, 12)},
+]
+
+
+class ItemResource(resources.ManagedResource):
+
+    class Meta:
+        abstract = True
+        connectors = {'http': 'wsgi'}
+
+    #! Number of items that were prepared.
+    prepared = 0
+
+    #! Number of times the items were read.
+    reads = 0
+
+    id = resources.IntegerAttribute('id')
+
+    name = resources.TextAttribute('name')
+
+    def prepare_name(self, item, value):
+        type(self).prepared += 1
+        return value
+
+    def read(self):
+        type(self).reads += 1
+        if self.slug is None:
+            return list(ITEMS)
+
+        for item in ITEMS:
+            if str(item['id']) == self.slug:
+                return item
+
+
+class ApplicationTestCase(unittest.TestCase):
+
+    #! Resources to mount on the application.
+    resources = ()
+
+    def setUp(self):
+        super(ApplicationTestCase, self).setUp()
+
+        self.application = Application()
+        for resource in self.resources:
+            resource.prepared = resource.reads = 0
+            resource.mount('/api/', self.application)
+
+    def call(self, method, path, body=b'', **headers):
+        path, _, query = path.partition('?')
+        environ = {'REQUEST_METHOD': method, 'PATH_INFO': path,
+                   'QUERY_STRING': query, 'wsgi.input': io.BytesIO(body)}
+        if body:
+            environ['CONTENT_TYPE'] = 'application/json'
+            environ['CONTENT_LENGTH'] = str(len(body))
+
+        for name, value in headers.items():
+            environ['HTTP_' + name.upper().replace('-', '_')] = value
+
+        setup_testing_defaults(environ)
+        started = []
+
+        def start_response(status, headers):
+            # Header names are compared case-insensitively.
+            started.append((status, {k.lower(): v for k, v in headers}))
+
+        body = b''.join(self.application(environ, start_response))
+        status, headers = started[0]
+        return int(status.split()[0]), headers, body
+
+
+class VersionedResource(ItemResource):
+
+    class Meta:
+        version = 'version'
+        last_modified = 'modified'
+
+
+class TaggedResource(ItemResource):
+
+    class Meta:
+        conditional = True
+
+
+class RevisionResource(ItemResource):
+
+    class Meta:
+        version = 'revision'
+
+    #! The items that are read; each at the same revision.
+    page = ()
+
+    def read(self):
+        if self.slug is None:
+            return list(self.page)
+
+        for item in self.page:
+            if str(item['id']) == self.slug:
+                return item
+
+
+class ConditionalRequestTestCase(ApplicationTestCase):
+
+    resources = (VersionedResource, TaggedResource, RevisionResource)
+
+    def setUp(self):
+        super(ConditionalRequestTestCase, self).setUp()
+
+        RevisionResource.page = [
+            {'id': x, 'name': str(x), 'revision': 1} for x in (1, 2)]
+
+    def test_version(self):
+        for path in ('/api/versioned/1/', '/api/versioned/'):
+            status, headers, _ = self.call('GET', path)
+            etag = headers['etag']
+
+            assert status == 200
+            assert VersionedResource.prepared
+
+            VersionedResource.prepared = 0
+            status, headers, body = self.call(
+                'GET', path, **{'If-None-Match': etag})
+
+            assert status == 304
+            assert headers['etag'] == etag
+            assert body == b''
+            assert VersionedResource.prepared == 0
+
+    def test_version_mismatch(self):
+        status, _, body = self.call(
+            'GET', '/api/versioned/1/', **{'If-None-Match': '"other"'})
+
+        assert status == 200
+        assert b'one' in body
+
+    def test_version_items(self):
+        # Other items at the same versions are not the same items.
+        etag = self.call('GET', '/api/revision/')[1]['etag']
+        RevisionResource.page = [
+            {'id': x, 'name': str(x), 'revision': 1} for x in (3, 4)]
+        status, headers, _ = self.call(
+            'GET', '/api/revision/', **{'If-None-Match': etag})
+
+        assert status == 200
+        assert headers['etag'] != etag
+
+        etag = self.call('GET', '/api/revision/3/')[1]['etag']
+        status, _, body = self.call(
+            'GET', '/api/revision/4/', **{'If-None-Match': etag})
+
+        assert status == 200
+        assert b'"4"' in body
+
+    def test_last_modified(self):
+        status, headers, _ = self.call('GET', '/api/versioned/2/')
+        modified = headers['last-modified']
+
+        assert modified == 'Wed, 01 May 2013 12:00:00 GMT'
+
+        VersionedResource.prepared = 0
+        status, _, body = self.call(
+            'GET', '/api/versioned/2/', **{'If-Modified-Since': modified})
+
+        assert status == 304
+        assert body == b''
+        assert VersionedResource.prepared == 0
+
+        status, _, _ = self.call(
+            'GET', '/api/versioned/2/',
+            **{'If-Modified-Since': 'Mon, 01 Apr 2013 12:00:00 GMT'})
+
+        assert status == 200
+
+    def test_body(self):
+        # The entity tag is derived from the serialized body.
+        status, headers, body = self.call('GET', '/api/tagged/1/')
+        etag = headers['etag']
+
+        assert status == 200
+        assert headers['content-length'] == str(len(body))
+
+        status, headers, body = self.call(
+            'GET', '/api/tagged/1/', **{'If-None-Match': etag})
+
+        assert status == 304
+        assert headers['etag'] == etag
+        assert body == b''
+
+        status, _, body = self.call(
+            'GET', '/api/tagged/2/', **{'If-None-Match': etag})
+
+        assert status == 200
+        assert b'two' in body
+
+
+class UserAuthentication(authentication.Authentication):
+
+    class User(object):
+
+        def __init__(self, id):
+            self.id = id
+
+    def authenticate(self, resource):
+        # Identify the user by name; anonymous without one.
+        name = resource.request.headers.get('X-User')
+        return self.User(name) if name else None
+
+
+class CachedResource(ItemResource):
+
+    class Meta:
+        authentication = [UserAuthentication()]
+
+    def create(self, data):
+        return data
+
+    def update(self, target, data):
+        pass
+
+    def update_many(self, data):
+        return data
+
+    def destroy(self):
+        pass
+
+    def destroy_many(self):
+        pass
+
+
+class RevisedResource(CachedResource):
+
+    class Meta:
+        # The slug path is not that of an exposed attribute.
+        slug = resources.IntegerAttribute('version')
+
+    def read(self):
+        type(self).reads += 1
+        if self.slug is None:
+            return list(ITEMS)
+
+        for item in ITEMS:
+            if str(item['version']) == self.slug:
+                return item
+
+    def update_many(self, data):
+        # Return the targets (identified by their identifiers).
+        return [x for x in ITEMS if x['id'] in [y['id'] for y in data]]
+
+
+class CacheTestCase(ApplicationTestCase):
+
+    resources = (CachedResource, RevisedResource)
+
+    def setUp(self):
+        super(CacheTestCase, self).setUp()
+
+        CachedResource.meta.cache = caches.MemoryCache()
+        self.addCleanup(setattr, CachedResource.meta, 'cache', None)
+
+    def read(self, path, **headers):
+        # Read the path twice; the second read is answered from the
+        # cache.
+        CachedResource.reads = 0
+        first = self.call('GET', path, **headers)
+        second = self.call('GET', path, **headers)
+
+        assert first[0] == second[0] == 200
+        assert first[2] == second[2]
+
+        return CachedResource.reads
+
+    def test_cached(self):
+        assert self.read('/api/cached/1/') == 1
+        assert self.read('/api/cached/') == 1
+
+        # Nothing is prepared or serialized for a cached response.
+        CachedResource.reads = CachedResource.prepared = 0
+        status, headers, body = self.call('GET', '/api/cached/')
+
+        assert status == 200
+        assert headers['content-type'] == 'application/json'
+        assert headers['content-length'] == str(len(body))
+        assert json.loads(body.decode('utf8')) == [
+            {'id': 1, 'name': 'one'}, {'id': 2, 'name': 'two'}]
+        assert CachedResource.reads == CachedResource.prepared == 0
+
+    def test_key(self):
+        self.read('/api/cached/')
+
+        # Each query, directive, format and scope is cached apart.
+        assert self.read('/api/cached/?id=1') == 1
+        assert self.read('/api/cached:fields=id/') == 1
+        assert self.read('/api/cached/1/') == 1
+        assert self.read('/api/cached/1/', Accept='application/json') == 0
+        assert self.read(
+            '/api/cached/1/', Accept='application/x-www-form-urlencoded') == 1
+        assert self.read('/api/cached/', **{'X-User': 'alice'}) == 1
+        assert self.read('/api/cached/', **{'X-User': 'bob'}) == 1
+        assert self.read('/api/cached/', **{'X-User': 'alice'}) == 0
+
+    def write(self, method, path, body=b''):
+        # Cache the item and the list, write and read them again.
+        self.read('/api/cached/1/')
+        self.read('/api/cached/2/')
+        self.read('/api/cached/')
+
+        status = self.call(method, path, body)[0]
+
+        assert status in (200, 201, 204)
+
+        CachedResource.reads = 0
+        for path in ('/api/cached/1/', '/api/cached/2/', '/api/cached/'):
+            self.call('GET', path)
+
+        return CachedResource.reads
+
+    def test_post(self):
+        # The lists may include the new item.
+        assert self.write('POST', '/api/cached/', b'{"name":"three"}') == 1
+
+    def test_put(self):
+        assert self.write(
+            'PUT', '/api/cached/1/', b'{"id":1,"name":"uno"}') == 2
+
+    def test_put_many(self):
+        assert self.write(
+            'PUT', '/api/cached/', b'[{"id":2,"name":"dos"}]') == 2
+
+    def test_patch(self):
+        assert self.write(
+            'PATCH', '/api/cached/', b'[{"id":2,"name":"dos"}]') == 2
+
+    def test_put_many_slug(self):
+        RevisedResource.meta.cache = CachedResource.meta.cache
+        self.addCleanup(setattr, RevisedResource.meta, 'cache', None)
+
+        # The slug of each target is invalidated; even when it is not
+        # given by the items.
+        self.call('GET', '/api/revised/1/')
+        status = self.call(
+            'PUT', '/api/revised/', b'[{"id":2,"name":"dos"}]')[0]
+
+        assert status == 200
+
+        RevisedResource.reads = 0
+        self.call('GET', '/api/revised/1/')
+
+        assert RevisedResource.reads == 1
+
+    def test_delete(self):
+        assert self.write('DELETE', '/api/cached/1/') == 2
+
+    def test_delete_many(self):
+        # The items destroyed by a query are not known.
+        assert self.write('DELETE', '/api/cached/?id=1') == 3
+
+
+class NotAcceptableTestCase(ApplicationTestCase):
+
+    resources = (VersionedResource,)
+
+    def test_get(self):
+        status, _, body = self.call(
+            'GET', '/api/versioned/1/', Accept='application/xml')
+
+        assert status == 406
+        assert b'application/json' in body
+
+    def test_head(self):
+        _, expected, content = self.call(
+            'GET', '/api/versioned/1/', Accept='application/xml')
+        status, headers, body = self.call(
+            'HEAD', '/api/versioned/1/', Accept='application/xml')
+
+        assert status == 406
+        assert body == b''
+        assert headers['content-length'] == str(len(content))
@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 from __future__ import absolute_import, unicode_literals, division
 import unittest
+import operator
 from armet.query import parser, constants
 
 
@@ -94,3 +95,108 @@ class QueryTestCase(unittest.TestCase):
         assert item.operator == constants.OPERATOR_IEQUAL[0]
         assert item.negated
         assert item.values == ['paradise', 'city']
+
+
+class QueryCacheTestCase(unittest.TestCase):
+
+    def setUp(self):
+        super(QueryCacheTestCase, self).setUp()
+
+        parser.cache_clear()
+
+    def test_hit(self):
+        query = parser.parse('foo=bar')
+
+        assert parser.parse(b'foo=bar') is query
+        assert parser.cache_info() == (1, 1, parser.CACHE_SIZE, 1)
+
+    def test_eviction(self):
+        first = parser.parse('x=0')
+        for index in range(parser.CACHE_SIZE):
+            parser.parse('x={}'.format(index + 1))
+
+        assert parser.cache_info().currsize == parser.CACHE_SIZE
+        assert parser.parse('x=0') is not first
+
+    def test_error(self):
+        with self.assertRaises(ValueError):
+            parser.parse('&foo')
+
+        assert parser.cache_info().currsize == 0
+
+
+class QueryGroupTestCase(unittest.TestCase):
+
+    def parse(self, text):
+        return parser.parse(text)
+
+    def test_group(self):
+        query = self.parse('a=1&(b=2;!c=3)')
+        group = query.segments[1]
+
+        assert isinstance(group, parser.Query)
+        assert not group.negated
+        assert [x.path for x in group.segments] == [['b'], ['c']]
+        assert group.segments[1].negated
+
+    def test_negated_group(self):
+        query = self.parse('!(a=1;b=2)&c=3')
+
+        assert query.segments[0].negated
+        assert query.segments[1].path == ['c']
+
+    def test_nested_group(self):
+        query = self.parse('((a=1))')
+
+        assert query.segments[0].segments[0].segments[0].values == ['1']
+
+    def test_directives(self):
+        item = self.parse('name:asc:ci=bob').segments[0]
+
+        assert item.path == ['name']
+        assert item.directives == ['asc', 'ci']
+        assert item.values == ['bob']
+
+    def test_unbalanced(self):
+        for query in ('(a=1', 'a=1)', '()', '(a=1)b=2', '(a=(1)', 'a=1&)'):
+            self.assertRaises(ValueError, self.parse, query)
+
+    def test_trailing_combinator(self):
+        for query in ('a=1&', 'a=1;'):
+            item, = self.parse(query).segments
+
+            assert item.values == ['1']
+            assert item.combinator is operator.and_
+
+        group, item = self.parse('(a=1&)&b=2').segments
+
+        assert [x.values for x in group.segments] == [['1']]
+        assert item.values == ['2']
+
+    def test_operator_values(self):
+        # Operator characters after the operator begin the values.
+        item = self.parse('a=<1,>2').segments[0]
+
+        assert item.operator == constants.OPERATOR_IEQUAL[0]
+        assert item.values == ['<1', '>2']
+
+        item = self.parse('a!<==3').segments[0]
+
+        assert item.operator == constants.OPERATOR_LTE[0]
+        assert item.negated
+        assert item.values == ['=3']
+
+        self.assertRaises(ValueError, self.parse, 'a=!1')
+
+    def test_no_values(self):
+        for query in ('a=', 'a<=', 'a=1&b>='):
+            self.assertRaises(ValueError, self.parse, query)
+
+    def test_parenthesized_values(self):
+        assert self.parse('a=(1)').segments[0].values == ['(1)']
+        assert self.parse('a=f(x,y').segments[0].values == ['f(x', 'y']
+
+        group = self.parse('(a=f(x)(y);b="c)")&d=2').segments[0]
+
+        assert group.segments[0].values == ['f(x)(y)']
+        assert group.segments[1].values == ['"c)"']
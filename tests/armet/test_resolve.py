@@ -0,0 +1,115 @@
+# -*- coding: utf-8 -*-
+from __future__ import absolute_import, unicode_literals, division
+import re
+import sys
+import unittest
+from armet import resources, http
+from armet.resources.resource.router import Router
+
+
+class RouterTestCase(unittest.TestCase):
+
+    def router(self, *patterns):
+        return Router([(None, re.compile(x)) for x in patterns])
+
+    def test_empty(self):
+        assert self.router().match('/') is None
+
+    def test_first_match(self):
+        router = self.router(r'^/(?P<slug>\d+)', r'^/(?P<name>\w+)')
+
+        _, data, rest = router.match('/42/rest')
+
+        assert data == {'slug': '42'}
+        assert rest == '/rest'
+
+        _, data, rest = router.match('/answer')
+
+        assert data == {'name': 'answer'}
+        assert rest == ''
+
+    def test_reused_names(self):
+        router = self.router(r'^/a/(?P<slug>\w+)$', r'^/b/(?P<slug>\w+)$')
+
+        assert router.expression is not None
+        assert router.match('/b/x')[1] == {'slug': 'x'}
+
+    def test_named_reference(self):
+        router = self.router(r'^/(?P<x>\w)(?P=x)$', r'^/(?P<x>\w+)$')
+
+        assert router.match('/aa')[1] == {'x': 'a'}
+        assert router.match('/ab')[1] == {'x': 'ab'}
+
+    def test_numbered_reference(self):
+        router = self.router(r'^/(\w)\1$', r'^/(?P<x>\w+)$')
+
+        assert router.expression is None
+        assert router.match('/aa')[1] == {}
+        assert router.match('/ab')[1] == {'x': 'ab'}
+
+    def test_inline_flags(self):
+        router = self.router(r'(?i)^/abc$', r'^/(?P<x>\w+)$')
+
+        assert router.expression is None
+        assert router.match('/ABC')[1] == {}
+        assert router.match('/def')[1] == {'x': 'def'}
+
+    @unittest.skipIf(sys.version_info < (3, 6),
+                     'scoped inline flags require python 3.6')
+    def test_scoped_flags(self):
+        router = self.router(r'^/(?i:abc)$', r'^/(?P<x>\d+)$')
+
+        assert router.expression is not None
+        assert router.match('/ABC')[1] == {}
+
+    def test_no_match(self):
+        assert self.router(r'^$').match('/') is None
+
+
+class ResolveTestCase(unittest.TestCase):
+
+    def setUp(self):
+        super(ResolveTestCase, self).setUp()
+
+        class Leaf(resources.Resource):
+            class Meta:
+                abstract = True
+                patterns = [r'^/(?P<leaf>[^/]+)/?$']
+
+        class Branch(resources.Resource):
+            class Meta:
+                abstract = True
+                patterns = [
+                    (None, r'^/?$'),
+                    (Leaf, r'^/(?P<branch>[^/]+)/leaf(?P<path>/.*)$'),
+                ]
+
+        class Root(resources.Resource):
+            class Meta:
+                abstract = True
+                patterns = [
+                    (None, r'^/?$'),
+                    (Branch, r'^/branch'),
+                ]
+
+        self.Leaf = Leaf
+        self.Branch = Branch
+        self.Root = Root
+
+    def test_no_traversal(self):
+        resource, params, path = self.Root.resolve('/')
+
+        assert resource is self.Root
+        assert params == {}
+        assert path == '/'
+
+    def test_traversal(self):
+        resource, params, path = self.Root.resolve('/branch/3/leaf/7/')
+
+        assert resource is self.Leaf
+        assert params == {'branch': '3', 'leaf': '7'}
+        assert path == '/7/'
+
+    def test_not_found(self):
+        with self.assertRaises(http.exceptions.NotFound):
+            self.Root.resolve('/trunk')
@@ -3,7 +3,7 @@ from __future__ import absolute_import, unicode_literals, division
 import unittest
 import json
 import six
-from armet import serializers
+from armet import serializers, resources
 
 
 class SerializerTestCase(unittest.TestCase):
@@ -68,6 +68,23 @@ class JSONSerializerTestCase(SerializerTestCase):
 
         assert self.content == '[0,1,2,3,4,5,6,7,8,9]'
 
+    def test_stream(self):
+        chunks = list(self.serializer.stream(x for x in range(10)))
+
+        assert ''.join(chunks) == '[0,1,2,3,4,5,6,7,8,9]'
+
+    def test_stream_empty(self):
+        assert ''.join(self.serializer.stream(iter([]))) == '[]'
+
+    def test_stream_chunks(self):
+        serializer = self.Serializer()
+        serializer.chunk_size = 16
+        data = [{'x': 'y' * 10}] * 10
+        chunks = list(serializer.stream(iter(data)))
+
+        assert len(chunks) > 1
+        assert json.loads(''.join(chunks)) == data
+
 
 class URLSerializerTestCase(SerializerTestCase):
 
@@ -93,3 +110,37 @@ class URLSerializerTestCase(SerializerTestCase):
         self.serialize([('foo', 'bar'), ('bar', 'baz')])
 
         assert self.content == "foo=bar&bar=baz"
+
+    def test_stream(self):
+        chunks = list(self.serializer.stream(iter([('foo', 'bar')])))
+
+        assert chunks == ['foo=bar']
+
+
+class NegotiationTestCase(unittest.TestCase):
+
+    class Request(dict):
+        pass
+
+    def setUp(self):
+        class Resource(resources.Resource):
+            class Meta:
+                abstract = True
+
+        self.Resource = Resource
+
+    def determine(self, accept):
+        return self.Resource.determine_serializer(
+            self.Request({'Accept': accept}))
+
+    def test_memoized(self):
+        accept = 'text/html, application/json;q=0.5'
+
+        assert self.determine(accept) is serializers.JSONSerializer
+        assert self.determine(accept) is serializers.JSONSerializer
+        assert self.Resource._serializer_cache.info().hits == 1
+
+    def test_not_acceptable(self):
+        assert self.determine('text/html') is None
+        assert self.determine('text/html') is None
+        assert self.Resource._serializer_cache.info().currsize == 1
@@ -0,0 +1,337 @@
+# -*- coding: utf-8 -*-
+from __future__ import absolute_import, unicode_literals, division
+import io
+import unittest
+from wsgiref.util import setup_testing_defaults
+import sqlalchemy as sa
+from sqlalchemy import orm
+from sqlalchemy.ext.declarative import declarative_base
+from armet import resources, authorization
+from armet.connectors.wsgi import http
+from armet.query import parser
+from armet.connectors.sqlalchemy import resources as connector
+
+# Instantiate the declarative base.
+Base = declarative_base()
+
+
+class Poll(Base):
+
+    __tablename__ = 'poll'
+
+    id = sa.Column(sa.Integer, primary_key=True)
+
+    question = sa.Column(sa.String(1024))
+
+    available = sa.Column(sa.Boolean)
+
+
+class Choice(Base):
+
+    __tablename__ = 'choice'
+
+    id = sa.Column(sa.Integer, primary_key=True)
+
+    poll_id = sa.Column(sa.Integer, sa.ForeignKey('poll.id'))
+
+    poll = orm.relationship(Poll, backref='choices')
+
+    choice = sa.Column(sa.String(256))
+
+    votes = sa.Column(sa.Integer)
+
+
+# Instantiate the engine used to access the models.
+engine = sa.create_engine('sqlite:///:memory:')
+
+# Construct the session factory.
+Session = orm.sessionmaker(bind=engine)
+
+
+def setUpModule():
+    # Create the models and add the items.
+    Base.metadata.create_all(engine)
+    session = Session()
+    session.add_all([
+        Poll(id=1, question='Are you an innie or an outie?', available=True),
+        Poll(id=2, question='Have you ever written a song?', available=False),
+        Poll(id=3, question='Can you make change?', available=True),
+        Poll(id=4, question='Have you ever written a poem?', available=None),
+    ])
+    session.add_all([
+        Choice(id=1, poll_id=1, choice='Innie', votes=3),
+        Choice(id=2, poll_id=1, choice='Outie', votes=5),
+        Choice(id=3, poll_id=2, choice='Never', votes=2),
+    ])
+    session.commit()
+
+
+class PollResource(resources.ModelResource):
+
+    class Meta:
+        connectors = {'http': 'wsgi', 'model': 'sqlalchemy'}
+
+        model = Poll
+
+        Session = Session
+
+        eager = ('choices',)
+
+    id = resources.IntegerAttribute('id')
+
+    question = resources.TextAttribute('question')
+
+
+class ChoiceResource(resources.ModelResource):
+
+    class Meta:
+        connectors = {'http': 'wsgi', 'model': 'sqlalchemy'}
+
+        model = Choice
+
+        Session = Session
+
+    id = resources.IntegerAttribute('id')
+
+    choice = resources.TextAttribute('choice')
+
+    votes = resources.IntegerAttribute('votes')
+
+    question = resources.TextAttribute('poll.question')
+
+
+class ClauseTestCase(unittest.TestCase):
+
+    def setUp(self):
+        super(ClauseTestCase, self).setUp()
+
+        connector._clauses.clear()
+
+        self.attributes = {
+            'id': resources.IntegerAttribute('id'),
+            'question': resources.TextAttribute('question'),
+            'available': resources.BooleanAttribute('available'),
+        }
+
+    def compile(self, text):
+        return connector.compile_clause(
+            type(self), parser.parse(text), self.attributes, Poll)
+
+    def select(self, clause, params):
+        query = Session().query(Poll).filter(clause).params(params)
+        return sorted(x.id for x in query)
+
+    def test_reuse(self):
+        clause, params = self.compile(
+            'id=1,2&question=have you ever written a song?')
+        other, other_params = self.compile(
+            'id=3,4&question=CAN YOU MAKE CHANGE?')
+
+        assert other is clause
+        assert connector._clauses.info()[:2] == (1, 1)
+        assert params == {
+            'armet_0': 1, 'armet_1': 2,
+            'armet_2': 'have you ever written a song?'}
+        assert other_params == {
+            'armet_0': 3, 'armet_1': 4, 'armet_2': 'CAN YOU MAKE CHANGE?'}
+
+        assert self.select(clause, params) == [2]
+        assert self.select(clause, other_params) == [3]
+
+    def test_negated(self):
+        clause, params = self.compile('!id=1&available=true')
+        other, other_params = self.compile('!id=3&available=true')
+
+        assert other is clause
+        assert self.select(clause, params) == [3]
+        assert self.select(clause, other_params) == [1]
+
+        # Negation is part of the shape.
+        assert self.compile('id=3&available=true')[0] is not clause
+
+    def test_grouped(self):
+        clause, params = self.compile('!(id=1;id=2)&id<4')
+        other, other_params = self.compile('!(id=2;id=3)&id<5')
+
+        assert other is clause
+        assert self.select(clause, params) == [3]
+        assert self.select(clause, other_params) == [1, 4]
+
+        # Grouping is part of the shape.
+        assert self.compile('!id=1;id=2&id<4')[0] is not clause
+
+    def test_null(self):
+        # Values that do not clean are tested against null directly
+        # rather than being bound; the type of each value is part of
+        # the shape.
+        clause, params = self.compile('id==one')
+
+        assert params == {}
+        assert self.compile('id==1')[0] is not clause
+        assert self.select(clause, params) == []
+
+
+class LoadOptionsTestCase(unittest.TestCase):
+
+    def setUp(self):
+        super(LoadOptionsTestCase, self).setUp()
+
+        connector._loaders.clear()
+
+        #! Statements executed against the database.
+        self.statements = statements = []
+
+        def execute(connection, cursor, statement, *args):
+            statements.append(statement)
+
+        sa.event.listen(engine, 'before_cursor_execute', execute)
+        self.addCleanup(
+            sa.event.remove, engine, 'before_cursor_execute', execute)
+
+    def query(self, resource, fields=None):
+        return Session().query(resource.meta.model).options(
+            *resource.load_options(fields)).order_by('id')
+
+    def test_joined(self):
+        # Scalar relationships are joined into the query.
+        questions = [x.poll.question for x in self.query(ChoiceResource)]
+
+        assert questions == ['Are you an innie or an outie?'] * 2 + [
+            'Have you ever written a song?']
+        assert len(self.statements) == 1
+        assert 'JOIN poll' in self.statements[0]
+
+    def test_selected(self):
+        # Collections are loaded by a second query.
+        choices = [len(x.choices) for x in self.query(PollResource)]
+
+        assert choices == [2, 1, 0, 0]
+        assert len(self.statements) == 2
+
+    def test_fields(self):
+        items = self.query(ChoiceResource, ('votes',)).all()
+
+        assert [x.votes for x in items] == [3, 5, 2]
+        assert len(self.statements) == 1
+        assert 'choice.votes' in self.statements[0]
+        assert 'choice.id' in self.statements[0]
+        assert 'choice.choice' not in self.statements[0]
+        assert 'JOIN' not in self.statements[0]
+
+    def test_cached(self):
+        options = ChoiceResource.load_options(('votes',))
+
+        assert ChoiceResource.load_options(('votes',)) is options
+        assert ChoiceResource.load_options() is not options
+
+
+@unittest.skipIf(authorization.shield is None, 'shield is not installed')
+class ShieldTestCase(unittest.TestCase):
+
+    class User(object):
+        pass
+
+    @classmethod
+    def setUpClass(cls):
+        super(ShieldTestCase, cls).setUpClass()
+
+        shield = authorization.shield
+
+        def available(target, bearer):
+            # Only available polls may be changed; evaluated against a
+            # poll or (as an expression) against the model.
+            return target.available == True  # noqa
+
+        rule = shield.rule('create', 'update', bearer=cls.User, target=Poll)
+        rule(available).expression(available)
+
+        class Resource(PollResource):
+
+            class Meta:
+                authorization = authorization.ShieldAuthorization()
+
+        cls.Resource = Resource
+
+    def setUp(self):
+        super(ShieldTestCase, self).setUp()
+
+        environ = {'REQUEST_METHOD': 'PUT', 'wsgi.input': io.BytesIO()}
+        setup_testing_defaults(environ)
+
+        request = http.Request(environ, path='/', asynchronous=False)
+        request.user = self.user = self.User()
+        self.resource = self.Resource(
+            request, http.Response(asynchronous=False))
+
+        #! Statements executed against the database.
+        self.statements = statements = []
+
+        def execute(connection, cursor, statement, *args):
+            statements.append(statement)
+
+        sa.event.listen(engine, 'before_cursor_execute', execute)
+        self.addCleanup(
+            sa.event.remove, engine, 'before_cursor_execute', execute)
+
+    def authorize(self, operation, items):
+        return self.resource.meta.authorization.authorize_many(
+            self.user, operation, self.resource, items)
+
+    def test_partition(self):
+        items = Session().query(Poll).order_by(Poll.id).all()
+        del self.statements[:]
+
+        allowed, denied = self.authorize('update', items)
+
+        assert [x.id for x in allowed] == [1, 3]
+        assert [x.id for x in denied] == [2, 4]
+        assert len(self.statements) == 1
+
+    def test_create(self):
+        # New items are not stored; each is checked in turn.
+        items = [Poll(available=False), Poll(available=True)]
+
+        allowed, denied = self.authorize('create', items)
+
+        assert allowed == items[1:]
+        assert denied == items[:1]
+        assert self.statements == []
+
+
+class StreamingTestCase(unittest.TestCase):
+
+    class Resource(PollResource):
+
+        class Meta:
+            streaming = True
+
+    def setUp(self):
+        super(StreamingTestCase, self).setUp()
+
+        connector._loaders.clear()
+
+        environ = {'REQUEST_METHOD': 'GET', 'wsgi.input': io.BytesIO()}
+        setup_testing_defaults(environ)
+
+        request = http.Request(environ, path='/', asynchronous=False)
+        request.user = None
+        self.resource = self.Resource(
+            request, http.Response(asynchronous=False))
+        self.resource.slug = None
+
+    def test_batched(self):
+        items = self.resource.read()
+
+        assert isinstance(items, orm.Query)
+        assert [len(x.choices) for x in items] == [2, 1, 0, 0]
+
+    def test_subquery(self):
+        # Collections loaded by a subquery are not fetched in batches.
+        self.addCleanup(
+            setattr, connector, 'SUBQUERY_LOADS', connector.SUBQUERY_LOADS)
+        connector.SUBQUERY_LOADS = True
+
+        items = self.resource.read()
+
+        assert not isinstance(items, orm.Query)
+        assert [len(x.choices) for x in items] == [2, 1, 0, 0]
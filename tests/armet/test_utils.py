@@ -47,3 +47,33 @@ class DasherizeTestCase(unittest.TestCase):
 
     def test_dashed(self):
         assert utils.dasherize('dashed-words') == 'dashed-words'
+
+
+class LRUCacheTestCase(unittest.TestCase):
+
+    def test_get(self):
+        cache = utils.LRUCache(2)
+        cache.set('x', 1)
+
+        assert cache.get('x') == 1
+        assert cache.get('y') is None
+        assert cache.info() == (1, 1, 2, 1)
+
+    def test_eviction(self):
+        cache = utils.LRUCache(2)
+        cache.set('x', 1)
+        cache.set('y', 2)
+        cache.get('x')
+        cache.set('z', 3)
+
+        assert cache.get('y') is None
+        assert cache.get('x') == 1
+        assert len(cache) == 2
+
+    def test_clear(self):
+        cache = utils.LRUCache(2)
+        cache.set('x', 1)
+        cache.get('x')
+        cache.clear()
+
+        assert cache.info() == (0, 0, 2, 0)
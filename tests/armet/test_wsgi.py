@@ -0,0 +1,98 @@
+# -*- coding: utf-8 -*-
+from __future__ import absolute_import, unicode_literals, division
+import io
+import unittest
+from wsgiref.util import setup_testing_defaults
+from armet import resources
+from armet.connectors.wsgi import Application
+
+
+class Resource(resources.Resource):
+
+    class Meta:
+        connectors = {'http': 'wsgi'}
+
+    def get(self, request, response):
+        response['Content-Type'] = 'text/plain'
+        return type(self).__name__
+
+    def head(self, request, response):
+        return self.get(request, response)
+
+
+class DerivedResource(Resource):
+    pass
+
+
+class FurtherDerivedResource(DerivedResource):
+    pass
+
+
+class StreamedResource(Resource):
+
+    #! Number of chunks that were produced.
+    produced = 0
+
+    def get(self, request, response):
+        response['Content-Type'] = 'text/plain'
+        for chunk in ('a', 'b'):
+            type(self).produced += 1
+            yield chunk
+
+
+class ApplicationTestCase(unittest.TestCase):
+
+    def setUp(self):
+        self.application = Application()
+        for resource in (Resource, DerivedResource, FurtherDerivedResource,
+                         StreamedResource):
+            resource.mount('/api/', self.application)
+
+    def call(self, method, path):
+        environ = {'REQUEST_METHOD': method, 'PATH_INFO': path,
+                   'wsgi.input': io.BytesIO()}
+        setup_testing_defaults(environ)
+        started = []
+
+        def start_response(status, headers):
+            started.append((status, dict(headers)))
+
+        body = b''.join(self.application(environ, start_response))
+        status, headers = started[0]
+        return status, headers, body
+
+    def test_get(self):
+        status, _, body = self.call('GET', '/api/resource/')
+
+        assert status == '200 OK'
+        assert body == b'Resource'
+
+    def test_head(self):
+        status, headers, body = self.call('HEAD', '/api/resource/')
+
+        assert status == '200 OK'
+        assert headers['Content-Type'] == 'text/plain'
+        assert body == b''
+
+    def test_head_streamed(self):
+        StreamedResource.produced = 0
+        status, _, body = self.call('HEAD', '/api/streamed/')
+
+        assert status == '200 OK'
+        assert body == b''
+        assert StreamedResource.produced == 2
+
+    def test_subclassed(self):
+        for path, name in (('/api/derived/', b'DerivedResource'),
+                           ('/api/further-derived/',
+                            b'FurtherDerivedResource')):
+            status, _, body = self.call('GET', path)
+
+            assert status == '200 OK'
+            assert body == name
+
+    def test_not_found(self):
+        status, _, body = self.call('GET', '/api/nothing/')
+
+        assert status == '404 Not Found'
+        assert body == b''